@@ -1,5 +1,7 @@
+import asyncio
 import json
 import tempfile
+import threading
 import time
 from pathlib import Path
 from unittest import mock
@@ -7,7 +9,7 @@ from unittest import mock
 import pytest
 from requests import Response
 
-from ytmusicapi.auth.oauth import OAuthToken
+from ytmusicapi.auth.oauth import OAuthToken, RefreshingToken
 from ytmusicapi.auth.types import AuthType
 from ytmusicapi.exceptions import YTMusicUserError
 from ytmusicapi.setup import main
@@ -37,12 +39,12 @@ def fixture_yt_alt_oauth(browser_filepath: str, alt_oauth_credentials: OAuthCred
 
 
 class TestOAuth:
-    @mock.patch("requests.Response.json")
+    @mock.patch("requests.Response.content", new_callable=mock.PropertyMock)
     @mock.patch("requests.Session.post")
-    def test_setup_oauth(self, session_mock, json_mock, blank_code, config):
+    def test_setup_oauth(self, session_mock, content_mock, blank_code, config):
         session_mock.return_value = Response()
         token_code = json.loads(config["auth"]["oauth_token"])
-        json_mock.side_effect = [blank_code, token_code]
+        content_mock.side_effect = [json.dumps(blank_code).encode(), json.dumps(token_code).encode()]
         oauth_file = tempfile.NamedTemporaryFile(delete=False)
         oauth_filepath = oauth_file.name
         with (
@@ -65,7 +67,7 @@ class TestOAuth:
             main()
             assert Path(oauth_filepath).exists()
 
-        json_mock.side_effect = None
+        content_mock.side_effect = None
         with open(oauth_filepath, encoding="utf8") as oauth_file:
             oauth_token = json.loads(oauth_file.read())
 
@@ -131,3 +133,80 @@ class TestOAuth:
 
     def test_alt_oauth_request(self, yt_alt_oauth: YTMusic, sample_video):
         yt_alt_oauth.get_watch_playlist(sample_video)
+
+
+def test_refreshing_token_async():
+    credentials = mock.Mock()
+
+    def refresh_token(refresh_token: str) -> JsonDict:
+        time.sleep(0.05)  # blocking request, run in a thread
+        return {"access_token": f"access_{credentials.refresh_token.call_count}", "expires_in": 3600}
+
+    credentials.refresh_token.side_effect = refresh_token
+    token = RefreshingToken(
+        credentials=credentials,
+        scope="https://www.googleapis.com/auth/youtube",
+        token_type="Bearer",
+        access_token="expired",
+        refresh_token="refresh",
+        expires_at=int(time.time()),
+    )
+
+    async def run() -> None:
+        ticks = 0
+
+        async def tick() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        ticker = asyncio.ensure_future(tick())
+        await asyncio.gather(*(token.prepare_async() for _ in range(200)))
+        assert ticks > 2  # the event loop kept running during the refresh
+        assert token._renewal is not None and not token._renewal.done()
+        token.stop_renewal()
+        ticker.cancel()
+
+    asyncio.run(run())
+    assert credentials.refresh_token.call_count == 1
+    assert token.access_token == "access_1"
+    assert not token.is_expiring
+    assert token.as_dict()["access_token"] == "access_1"
+
+
+def test_refreshing_token_shared_file(tmp_path: Path):
+    token_file = tmp_path / "oauth.json"
+    credentials = mock.Mock()
+
+    def refresh_token(refresh_token: str) -> JsonDict:
+        time.sleep(0.05)
+        return {"access_token": f"access_{credentials.refresh_token.call_count}", "expires_in": 3600}
+
+    credentials.refresh_token.side_effect = refresh_token
+    expired = {
+        "scope": "https://www.googleapis.com/auth/youtube",
+        "token_type": "Bearer",
+        "access_token": "expired",
+        "refresh_token": "refresh",
+        "expires_at": int(time.time()),
+        "expires_in": 0,
+    }
+    token_file.write_text(json.dumps(expired))
+    # one token per worker process, each with its own in-memory state
+    tokens = [RefreshingToken(credentials=credentials, _local_cache=token_file, **expired) for _ in range(8)]
+    threads = [threading.Thread(target=lambda token=token: token.access_token) for token in tokens]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert credentials.refresh_token.call_count == 1
+    assert {token.access_token for token in tokens} == {"access_1"}
+    assert json.loads(token_file.read_text())["access_token"] == "access_1"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["oauth.json", "oauth.json.lock"]
+
+    with mock.patch("os.fsync", side_effect=OSError("disk full")), pytest.raises(OSError):
+        tokens[0].store_token()
+    assert json.loads(token_file.read_text())["access_token"] == "access_1"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["oauth.json", "oauth.json.lock"]
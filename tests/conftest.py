@@ -1,10 +1,20 @@
+import asyncio
 import configparser
+import copy
+import threading
+from collections.abc import Callable, Iterator
 from pathlib import Path
+from typing import Any
+from unittest import mock
 
 import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 
 from ytmusicapi import YTMusic
 from ytmusicapi.auth.oauth import OAuthCredentials
+from ytmusicapi.continuations import get_continuation_string
+from ytmusicapi.type_alias import JsonDict
 
 
 def get_resource(file: str) -> str:
@@ -12,6 +22,27 @@ def get_resource(file: str) -> str:
     return data_dir.joinpath(file).as_posix()
 
 
+def make_shelf(items: list[Any], continuation: str | None = None, key: str = "contents") -> JsonDict:
+    """shelf or grid of a response, with a token for the next continuation page if there is one"""
+    shelf: JsonDict = {key: items}
+    if continuation:
+        shelf["continuations"] = [{"nextContinuationData": {"continuation": continuation}}]
+    return shelf
+
+
+def serve_pages(pages: dict[str, JsonDict]) -> Callable[..., JsonDict]:
+    """
+    Replacement of ``YTMusic._send_request`` returning a copy of ``pages[""]`` for the first request
+    and ``pages[token]`` for the continuation request with the token.
+    """
+    responses = {(get_continuation_string(token) if token else ""): page for token, page in pages.items()}
+
+    def send_request(endpoint: str, body: JsonDict, additionalParams: str = "", **kwargs: Any) -> JsonDict:
+        return copy.deepcopy(responses[additionalParams])
+
+    return send_request
+
+
 def get_config() -> configparser.RawConfigParser:
     config = configparser.RawConfigParser()
     config.read(get_resource("test.cfg"), "utf-8")
@@ -72,3 +103,57 @@ def fixture_yt_brand(config) -> YTMusic:
 @pytest.fixture(name="yt_empty")
 def fixture_yt_empty(config) -> YTMusic:
     return YTMusic(config["auth"]["headers_empty"], config["auth"]["brand_account_empty"])
+
+
+class ApiServer:
+    """aiohttp server standing in for YouTube Music, running in an event loop of its own"""
+
+    def __init__(self) -> None:
+        self.app = web.Application()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._server: TestServer | None = None
+        self._patches: list[Any] = []
+
+    def serve(self, *routes: web.AbstractRouteDef) -> str:
+        """
+        Starts serving ``routes`` and sends all requests of :py:class:`YTMusic` to the server
+        until the end of the test: page requests to ``/``, API requests to ``/<endpoint>``.
+        The server outlives the event loops of ``asyncio.run`` calls in the test.
+        """
+        self.app.add_routes(routes)
+        self._thread.start()
+        self._server = TestServer(self.app)
+        asyncio.run_coroutine_threadsafe(self._server.start_server(), self._loop).result()
+        url = str(self._server.make_url("")).rstrip("/")
+        self._patches = [
+            mock.patch("ytmusicapi.ytmusic.YTM_DOMAIN", url),
+            mock.patch("ytmusicapi.ytmusic.YTM_BASE_API", url + "/"),
+        ]
+        for patch in self._patches:
+            patch.start()
+        return url
+
+    def client(self, **kwargs: Any) -> YTMusic:
+        """Unauthenticated instance sending API requests without fetching a visitor id first"""
+        yt = YTMusic(**kwargs)
+        yt.__dict__["base_headers"] = {}
+        yt.__dict__["_identity"] = ""
+        return yt
+
+    def close(self) -> None:
+        for patch in self._patches:
+            patch.stop()
+        if self._server is not None:
+            asyncio.run_coroutine_threadsafe(self._server.close(), self._loop).result()
+        if self._thread.is_alive():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+        self._loop.close()
+
+
+@pytest.fixture(name="api_server")
+def fixture_api_server() -> Iterator[ApiServer]:
+    server = ApiServer()
+    yield server
+    server.close()
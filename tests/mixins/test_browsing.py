@@ -1,3 +1,4 @@
+import asyncio
 import json
 import warnings
 from pathlib import Path
@@ -5,8 +6,11 @@ from unittest import mock
 
 import pytest
 
+from tests.conftest import make_shelf, serve_pages
 from tests.test_helpers import is_ci
-from ytmusicapi.models.lyrics import LyricLine
+from ytmusicapi.exceptions import YTMusicServerError
+from ytmusicapi.models.lyrics import LyricLine, Lyrics
+from ytmusicapi.type_alias import JsonDict
 
 
 class TestBrowsing:
@@ -60,6 +64,30 @@ class TestBrowsing:
         with pytest.raises(ValueError, match="Invalid order"):
             yt.get_artist_albums(artist["albums"]["browseId"], artist["albums"]["params"], order="order")
 
+    def test_iter_artist_albums(self, yt):
+        grid = {"gridRenderer": make_shelf([1, 2], "page2", key="items")}
+        pages = {
+            "": {
+                "contents": {
+                    "singleColumnBrowseResultsRenderer": {
+                        "tabs": [{"tabRenderer": {"content": {"sectionListRenderer": {"contents": [grid]}}}}]
+                    }
+                }
+            },
+            "page2": {"continuationContents": {"gridContinuation": make_shelf([3, 4], key="items")}},
+        }
+        with (
+            mock.patch.object(yt, "_send_request", side_effect=serve_pages(pages)) as send_mock,
+            mock.patch("ytmusicapi.mixins.browsing.parse_albums", list),
+        ):
+            albums = yt.iter_artist_albums("MPADUCAeLFBCQS7FvI8PvBrWvSBg", "params")
+            send_mock.assert_not_called()
+            assert [next(albums), next(albums)] == [1, 2]
+            assert send_mock.call_count == 1  # the next page is requested when it is consumed
+            assert list(albums) == [3, 4]
+            assert yt.get_artist_albums("MPADUCAeLFBCQS7FvI8PvBrWvSBg", "params", limit=2) == [1, 2]
+            assert send_mock.call_count == 3
+
     def test_get_user(self, yt):
         results = yt.get_user("UC44hbeRoCZVVMVg5z0FfIww")
         assert len(results) == 3
@@ -169,6 +197,66 @@ class TestBrowsing:
         if not is_ci():  # skip assert on GitHub CI because it doesn't work for some reason
             assert len(song["streamingData"]["adaptiveFormats"]) >= 10
 
+    def test_aiter_songs(self, yt):
+        in_flight = []
+
+        async def send_request(endpoint: str, body: JsonDict, proxy: str | None = None) -> JsonDict:
+            in_flight.append(body["video_id"])
+            await asyncio.sleep(0.01 if body["video_id"] == "slow" else 0)
+            assert len(in_flight) <= 2
+            in_flight.remove(body["video_id"])
+            if body["video_id"] == "private":
+                raise YTMusicServerError("Server returned HTTP 403: Forbidden.")
+            timestamp = body["playbackContext"]["contentPlaybackContext"]["signatureTimestamp"]
+            return {"videoDetails": {"videoId": body["video_id"]}, "timestamp": timestamp}
+
+        async def run() -> list[tuple[str, JsonDict | Exception]]:
+            videoIds = ["slow", "a", "private", "a", "b", "slow"]
+            return [item async for item in yt.aiter_songs(videoIds, signatureTimestamp=20000, concurrency=2)]
+
+        with mock.patch.object(yt, "_send_request_async", send_request):
+            results = asyncio.run(run())
+
+        assert [videoId for videoId, _ in results] == ["a", "private", "b", "slow"]
+        assert isinstance(results[1][1], YTMusicServerError)
+        assert results[0][1] == {"videoDetails": {"videoId": "a"}}
+        with mock.patch.object(yt, "_send_request_async", send_request):
+            songs = asyncio.run(yt.get_songs(["a", "b"], signatureTimestamp=20000))
+        assert list(songs) == ["a", "b"]
+
+    def test_get_lyrics_many(self, yt):
+        lyrics_response = {
+            "contents": {
+                "sectionListRenderer": {
+                    "contents": [
+                        {
+                            "musicDescriptionShelfRenderer": {
+                                "description": {"runs": [{"text": "la la la"}]},
+                            }
+                        }
+                    ]
+                }
+            }
+        }
+        requests_sent = []
+
+        async def send_request(endpoint: str, body: JsonDict, proxy: str | None = None) -> JsonDict:
+            requests_sent.append(body["browseId"])
+            if body["browseId"] == "MPLYt_error":
+                raise YTMusicServerError("Server returned HTTP 500: Internal Server Error.")
+            return lyrics_response if body["browseId"] == "MPLYt_lyrics" else {"contents": {}}
+
+        browseIds = ["MPLYt_lyrics", "MPLYt_none", "MPLYt_error", "MPLYt_none"]
+        with mock.patch.object(yt, "_send_request_async", send_request):
+            results = asyncio.run(yt.get_lyrics_many(browseIds))
+            assert asyncio.run(yt.get_lyrics_many(browseIds[1:2])) == {"MPLYt_none": None}
+            assert asyncio.run(yt.get_lyrics_many(browseIds[1:2], negative_ttl=0)) == {"MPLYt_none": None}
+
+        assert results["MPLYt_lyrics"] == Lyrics(lyrics="la la la", source=None, hasTimestamps=False)
+        assert results["MPLYt_none"] is None
+        assert isinstance(results["MPLYt_error"], YTMusicServerError)
+        assert sorted(requests_sent) == ["MPLYt_error", "MPLYt_lyrics", "MPLYt_none"]
+
     def test_get_song_related_content(self, yt_oauth, sample_video):
         song = yt_oauth.get_watch_playlist(sample_video)
         song = yt_oauth.get_song_related(song["related"])
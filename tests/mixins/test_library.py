@@ -1,7 +1,9 @@
+from unittest import mock
 from urllib.parse import urlparse
 
 import pytest
 
+from tests.conftest import make_shelf, serve_pages
 from ytmusicapi.exceptions import YTMusicUserError
 
 
@@ -32,6 +34,34 @@ class TestLibrary:
         with pytest.raises(Exception):
             yt.get_library_albums(100, order="invalid")
 
+    def test_iter_library_songs(self, yt):
+        shelf = {"musicShelfRenderer": make_shelf(["random mix", 1, 2], "page2")}
+        first_page = {
+            "contents": {
+                "singleColumnBrowseResultsRenderer": {
+                    "tabs": [{"tabRenderer": {"content": {"sectionListRenderer": {"contents": [shelf]}}}}]
+                }
+            }
+        }
+        pages = {
+            "": first_page,
+            "page2": {"continuationContents": {"musicShelfContinuation": make_shelf([3, 4])}},
+        }
+        with (
+            mock.patch.object(yt, "_check_auth"),
+            mock.patch.object(yt, "_send_request", side_effect=serve_pages(pages)) as send_mock,
+            mock.patch("ytmusicapi.parsers.library.parse_playlist_items", list),
+            mock.patch("ytmusicapi.mixins.library.parse_playlist_items", list),
+        ):
+            songs = yt.iter_library_songs()
+            send_mock.assert_not_called()
+            assert [next(songs), next(songs)] == [1, 2]
+            assert send_mock.call_count == 1  # the next page is requested when it is consumed
+            assert list(songs) == [3, 4]
+            assert send_mock.call_count == 2
+            assert yt.get_library_songs(2) == [1, 2]
+            assert yt.get_library_songs(10) == [1, 2, 3, 4]
+
     def test_get_library_albums(self, yt_oauth, yt_brand, yt_empty):
         albums = yt_oauth.get_library_albums(100)
         assert len(albums) > 50
@@ -48,6 +48,25 @@ class TestPlaylists:
                 if track["videoType"] == "MUSIC_VIDEO_TYPE_ATV":
                     assert isinstance(track["album"]["name"], str) and track["album"]["name"]
 
+    @pytest.mark.parametrize(
+        "test_file, playlist_id",
+        [
+            ("2024_03_get_playlist_public.json", "RDCLAK5uy_lWy02cQBnTVTlwuRauaGKeUDH3L6PXNxI"),
+            ("2024_12_get_playlist_audio.json", "OLAK5uy_n0x1TMX8DL2eli2g_LysCSg-6Nq5YQa1g"),
+        ],
+    )
+    def test_iter_playlist_tracks(self, yt, test_file, playlist_id):
+        data_dir = Path(__file__).parent.parent / "data"
+        with open(data_dir / test_file, encoding="utf8") as f:
+            mock_response = json.load(f)
+
+        with mock.patch("ytmusicapi.YTMusic._send_request", return_value=mock_response) as send_mock:
+            tracks = yt.iter_playlist_tracks(playlist_id)
+            send_mock.assert_not_called()
+            first_track = next(tracks)
+            assert send_mock.call_count == 1
+            assert [first_track, *tracks] == yt.get_playlist(playlist_id, limit=None)["tracks"]
+
     @pytest.mark.parametrize(
         "playlist_id, tracks_len, related_len",
         [
@@ -1,3 +1,8 @@
+from unittest import mock
+
+from tests.conftest import make_shelf, serve_pages
+
+
 class TestPodcasts:
     def test_get_channel(self, config, yt):
         podcast_id = config["podcasts"]["channel_id"]
@@ -23,6 +28,32 @@ class TestPodcasts:
         assert len(podcast["episodes"]) > 100
         assert podcast["saved"]
 
+    def test_iter_podcast_episodes(self, yt):
+        shelf = {"musicShelfRenderer": make_shelf([1, 2], "page2")}
+        pages = {
+            "": {
+                "contents": {
+                    "twoColumnBrowseResultsRenderer": {
+                        "secondaryContents": {"sectionListRenderer": {"contents": [shelf]}}
+                    }
+                }
+            },
+            "page2": {"continuationContents": {"musicShelfContinuation": make_shelf([3, 4], "page3")}},
+            "page3": {"continuationContents": {"musicShelfContinuation": make_shelf([5])}},
+        }
+        with (
+            mock.patch.object(yt, "_send_request", side_effect=serve_pages(pages)) as send_mock,
+            mock.patch(
+                "ytmusicapi.mixins.podcasts.parse_content_list", lambda contents, *args: list(contents)
+            ),
+        ):
+            episodes = yt.iter_podcast_episodes("PLxq_lXOUlvQDUNyoBYLkN8aVt5yAwEtG9")
+            assert [next(episodes) for _ in range(3)] == [1, 2, 3]
+            assert send_mock.call_count == 2  # the next page is requested when it is consumed
+            assert list(episodes) == [4, 5]
+            assert send_mock.call_count == 3
+            assert send_mock.call_args.args[1] == {"browseId": "MPSPPLxq_lXOUlvQDUNyoBYLkN8aVt5yAwEtG9"}
+
     def test_many_podcasts(self, yt):
         results = yt.search("podcast", filter="podcasts")
         for result in results:
@@ -1,9 +1,12 @@
+import asyncio
 from typing import Any
+from unittest import mock
 
 import pytest
 
+from tests.conftest import make_shelf, serve_pages
 from ytmusicapi import YTMusic
-from ytmusicapi.exceptions import YTMusicUserError
+from ytmusicapi.exceptions import YTMusicServerError, YTMusicUserError
 from ytmusicapi.parsers.search import ALL_RESULT_TYPES, API_RESULT_TYPES
 
 
@@ -117,6 +120,70 @@ class TestSearch:
         assert results[0]["playlistId"].startswith("PL")
         assert len(results[0]["author"]) > 0
 
+    def test_search_many(self, yt):
+        searched = []
+
+        async def search(query: str, *args: Any) -> list[dict[str, Any]]:
+            searched.append(query)
+            if query == "fail":
+                raise YTMusicServerError("Server returned HTTP 500: Internal Server Error.")
+            return [{"videoId": "shared", "title": query}, {"videoId": query}, {"title": "no id"}]
+
+        blur = "\uff22lur"  # fullwidth B
+        queries = ["Oasis  Wonderwall", "oasis wonderwall", blur, "fail"]
+        with mock.patch.object(yt, "search", search):
+            results = asyncio.run(yt.search_many(queries, filter="songs", concurrency=2))
+            merged = asyncio.run(yt.search_many(queries, merge=True))
+
+        assert sorted(searched[:3]) == ["blur", "fail", "oasis wonderwall"]
+        assert list(results) == queries
+        assert results["Oasis  Wonderwall"] == results["oasis wonderwall"]
+        assert isinstance(results["fail"], YTMusicServerError)
+        assert results[blur][1] == {"videoId": "blur"}
+        assert "queries" not in results[blur][0]
+
+        assert isinstance(merged["fail"], YTMusicServerError)
+        shared = merged[blur][0]
+        assert shared is merged["oasis wonderwall"][0]
+        assert shared["queries"] == queries[:3]
+        assert merged[blur][1]["queries"] == [blur]
+        assert merged[blur][2] == {"title": "no id"}
+
+    def test_aiter_search(self, yt):
+        shelf = {"musicShelfRenderer": make_shelf([1, 2], "page2")}
+        pages = {
+            "": {
+                "contents": {
+                    "tabbedSearchResultsRenderer": {
+                        "tabs": [{"tabRenderer": {"content": {"sectionListRenderer": {"contents": [shelf]}}}}]
+                    }
+                }
+            },
+            "page2": {"continuationContents": {"musicShelfContinuation": make_shelf([3, 4])}},
+        }
+        send_page = serve_pages(pages)
+        requests_sent = []
+
+        async def send_request(*args: Any, **kwargs: Any) -> dict[str, Any]:
+            requests_sent.append(args)
+            return send_page(*args, **kwargs)
+
+        async def run() -> list[Any]:
+            results = yt.aiter_search("Oasis", filter="songs")
+            first = [await anext(results), await anext(results)]
+            assert len(requests_sent) == 1  # the next page is requested when it is consumed
+            return first + [result async for result in results]
+
+        with (
+            mock.patch.object(yt, "_send_request_async", send_request),
+            mock.patch(
+                "ytmusicapi.mixins.search.parse_search_results", lambda contents, *args: list(contents)
+            ),
+        ):
+            assert asyncio.run(run()) == [1, 2, 3, 4]
+        assert len(requests_sent) == 2
+        assert requests_sent[1][1]["params"] == requests_sent[0][1]["params"]  # filtered continuation
+
     def test_search_uploads(self, config, yt, yt_oauth):
         with pytest.raises(Exception, match="No filter can be set when searching uploads"):
             yt.search(
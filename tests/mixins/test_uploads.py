@@ -6,7 +6,7 @@ from unittest import mock
 
 import pytest
 
-from tests.conftest import get_resource
+from tests.conftest import get_resource, make_shelf, serve_pages
 from ytmusicapi.enums import ResponseStatus
 from ytmusicapi.exceptions import YTMusicUserError
 from ytmusicapi.ytmusic import YTMusic
@@ -20,6 +20,32 @@ class TestUploads:
         results = yt_empty.get_library_upload_songs(100)
         assert len(results) == 0
 
+    def test_iter_library_upload_songs(self, yt):
+        shelf = {"musicShelfRenderer": make_shelf(["random mix", 1, 2], "page2")}
+        first_page = {
+            "contents": {
+                "singleColumnBrowseResultsRenderer": {
+                    "tabs": [{"tabRenderer": {"content": {"sectionListRenderer": {"contents": [shelf]}}}}]
+                }
+            }
+        }
+        pages = {
+            "": first_page,
+            "page2": {"continuationContents": {"musicShelfContinuation": make_shelf([3, 4])}},
+        }
+        with (
+            mock.patch.object(yt, "_check_auth"),
+            mock.patch.object(yt, "_send_request", side_effect=serve_pages(pages)) as send_mock,
+            mock.patch("ytmusicapi.mixins.uploads.parse_uploaded_items", list),
+        ):
+            songs = yt.iter_library_upload_songs(order="a_to_z")
+            assert [next(songs), next(songs)] == [1, 2]
+            assert send_mock.call_count == 1  # the next page is requested when it is consumed
+            assert list(songs) == [3, 4]
+            assert send_mock.call_args.args[1]["params"]  # the order applies to all pages
+            assert yt.get_library_upload_songs(2) == [1, 2]
+            assert yt.get_library_upload_songs(None) == [1, 2, 3, 4]
+
     def test_get_library_upload_albums(self, config, yt_oauth, yt_empty):
         results = yt_oauth.get_library_upload_albums(50, order="a_to_z")
         assert len(results) > 40
@@ -1,5 +1,12 @@
+import asyncio
+import gc
+from unittest import mock
+
 import pytest
 
+from ytmusicapi.continuations import get_continuation_string
+from ytmusicapi.type_alias import JsonDict
+
 
 class TestWatch:
     def test_get_watch_playlist(self, config, yt, yt_brand, yt_oauth):
@@ -21,3 +28,80 @@ class TestWatch:
     def test_get_watch_playlist_errors(self, config, yt):
         with pytest.raises(Exception, match="No content returned by the server"):
             yt.get_watch_playlist(playlistId="PL_NOT_EXIST")
+
+    def test_aiter_watch_playlist_prefetch(self, yt):
+        def page(index: int, last: int) -> JsonDict:
+            panel: JsonDict = {"contents": [{"track": f"{index}-{i}"} for i in range(3)]}
+            if index < last:
+                panel["continuations"] = [{"nextRadioContinuationData": {"continuation": str(index + 1)}}]
+            return panel
+
+        first_response = {
+            "contents": {
+                "singleColumnMusicWatchNextResultsRenderer": {
+                    "tabbedRenderer": {
+                        "watchNextTabbedResultsRenderer": {
+                            "tabs": [
+                                {
+                                    "tabRenderer": {
+                                        "content": {
+                                            "musicQueueRenderer": {
+                                                "content": {"playlistPanelRenderer": page(0, 2)}
+                                            }
+                                        }
+                                    }
+                                }
+                            ]
+                        }
+                    }
+                }
+            }
+        }
+        responses = [
+            first_response,
+            {"continuationContents": {"playlistPanelContinuation": page(1, 2)}},
+            {"continuationContents": {"playlistPanelContinuation": page(2, 2)}},
+        ]
+
+        async def consume() -> list[tuple[str, int]]:
+            consumed = []
+            async for track in yt.aiter_watch_playlist("hpSrLjc5SMs", radio=True, low_water_mark=1):
+                await asyncio.sleep(0)  # let the prefetch task run
+                consumed.append((track["track"], send_mock.await_count))
+            return consumed
+
+        with (
+            mock.patch("ytmusicapi.YTMusic._send_request_async", side_effect=responses) as send_mock,
+            mock.patch("ytmusicapi.mixins.watch.parse_watch_playlist", side_effect=lambda contents: contents),
+        ):
+            consumed = asyncio.run(consume())
+
+        assert [track for track, _ in consumed] == [f"{i}-{j}" for i in range(3) for j in range(3)]
+        # the next page is requested while the second to last track of a page is consumed
+        assert [count for _, count in consumed] == [1, 2, 2, 2, 3, 3, 3, 3, 3]
+        assert send_mock.call_args_list[1].args[2] == get_continuation_string("1")
+
+        async def consume_first() -> None:
+            tracks = yt.aiter_watch_playlist("hpSrLjc5SMs", radio=True, low_water_mark=3)
+            await anext(tracks)
+            await asyncio.sleep(0.01)  # the prefetch fails in the meantime
+            await tracks.aclose()
+
+        def exception_handler(loop: asyncio.AbstractEventLoop, context: JsonDict) -> None:
+            unhandled.append(context)
+
+        async def run() -> None:
+            asyncio.get_running_loop().set_exception_handler(exception_handler)
+            await consume_first()
+            gc.collect()
+
+        unhandled: list[JsonDict] = []
+        with (
+            mock.patch(
+                "ytmusicapi.YTMusic._send_request_async",
+                side_effect=[first_response, ConnectionError("failed")],
+            ),
+            mock.patch("ytmusicapi.mixins.watch.parse_watch_playlist", side_effect=lambda contents: contents),
+        ):
+            asyncio.run(run())
+        assert unhandled == []  # a failed prefetch is not reported once the consumer stopped
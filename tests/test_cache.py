@@ -0,0 +1,131 @@
+import asyncio
+import threading
+import time
+from unittest import mock
+
+import orjson
+from requests import Response
+
+from ytmusicapi import MemoryCache, SQLiteCache, TieredCache, YTMusic
+
+
+def test_memory_cache_ttls():
+    cache = MemoryCache(ttls={"browse/FEmusic_home": 0, "browse/MPREb_x": 1})
+    assert cache.get_ttl("browse", {"browseId": "MPREb_4pL8gzRtw1p"}) == 6 * 3600
+    assert cache.get_ttl("browse", {"browseId": "MPREb_xyz"}) == 1
+    assert cache.get_ttl("browse", {"browseId": "FEmusic_home"}) is None
+    assert cache.get_ttl("browse", {"browseId": "FEmusic_liked_playlists"}) is None
+    assert cache.get_ttl("player", {"videoId": "ZrOKjDZOtkA"}) == 3600
+    assert cache.get_ttl("next", {"videoId": "ZrOKjDZOtkA"}) is None
+
+
+def test_memory_cache_eviction():
+    cache = MemoryCache(max_entries=2, max_bytes=10)
+    cache.set("a", b"1234", 60)
+    cache.set("b", b"1234", 60)
+    assert cache.get("a") == b"1234"
+    cache.set("c", b"1234", 60)  # evicts b, the least recently used
+    assert cache.get("b") is None
+    cache.set("d", b"123456", 60)  # evicts a to stay within max_bytes
+    assert cache.get("a") is None
+    assert cache.stats == {"hits": 1, "misses": 2, "entries": 2, "bytes": 10}
+
+    cache.set("e", b"12345678901", 60)  # larger than the cache
+    assert cache.get("e") is None
+    cache.set("c", b"1", -1)
+    assert cache.get("c") is None
+    assert len(cache) == 1
+
+
+def test_sqlite_cache(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    writer, reader = SQLiteCache(path), SQLiteCache(path)  # e.g. two worker processes
+    writer.set("a", b"album" * 100, 60)
+    writer.set("b", b"expired", -1)
+    assert reader.get("a") == b"album" * 100
+    assert reader.get("b") is None
+    assert reader.stats == {"hits": 1, "misses": 1, "entries": 2}
+    reader.purge()
+    assert len(writer) == 1
+
+    writer.close()
+    assert SQLiteCache(path).get("a") == b"album" * 100
+
+
+def test_sqlite_cache_purge(tmp_path):
+    cache = SQLiteCache(tmp_path / "cache.sqlite", compression_level=0, max_entries=3, purge_interval=10)
+    with mock.patch("time.monotonic", return_value=1000.0) as monotonic:
+        cache.purge()
+        for key, ttl in zip("abcde", [-1, 50, 40, 30, 20]):
+            cache.set(key, key.encode() * 100, ttl)
+        assert len(cache) == 5  # until the next purge
+        monotonic.return_value = 1010.0
+        cache.set("f", b"f" * 100, 10)
+        assert cache._purge_thread is not None
+        cache._purge_thread.join()  # purged in the background
+    assert len(cache) == 3
+    assert [cache.get(key) is not None for key in "abcdef"] == [False, True, True, True, False, False]
+
+    cache.max_bytes = 250  # the responses expiring first are deleted
+    cache.purge()
+    assert [cache.get(key) is not None for key in "bcd"] == [True, True, False]
+    cache.set("g", b"g" * 1000, 60)  # larger than the cache
+    assert cache.get("g") is None
+
+
+def test_tiered_cache(tmp_path):
+    SQLiteCache(tmp_path / "cache.sqlite").set("a", b"album", 60)
+    cache = TieredCache(MemoryCache(), SQLiteCache(tmp_path / "cache.sqlite"))
+    assert cache.get("a") == b"album"
+    assert cache.get("a") == b"album"
+    assert cache.stats == {"hits": 2, "misses": 0, "l2_hits": 1}
+    assert isinstance(cache.l1, MemoryCache)
+    assert len(cache.l1) == 1
+
+    cache.set("b", b"artist", 60)
+    assert cache.l2.get("b") == b"artist"
+
+
+def test_tiered_cache_async(tmp_path):
+    sqlite = SQLiteCache(tmp_path / "cache.sqlite")
+    cache = TieredCache(MemoryCache(), sqlite)
+    sqlite.set("a", b"album", 60)
+    threads = []
+    load = sqlite._load
+
+    def record_thread(key: str) -> tuple[float, bytes] | None:
+        threads.append(threading.get_ident())
+        return load(key)
+
+    async def run() -> list[bytes | None]:
+        await cache.aset("b", b"artist", 60)
+        return [await cache.aget(key) for key in ["a", "a", "b", "c"]]
+
+    with mock.patch.object(sqlite, "_load", record_thread):
+        assert asyncio.run(run()) == [b"album", b"album", b"artist", None]
+    assert cache.stats == {"hits": 3, "misses": 1, "l2_hits": 1}
+    assert len(threads) == 2  # only the first lookup of "a" and the missing "c" reach the database
+    assert threading.get_ident() not in threads  # outside of the event loop
+
+
+def test_ytmusic_cache():
+    album = {"contents": {"title": "album"}}
+    response = Response()
+    response.status_code = 200
+    response._content = orjson.dumps(album)
+    yt = YTMusic(cache=MemoryCache())
+    yt.__dict__["base_headers"] = {}  # skip the visitor id request
+    with mock.patch("requests.Session.post", return_value=response) as post:
+        for _ in range(2):
+            assert yt._send_request("browse", {"browseId": "MPREb_4pL8gzRtw1p"}) == album
+        assert yt._send_request("browse", {"browseId": "MPREb_4pL8gzRtw1p"}, "&ctoken=x") == album
+        with yt.client_context(hl="de"):
+            yt._send_request("browse", {"browseId": "MPREb_4pL8gzRtw1p"})
+        yt._send_request("browse", {"browseId": "FEmusic_liked_playlists"})
+        yt._send_request("browse", {"browseId": "FEmusic_liked_playlists"})
+
+    assert post.call_count == 5
+    assert yt.cache is not None
+    assert yt.cache.stats["hits"] == 1
+    assert yt.cache.stats["misses"] == 3
+    assert time.time() < min(expires_at for expires_at, _ in yt.cache._entries.values())  # type: ignore[attr-defined]
@@ -0,0 +1,81 @@
+import asyncio
+from unittest import mock
+
+from aiohttp import web
+
+from ytmusicapi import AdaptiveConcurrencyLimiter, RetryPolicy
+
+
+def test_limiter_aimd():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=8, max_latency=1)
+
+    async def run() -> None:
+        for _ in range(6):
+            await limiter.acquire()
+            limiter.release(0.1)
+        assert limiter.limit == 8  # slow start up to max_limit
+
+        await limiter.acquire()
+        limiter.release(0.1, overloaded=True)
+        assert limiter.limit == 4
+        await limiter.acquire()
+        limiter.release(0.1, overloaded=True)  # within one latency of the last decrease
+        assert limiter.limit == 4
+
+        for _ in range(8):
+            await limiter.acquire()
+            limiter.release(0.1)
+        assert limiter.limit == 5  # additive increase after slow start
+
+        with mock.patch("time.monotonic", return_value=10**6):
+            for _ in range(60):
+                await limiter.acquire()
+                limiter.release(5)  # latency spike
+        assert limiter.limit == 2
+        assert limiter.latency == 5
+
+    asyncio.run(run())
+    assert limiter.stats == {"limit": 2, "in_flight": 0, "waiting": 0, "latency": 5}
+
+
+def test_limiter_waiters():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2)
+    started = []
+
+    async def request(i: int) -> None:
+        await limiter.acquire()
+        started.append(i)
+        await asyncio.sleep(0.01)
+        limiter.release(0.01)
+
+    async def run() -> None:
+        tasks = [asyncio.create_task(request(i)) for i in range(6)]
+        await asyncio.sleep(0)
+        assert limiter.in_flight == 2
+        assert started == [0, 1]
+        tasks[3].cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    asyncio.run(run())
+    assert started == [0, 1, 2, 4, 5]
+    assert limiter.in_flight == 0
+
+
+def test_ytmusic_concurrency_limiter(api_server):
+    async def handler(request: web.Request) -> web.Response:
+        return web.json_response({}, status=429 if request.path == "/browse" else 200)
+
+    async def run() -> None:
+        async with api_server.client(concurrency_limiter=limiter, retry=RetryPolicy(max_attempts=1)) as yt:
+            await asyncio.gather(*(yt._send_request_async("player", {"videoId": i}) for i in range(5)))
+            assert limiter.limit == 15
+            await asyncio.gather(
+                *(yt._send_request_async("browse", {"browseId": i}) for i in range(5)),
+                return_exceptions=True,
+            )
+
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=10)
+    api_server.serve(web.post("/{endpoint:.*}", handler))
+    asyncio.run(run())
+    assert limiter.limit == 7
+    assert limiter.in_flight == 0
@@ -0,0 +1,52 @@
+import asyncio
+
+from ytmusicapi.continuations import get_continuations, get_continuations_async, iter_continuations
+from ytmusicapi.type_alias import JsonDict
+
+
+def continuation_page(page: int, last: int) -> JsonDict:
+    results: JsonDict = {"contents": [{"page": page}, {"page": page}]}
+    if page < last:
+        results["continuations"] = [{"nextContinuationData": {"continuation": str(page + 1)}}]
+    return results
+
+
+def test_get_continuations_async():
+    def request_func(additionalParams: str) -> JsonDict:
+        page = int(additionalParams.split("=")[-1])
+        return {"continuationContents": {"musicShelfContinuation": continuation_page(page, 3)}}
+
+    async def request_func_async(additionalParams: str) -> JsonDict:
+        return request_func(additionalParams)
+
+    first_page = continuation_page(0, 3)
+    parse_func = lambda contents: contents
+    expected = get_continuations(first_page, "musicShelfContinuation", None, request_func, parse_func)
+    results = asyncio.run(
+        get_continuations_async(first_page, "musicShelfContinuation", None, request_func_async, parse_func)
+    )
+    assert results == expected
+    assert [item["page"] for item in results] == [1, 1, 2, 2, 3, 3]
+
+    results = asyncio.run(
+        get_continuations_async(first_page, "musicShelfContinuation", 3, request_func_async, parse_func)
+    )
+    assert len(results) == 4
+
+
+def test_iter_continuations():
+    requested: list[str] = []
+
+    def request_func(additionalParams: str) -> JsonDict:
+        requested.append(additionalParams)
+        page = int(additionalParams.split("=")[-1])
+        return {"continuationContents": {"musicShelfContinuation": continuation_page(page, 3)}}
+
+    pages = iter_continuations(
+        continuation_page(0, 3), "musicShelfContinuation", None, request_func, lambda contents: contents
+    )
+    assert len(requested) == 0
+    assert next(pages) == [{"page": 1}, {"page": 1}]
+    assert len(requested) == 1
+    assert len(list(pages)) == 2
+    assert len(requested) == 3
@@ -0,0 +1,65 @@
+import asyncio
+import time
+from unittest import mock
+
+from aiohttp import web
+
+from ytmusicapi import HedgingPolicy, ProxyPool, YTMusic
+
+
+def test_hedging_policy_delay():
+    policy = HedgingPolicy(percentile=0.9, delay=2, min_delay=0.05, window=10)
+    for latency in range(9):
+        policy.record(latency / 10)
+    assert policy.delay == 2
+    policy.record(5)
+    assert policy.delay == 0.8
+    for _ in range(10):
+        policy.record(0.01)
+    assert policy.delay == 0.05
+
+
+def test_ytmusic_hedging(api_server):
+    received = []
+
+    async def handler(request: web.Request) -> web.Response:
+        received.append(request.path)
+        if len(received) == 1:
+            await asyncio.sleep(5)  # stuck request
+        return web.json_response({"attempt": len(received)})
+
+    async def run() -> None:
+        async with api_server.client(hedging=HedgingPolicy(delay=0.05)) as yt:
+            started = time.monotonic()
+            assert await yt._send_request_async("player", {"videoId": "a"}) == {"attempt": 2}
+            assert time.monotonic() - started < 1
+            # fast responses are not hedged, requests with side effects never are
+            assert await yt._send_request_async("player", {"videoId": "b"}) == {"attempt": 3}
+            assert await yt._send_request_async("like/like", {"videoId": "b"}) == {"attempt": 4}
+        assert yt.hedging is not None
+        assert yt.hedging.stats == {"delay": 0.05, "hedged": 1, "won": 1}
+        assert 0.05 <= yt.hedging._latencies[0] < 1  # lower bound of the cancelled request
+
+    api_server.serve(web.post("/{endpoint:.*}", handler))
+    asyncio.run(run())
+    assert received == ["/player", "/player", "/player", "/like/like"]
+
+
+def test_ytmusic_hedging_proxies():
+    pool = ProxyPool(["http://proxy1", "http://proxy2"], sticky=True)
+    yt = YTMusic(proxy_pool=pool, hedging=HedgingPolicy(delay=0.01))
+    proxies = []
+
+    async def post(url: str, data: bytes, proxy: str | None) -> tuple[None, bytes]:
+        proxies.append(proxy)
+        if len(proxies) % 2:
+            await asyncio.sleep(1)  # the first attempt is stuck
+        return None, b"{}"
+
+    with mock.patch.object(yt, "_post_async", post):
+        assert asyncio.run(yt._post_hedged("url", b"", None)) == (None, b"{}")
+        assert asyncio.run(yt._post_hedged("url", b"", "http://explicit")) == (None, b"{}")
+    first, duplicate = proxies[:2]
+    assert {first, duplicate} == {"http://proxy1", "http://proxy2"}
+    assert pool.select(yt._identity or f"instance-{id(yt)}") == first  # the sticky route is kept
+    assert proxies[2:] == ["http://explicit", "http://explicit"]
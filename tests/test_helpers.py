@@ -1,5 +1,35 @@
+import json
 import os
 
+import pytest
+
+from ytmusicapi.helpers import (
+    ALBUM_BROWSE_ID_PATTERN,
+    SIGNATURE_TIMESTAMP_PATTERN,
+    VISITOR_ID_PATTERN,
+    json_loads,
+    scan_chunks,
+)
+
 
 def is_ci() -> bool:
     return "GITHUB_ACTIONS" in os.environ
+
+
+def test_json_loads():
+    assert json_loads(b'{"a": [1, "\\u00e9"]}') == {"a": [1, "é"]}
+    assert json_loads(memoryview(b'{"a": NaN}'))["a"] != 0  # stdlib fallback
+    with pytest.raises(json.JSONDecodeError):
+        json_loads("{")
+
+
+def test_scan_chunks():
+    page = b"x" * 40000 + rb"\x22browseId\x22:\x22MPREb_pZhPA6GfQmN\x22" + b"x" * 40000
+    chunks = [page[i : i + 100] for i in range(0, len(page), 100)]
+    read = []
+    match = scan_chunks((read.append(chunk) or chunk for chunk in chunks), ALBUM_BROWSE_ID_PATTERN)
+    assert match is not None
+    assert match.group(1) == b"MPREb_pZhPA6GfQmN"
+    assert len(read) == 401  # stops at the chunk completing the match
+    assert scan_chunks([b"signatureTimestamp:200", b"00,"], SIGNATURE_TIMESTAMP_PATTERN).group(1) == b"20000"
+    assert scan_chunks(chunks, VISITOR_ID_PATTERN) is None
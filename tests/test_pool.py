@@ -0,0 +1,90 @@
+import asyncio
+from unittest import mock
+
+import pytest
+
+from ytmusicapi import ClientPool, RateLimiter, YTMusic
+from ytmusicapi.exceptions import YTMusicServerError, YTMusicUserError
+
+
+def make_clients(count: int, rate_limiter: RateLimiter | None = None) -> list[YTMusic]:
+    clients = []
+    for i in range(count):
+        yt = YTMusic(rate_limiter=rate_limiter)
+        yt.__dict__["_identity"] = f"account{i}"
+        clients.append(yt)
+    return clients
+
+
+def test_client_pool_least_loaded():
+    clients = make_clients(3)
+    pool = ClientPool(clients)
+    selected = [pool.select() for _ in range(3)]
+    assert {identity.client for identity in selected} == set(clients)
+    pool.report(selected[1])
+    assert pool.select() is selected[1]  # the only account without a request in flight
+
+    with pytest.raises(YTMusicUserError):
+        ClientPool([])
+
+
+def test_client_pool_budget():
+    limiter = RateLimiter(identity_rate=1, burst=2)
+    clients = make_clients(2, limiter)
+    pool = ClientPool(clients)
+    with mock.patch("time.sleep"):
+        for _ in range(2):
+            limiter.acquire("account0")
+    assert pool.stats[0].budget < 1
+    assert pool.stats[1].budget == 2
+    assert {pool.call(lambda client: client) for _ in range(3)} == {clients[1]}
+    assert RateLimiter().get_budget("account0") == float("inf")
+
+
+def test_client_pool_quarantine():
+    clients = make_clients(2)
+    pool = ClientPool(clients, quarantine=10)
+    first, second = pool.stats
+
+    def throttled(client: YTMusic) -> None:
+        raise YTMusicServerError("Too many requests", status=429)
+
+    with mock.patch("time.monotonic", return_value=1000.0) as monotonic:
+        with mock.patch.object(pool, "select", return_value=first), pytest.raises(YTMusicServerError):
+            pool.call(throttled)
+        assert first.quarantined_until == 1010
+        assert {pool.call(lambda client: client) for _ in range(5)} == {clients[1]}
+
+        with pytest.raises(KeyError), pool.client():  # other errors don't quarantine
+            raise KeyError
+        assert not second.quarantined
+
+        first.in_flight += 1
+        pool.report(first, YTMusicServerError(status=401))  # the quarantine doubles
+        assert first.quarantined_until == 1020
+        second.in_flight += 1
+        pool.report(second, YTMusicServerError(status=429))
+        assert pool.select() is second  # released first
+        pool.report(second)
+
+        monotonic.return_value = 1021.0
+        first.in_flight += 1
+        pool.report(first)
+        assert first.failures == 0
+        assert not first.quarantined
+    assert (first.requests, first.rejected, first.in_flight) == (3, 2, 0)
+
+
+def test_client_pool_acall():
+    clients = make_clients(2)
+    pool = ClientPool(clients)
+
+    async def request(client: YTMusic, delay: float) -> YTMusic:
+        await asyncio.sleep(delay)
+        return client
+
+    async def run() -> list[YTMusic]:
+        return await asyncio.gather(*(pool.acall(request, 0.01) for _ in range(2)))
+
+    assert set(asyncio.run(run())) == set(clients)
+    assert all(identity.in_flight == 0 for identity in pool.stats)
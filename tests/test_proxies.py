@@ -0,0 +1,98 @@
+from unittest import mock
+
+import pytest
+import requests
+from requests import Response
+
+from ytmusicapi import ProxyPool, YTMusic
+from ytmusicapi.exceptions import YTMusicUserError
+
+PROXIES = ["http://proxy1", "http://proxy2", "http://proxy3"]
+
+
+def test_proxy_pool_scoring():
+    pool = ProxyPool(PROXIES)
+    assert {pool.select() for _ in range(3)} == set(PROXIES)  # untested proxies are tried first
+    for proxy, latency in zip(PROXIES, [0.5, 0.1, 0.3]):
+        pool.report(proxy, True, latency)
+    assert pool.select() == "http://proxy2"
+    pool.report("http://proxy2", True, 0.1)
+
+    pool.report("http://proxy2", False)
+    pool.report("http://proxy2", False)
+    assert pool.proxies["http://proxy2"].error_rate == pytest.approx(0.36)
+    assert pool.select() == "http://proxy2"  # 0.1 / (1 - 0.36) + 0.3 * 0.36 < 0.3
+    assert pool.select() == "http://proxy3"  # 0.1 / (1 - 0.36) * 2 requests in flight + 0.3 * 0.36 > 0.3
+
+    with pytest.raises(YTMusicUserError):
+        ProxyPool([])
+
+
+def test_proxy_pool_untested():
+    pool = ProxyPool(["http://good", "http://bad"])
+    for _ in range(5):
+        pool.report("http://good", True, 0.2)
+    for _ in range(2):
+        pool.report("http://bad", False)  # e.g. 429 responses, but not quarantined yet
+    for _ in range(5):
+        assert pool.select() == "http://good"
+        pool.report("http://good", True, 0.2)
+
+    pool = ProxyPool(PROXIES[:2])
+    pool.report("http://proxy1", True, 0.2)
+    # an untested proxy is rated with the mean latency, rather than avoided or preferred
+    assert {pool.select() for _ in range(2)} == set(PROXIES[:2])
+
+
+def test_proxy_pool_quarantine():
+    pool = ProxyPool(PROXIES[:2], failure_threshold=2, quarantine=10)
+    with mock.patch("time.monotonic", return_value=1000.0) as monotonic:
+        for _ in range(2):
+            pool.report("http://proxy1", False)
+        assert pool.proxies["http://proxy1"].quarantined_until == 1010
+        assert {pool.select() for _ in range(5)} == {"http://proxy2"}
+        pool.report("http://proxy1", False)  # the quarantine doubles
+        assert pool.proxies["http://proxy1"].quarantined_until == 1020
+        for _ in range(2):
+            pool.report("http://proxy2", False)
+        assert pool.select() == "http://proxy2"  # released first
+
+        monotonic.return_value = 1021.0
+        pool.report("http://proxy1", True, 0.1)
+        assert pool.proxies["http://proxy1"].failures == 0
+        assert not pool.proxies["http://proxy1"].quarantined
+
+
+def test_proxy_pool_sticky():
+    pool = ProxyPool(PROXIES, sticky=True, failure_threshold=1)
+    first = pool.select("account")
+    assert {pool.select("account") for _ in range(5)} == {first}
+    pool.report(first, False)
+    assert pool.select("account") != first
+    assert len({pool.select(f"instance-{i}") for i in range(10)}) > 1
+
+
+def test_proxy_pool_exclude():
+    pool = ProxyPool(PROXIES[:2], sticky=True)
+    first = pool.select("account")
+    assert {pool.select("account", exclude=first) for _ in range(5)} == set(PROXIES[:2]) - {first}
+    assert pool.select("account") == first  # the route is kept
+    assert ProxyPool(PROXIES[:1]).select(exclude=PROXIES[0]) == PROXIES[0]  # no other proxy
+
+
+def test_ytmusic_proxy_pool():
+    pool = ProxyPool(PROXIES[:2], failure_threshold=1)
+    yt = YTMusic(proxy_pool=pool, proxies={"https": "http://ignored"})
+    yt.__dict__["base_headers"] = {}
+    response = Response()
+    response.status_code = 200
+    response._content = b"{}"
+    with mock.patch("requests.Session.post") as post, mock.patch("time.sleep"):
+        post.side_effect = [requests.ConnectionError(), response]
+        yt._send_request("browse", {"browseId": "FEmusic_home"})
+
+    failed, succeeded = (call.kwargs["proxies"]["https"] for call in post.call_args_list)
+    assert failed != succeeded
+    assert pool.proxies[failed].quarantined
+    assert pool.proxies[succeeded].latency > 0
+    assert all(proxy.in_flight == 0 for proxy in pool.stats)
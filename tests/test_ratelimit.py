@@ -0,0 +1,66 @@
+import asyncio
+import time
+from unittest import mock
+
+from requests import Response
+
+from ytmusicapi import RateLimiter, YTMusic
+from ytmusicapi.ratelimit import TokenBucket
+
+
+def test_token_bucket():
+    with mock.patch("time.monotonic", return_value=100.0) as monotonic:
+        bucket = TokenBucket(rate=2, burst=2)
+        assert [bucket.reserve() for _ in range(4)] == [0, 0, 0.5, 1]
+        monotonic.return_value = 101.0  # refilled by 2 tokens
+        assert bucket.reserve() == 0.5
+        bucket.refund()
+        assert bucket.tokens == 0
+
+
+def test_rate_limiter_buckets():
+    limiter = RateLimiter(identity_rate=1, proxy_rate=1, burst=1)
+    with mock.patch("time.sleep") as sleep:
+        limiter.acquire("a", "http://proxy1")
+        limiter.acquire("b", "http://proxy2")
+        sleep.assert_not_called()
+        limiter.acquire("a", "http://proxy2")
+        assert 0.9 < sleep.call_args.args[0] <= 1
+    assert RateLimiter()._get_buckets("a", None) == []
+
+
+def test_rate_limiter_async_fairness():
+    limiter = RateLimiter(rate=50, burst=1)
+    order = []
+
+    async def request(i: int) -> None:
+        await limiter.acquire_async()
+        order.append(i)
+
+    async def run() -> float:
+        start = time.monotonic()
+        tasks = [asyncio.create_task(request(i)) for i in range(6)]
+        await asyncio.sleep(0)
+        tasks[2].cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        return time.monotonic() - start
+
+    assert asyncio.run(run()) >= 0.07
+    assert order == [0, 1, 3, 4, 5]
+
+
+def test_ytmusic_rate_limiter():
+    limiter = RateLimiter(identity_rate=1)
+    yt = YTMusic(rate_limiter=limiter, proxies={"https": "http://proxy1"})
+    yt.__dict__["base_headers"] = {}
+    response = Response()
+    response.status_code = 200
+    response._content = b"{}"
+    with (
+        mock.patch("requests.Session.post", return_value=response),
+        mock.patch("requests.Session.get", return_value=response),
+        mock.patch.object(limiter, "acquire") as acquire,
+    ):
+        yt._send_request("browse", {"browseId": "FEmusic_home"})
+        yt._send_get_request("https://music.youtube.com")
+    assert acquire.call_args_list == [mock.call("", "http://proxy1")] * 2
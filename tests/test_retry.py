@@ -0,0 +1,83 @@
+import asyncio
+import time
+from email.utils import formatdate
+from unittest import mock
+
+import orjson
+import pytest
+from aiohttp import web
+from requests import Response
+
+from ytmusicapi import RetryPolicy, YTMusic
+from ytmusicapi.exceptions import YTMusicServerError
+from ytmusicapi.retry import parse_retry_after
+from ytmusicapi.type_alias import JsonDict
+
+
+def make_response(status: int, content: JsonDict, headers: dict[str, str] | None = None) -> Response:
+    response = Response()
+    response.status_code = status
+    response.reason = "Service Unavailable" if status == 503 else "OK"
+    response._content = orjson.dumps(content)
+    response.headers.update(headers or {})
+    return response
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("7") == 7
+    assert 58 < parse_retry_after(formatdate(time.time() + 60, usegmt=True)) <= 60
+    assert parse_retry_after(formatdate(time.time() - 60, usegmt=True)) == 0
+    assert parse_retry_after("soon") == 0
+
+
+def test_retry_policy_delay():
+    policy = RetryPolicy(max_attempts=4, backoff=1, max_backoff=3, budget=10)
+    started = time.monotonic()
+    assert 0 <= policy.get_delay(1, started) <= 1
+    assert 0 <= policy.get_delay(3, started) <= 3
+    assert policy.get_delay(4, started) is None
+    assert policy.get_delay(1, started, "5") == 5
+    assert policy.get_delay(1, started, "11") is None  # exceeds the budget
+    assert policy.get_delay(1, started - 10) is None
+
+
+def test_send_request_retry():
+    yt = YTMusic(retry=RetryPolicy(max_attempts=3))
+    yt.__dict__["base_headers"] = {}
+    unavailable = make_response(503, {"error": {"message": "try again"}}, {"Retry-After": "1"})
+    with mock.patch("requests.Session.post") as post, mock.patch("time.sleep") as sleep:
+        post.side_effect = [unavailable, make_response(200, {"ok": True})]
+        assert yt._send_request("browse", {"browseId": "MPREb_4pL8gzRtw1p"}) == {"ok": True}
+        assert sleep.call_args.args[0] >= 1
+
+        post.side_effect = [unavailable] * 3
+        with pytest.raises(YTMusicServerError, match=r"HTTP 503: Service Unavailable\.\ntry again") as error:
+            yt._send_request("browse", {"browseId": "MPREb_4pL8gzRtw1p"})
+        assert (error.value.status, error.value.endpoint, error.value.attempts) == (503, "browse", 3)
+
+        post.side_effect = [unavailable]
+        with pytest.raises(YTMusicServerError) as error:
+            yt._send_request("like/like", {"target": {"videoId": "ZrOKjDZOtkA"}})
+        assert error.value.attempts == 1
+    assert post.call_count == 6
+
+
+def test_send_request_async_retry(api_server):
+    attempts = []
+
+    async def handler(request: web.Request) -> web.Response:
+        attempts.append(request.path)
+        if len(attempts) % 2:
+            return web.json_response({"error": {"message": "slow down"}}, status=429)
+        return web.json_response({"ok": True})
+
+    async def run() -> None:
+        async with api_server.client(retry=RetryPolicy(backoff=0.01)) as yt:
+            assert await yt._send_request_async("player", {"videoId": "ZrOKjDZOtkA"}) == {"ok": True}
+            with pytest.raises(YTMusicServerError, match="slow down") as error:
+                await yt._send_request_async("like/like", {"target": {"videoId": "ZrOKjDZOtkA"}})
+        assert (error.value.status, error.value.endpoint, error.value.attempts) == (429, "like/like", 1)
+
+    api_server.serve(web.post("/{endpoint:.*}", handler))
+    asyncio.run(run())
+    assert attempts == ["/player", "/player", "/like/like"]
@@ -1,10 +1,18 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
+from unittest import mock
 
+import aiohttp
+import orjson
 import pytest
 import requests
+from aiohttp import web
 
-from ytmusicapi import YTMusic
+from ytmusicapi import MemoryCache, YTMusic
 from ytmusicapi.exceptions import YTMusicUserError
+from ytmusicapi.type_alias import JsonDict
 
 
 def test_ytmusic_context():
@@ -26,3 +34,223 @@ def test_ytmusic_session():
     ytmusic = YTMusic()
     assert isinstance(ytmusic._session, requests.Session)
     assert ytmusic._session != test_session
+
+
+def test_ytmusic_async_context():
+    async def run() -> YTMusic:
+        async with YTMusic(connector_options={"limit_per_host": 5}) as yt:
+            session = yt._prepare_async_session()
+            assert session is yt._prepare_async_session()
+            assert session.connector.limit_per_host == 5
+            assert session.connector.limit == 100
+        assert session.closed
+        return yt
+
+    yt = asyncio.run(run())
+    assert yt._async_sessions == {}
+
+
+def test_ytmusic_event_loops(api_server, caplog):
+    async def handler(request: web.Request) -> web.Response:
+        return web.json_response({"videoId": (await request.json())["videoId"]})
+
+    api_server.serve(web.post("/{endpoint:.*}", handler))
+    yt = api_server.client()
+    # without `async with`, the pooled session outlives the event loop of each run
+    assert asyncio.run(yt._send_request_async("player", {"videoId": "a"})) == {"videoId": "a"}
+    (first_session,) = yt._async_sessions.values()
+    assert asyncio.run(yt._send_request_async("player", {"videoId": "b"})) == {"videoId": "b"}
+    assert first_session.closed
+    assert first_session not in yt._async_sessions.values()
+
+    def run_in_thread(index: int) -> list[JsonDict]:
+        async def run() -> list[JsonDict]:
+            return [await yt._send_request_async("player", {"videoId": f"{index}-{i}"}) for i in range(10)]
+
+        return [result for _ in range(2) for result in asyncio.run(run())]
+
+    with ThreadPoolExecutor(2) as executor:  # one instance used by the event loops of several threads
+        results = list(executor.map(run_in_thread, range(2)))
+    assert [len(thread_results) for thread_results in results] == [20, 20]
+    asyncio.run(yt.aclose())
+    assert yt._async_sessions == {}
+    assert "Unclosed" not in caplog.text
+
+
+def test_ytmusic_async_session():
+    async def run() -> None:
+        async with aiohttp.ClientSession() as test_session:
+            async with YTMusic(async_session=test_session) as yt:
+                assert yt._prepare_async_session() is test_session
+            assert not test_session.closed
+
+    asyncio.run(run())
+
+
+def test_ytmusic_client_context():
+    yt = YTMusic(language="en", location="GB")
+
+    async def request_context(**overrides: str) -> JsonDict:
+        with yt.client_context(**overrides):
+            await asyncio.sleep(0)  # let the other tasks enter their contexts
+            return yt._request_context()
+
+    async def run() -> list[JsonDict]:
+        return await asyncio.gather(
+            request_context(hl="de"),
+            request_context(clientName="ANDROID_MUSIC", clientVersion="7.21.50"),
+            request_context(gl="US", onBehalfOfUser="101234161234936123473"),
+        )
+
+    german, mobile, brand = (context["context"] for context in asyncio.run(run()))
+    assert german["client"]["hl"] == "de"
+    assert german["client"]["clientName"] == "WEB_REMIX"
+    assert mobile["client"]["clientName"] == "ANDROID_MUSIC"
+    assert mobile["client"]["hl"] == "en"
+    assert brand["client"]["gl"] == "US"
+    assert brand["user"] == {"onBehalfOfUser": "101234161234936123473"}
+    assert yt._request_context() is yt.context
+    assert yt.context["context"]["client"]["gl"] == "GB"
+    assert yt.context["context"]["user"] == {}
+
+    other = YTMusic(language="en", location="GB")
+    with yt.client_context(hl="de"):
+        assert yt.parser.lang.gettext("song") == "titel"
+        with yt.as_mobile(), other.client_context(gl="US"):
+            assert yt._request_context()["context"]["client"]["hl"] == "de"
+            assert yt._request_context()["context"]["client"]["gl"] == "GB"  # overrides are per instance
+            assert other._request_context()["context"]["client"]["hl"] == "en"
+    assert yt.parser is yt._parsers["en"]
+
+    with pytest.raises(YTMusicUserError, match="Language not supported"), yt.client_context(hl="xx"):
+        pass
+
+
+def test_ytmusic_encode_body():
+    yt = YTMusic(language="en", location="GB")
+    body = {"query": "oasis", "params": "EgWKAQIIAWoMEA4QChADEAQQCRAF"}
+    encoded = yt._encode_body(body)
+    assert orjson.loads(encoded) == {**body, **yt.context}
+    assert "context" not in body
+    assert orjson.loads(yt._encode_body({})) == yt.context
+    assert orjson.loads(yt._encode_body({"context": {}})) == yt.context
+
+    with yt.client_context(hl="de"):
+        assert orjson.loads(yt._encode_body(body))["context"]["client"]["hl"] == "de"
+    assert yt._encode_body(body) == encoded
+
+
+def test_ytmusic_single_flight():
+    yt = YTMusic(visitor_id="")
+    requests_sent = []
+
+    async def fetch(endpoint: str, body: JsonDict, additionalParams: str, proxy: str | None) -> bytes:
+        requests_sent.append(body)
+        await asyncio.sleep(0.01)
+        if body.get("videoId") == "error":
+            raise aiohttp.ClientError("failed")
+        return orjson.dumps(body)
+
+    async def run() -> list[JsonDict]:
+        first = asyncio.ensure_future(yt._send_request_async("player", {"videoId": "a"}))
+        await asyncio.sleep(0)
+        first.cancel()  # cancelling one caller doesn't affect the others
+        results = await asyncio.gather(
+            *(yt._send_request_async("player", {"videoId": "a"}) for _ in range(5)),
+            yt._send_request_async("player", {"videoId": "b"}),
+            yt._send_request_async("like/like", {"videoId": "a"}),
+            yt._send_request_async("like/like", {"videoId": "a"}),
+        )
+        with pytest.raises(aiohttp.ClientError):
+            await asyncio.gather(*(yt._send_request_async("player", {"videoId": "error"}) for _ in range(2)))
+        return results
+
+    with mock.patch.object(yt, "_fetch_async", fetch):
+        results = asyncio.run(run())
+
+    assert results[0] == {"videoId": "a"}
+    assert results[0] is not results[1]
+    assert len(requests_sent) == 5
+    assert yt._in_flight == {}
+
+
+def test_ytmusic_visitor_id(api_server):
+    pages_sent = 0
+
+    async def page(request: web.Request) -> web.Response:
+        nonlocal pages_sent
+        pages_sent += 1
+        await asyncio.sleep(0.01)
+        return web.Response(text='<script>ytcfg.set({"VISITOR_DATA": "Cgt2aXNpdG9y"});</script>')
+
+    async def api(request: web.Request) -> web.Response:
+        return web.json_response({"visitor": request.headers.get("X-Goog-Visitor-Id")})
+
+    async def run(yt: YTMusic) -> list[JsonDict]:
+        async with yt:
+            return await asyncio.gather(*(yt._send_request_async("player", {"videoId": i}) for i in range(3)))
+
+    api_server.serve(web.get("/", page), web.post("/{endpoint:.*}", api))
+    cache = MemoryCache(ttls={})
+    assert asyncio.run(run(YTMusic(visitor_cache=cache))) == [{"visitor": "Cgt2aXNpdG9y"}] * 3
+    assert pages_sent == 1  # fetched once for concurrent requests
+    assert asyncio.run(run(YTMusic(visitor_cache=cache)))[0] == {"visitor": "Cgt2aXNpdG9y"}
+    assert pages_sent == 1  # shared by instances
+    assert asyncio.run(run(YTMusic(visitor_id="seeded")))[0] == {"visitor": "seeded"}
+    assert pages_sent == 1
+
+
+def test_ytmusic_signature_timestamp(api_server):
+    fetched = []
+
+    async def page(request: web.Request) -> web.Response:
+        fetched.append(request.path)
+        await asyncio.sleep(0.01)
+        if request.path == "/":
+            return web.Response(text='<script>{"jsUrl":"/s/player/v1/base.js"}</script>')
+        return web.Response(text="var a={signatureTimestamp:20000};")
+
+    async def run(yt: YTMusic, expire: bool = False) -> list[int]:
+        async with yt:
+            if expire:
+                yt._signature_timestamp_expires = 0
+            timestamps = await asyncio.gather(*(yt._get_signature_timestamp_async() for _ in range(3)))
+            await asyncio.sleep(0.05)  # background refresh
+            return timestamps
+
+    api_server.serve(web.get("/{path:.*}", page))
+    cache = MemoryCache(ttls={})
+    yt = YTMusic(cache=cache)
+    assert asyncio.run(run(yt)) == [20000] * 3
+    assert fetched == ["/", "/s/player/v1/base.js"]
+    assert asyncio.run(run(YTMusic(cache=cache))) == [20000] * 3
+    assert len(fetched) == 2  # shared through the cache
+
+    yt._signature_timestamp = 19000
+    assert asyncio.run(run(yt, expire=True)) == [19000] * 3  # not waiting for the refresh
+    assert yt._signature_timestamp == 20000
+    assert len(fetched) == 2  # the base.js URL is still cached
+
+
+def test_ytmusic_headers():
+    auth = {
+        "cookie": "__Secure-3PAPISID=sapisid",
+        "Authorization": "SAPISIDHASH 0_old",
+        "X-Goog-Visitor-Id": "visitor",
+        "origin": "https://music.youtube.com",
+    }
+    yt = YTMusic(json.dumps(auth))
+    with mock.patch("time.time", return_value=1700000000.5):
+        headers = yt.headers
+        assert yt.headers == headers
+        assert headers is not yt.headers  # a mapping per request
+    assert headers["authorization"].startswith("SAPISIDHASH 1700000000_")
+    assert headers["x-goog-visitor-id"] == "visitor"
+    assert list(headers).count("authorization") == 1
+    assert yt.base_headers["authorization"] == "SAPISIDHASH 0_old"  # not modified
+    with pytest.raises(TypeError):
+        headers["authorization"] = "changed"  # type: ignore[index]
+
+    yt = YTMusic(visitor_id="visitor")
+    assert yt.headers is yt.headers  # without authorization, all requests share the frozen headers
+    assert yt.headers["x-goog-visitor-id"] == "visitor"
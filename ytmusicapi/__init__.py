@@ -1,7 +1,14 @@
 from importlib.metadata import PackageNotFoundError, version
 
 from ytmusicapi.auth.oauth.credentials import OAuthCredentials
+from ytmusicapi.cache import MemoryCache, SQLiteCache, TieredCache
+from ytmusicapi.concurrency import AdaptiveConcurrencyLimiter
+from ytmusicapi.hedging import HedgingPolicy
 from ytmusicapi.models.content.enums import LikeStatus
+from ytmusicapi.pool import ClientPool
+from ytmusicapi.proxies import ProxyPool
+from ytmusicapi.ratelimit import RateLimiter
+from ytmusicapi.retry import RetryPolicy
 from ytmusicapi.setup import setup, setup_oauth
 from ytmusicapi.ytmusic import YTMusic
 
@@ -14,4 +21,19 @@ except PackageNotFoundError:
 __copyright__ = "Copyright 2024 sigma67"
 __license__ = "MIT"
 __title__ = "ytmusicapi"
-__all__ = ["LikeStatus", "OAuthCredentials", "YTMusic", "setup", "setup_oauth"]
+__all__ = [
+    "AdaptiveConcurrencyLimiter",
+    "ClientPool",
+    "HedgingPolicy",
+    "LikeStatus",
+    "MemoryCache",
+    "OAuthCredentials",
+    "ProxyPool",
+    "RateLimiter",
+    "RetryPolicy",
+    "SQLiteCache",
+    "TieredCache",
+    "YTMusic",
+    "setup",
+    "setup_oauth",
+]
@@ -1,15 +1,30 @@
+import asyncio
 import json
+import os
+import sys
+import tempfile
+import threading
 import time
 import webbrowser
-from collections.abc import KeysView
-from dataclasses import dataclass
+from collections.abc import Iterator, KeysView
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
 
+import requests
 from requests.structures import CaseInsensitiveDict
 
 from ytmusicapi.auth.oauth.credentials import Credentials, OAuthCredentials
+from ytmusicapi.auth.oauth.exceptions import BadOAuthClient, UnauthorizedOAuthClient
 from ytmusicapi.auth.oauth.models import BaseTokenDict, Bearer, DefaultScope, RefreshableTokenDict
+from ytmusicapi.constants import OAUTH_RENEWAL_MARGIN, OAUTH_RENEWAL_RETRY
+from ytmusicapi.exceptions import YTMusicError
+from ytmusicapi.helpers import json_loads
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
 
 
 @dataclass(kw_only=True)
@@ -71,8 +86,8 @@ class OAuthToken(Token):
     @classmethod
     def from_json(cls, file_path: Path) -> "OAuthToken":
         if file_path.is_file():
-            with open(file_path) as json_file:
-                file_pack = json.load(json_file)
+            with open(file_path, "rb") as json_file:
+                file_pack = json_loads(json_file.read())
 
         return cls(**file_pack)
 
@@ -83,6 +98,9 @@ class RefreshingToken(OAuthToken):
     Compositional implementation of Token that automatically refreshes
     an underlying OAuthToken when required (credential expiration <= 1 min)
     upon access_token attribute access.
+
+    In asynchronous code, :py:func:`prepare_async` refreshes the token without blocking the event
+    loop, once for all concurrent callers, and renews it in the background before it expires.
     """
 
     #: credentials used for access_token refreshing
@@ -91,14 +109,99 @@ class RefreshingToken(OAuthToken):
     #: protected/property attribute enables auto writing token values to new file location via setter
     _local_cache: Path | None = None
 
-    def __getattribute__(self, item: str) -> Any:
-        """access token setter to auto-refresh if it is expiring"""
-        if item == "access_token" and self.is_expiring:
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+    _refreshing: "asyncio.Future[None] | None" = field(default=None, init=False, repr=False, compare=False)
+    _renewal: "asyncio.Task[None] | None" = field(default=None, init=False, repr=False, compare=False)
+
+    @property  # type: ignore[misc]
+    def access_token(self) -> str:
+        """access token, refreshed first if it is expiring"""
+        if self.is_expiring:
+            self.refresh()
+        access_token: str = self.__dict__["access_token"]
+        return access_token
+
+    @access_token.setter
+    def access_token(self, access_token: str) -> None:
+        self.__dict__["access_token"] = access_token
+
+    def refresh(self) -> None:
+        """
+        Refreshes the access token and stores it, once for all threads calling at the same time.
+        With a ``local_cache``, the file is locked during the refresh and reloaded first,
+        so that processes sharing it refresh only once.
+        """
+        expires_at = self.expires_at
+        with self._lock, file_lock(self.local_cache):
+            if self.expires_at != expires_at:
+                return  # refreshed by another thread meanwhile
+            if self.reload() and not self.is_expiring:
+                return  # refreshed by another process meanwhile
             fresh = self.credentials.refresh_token(self.refresh_token)
             self.update(fresh)
             self.store_token()
 
-        return super().__getattribute__(item)
+    def reload(self) -> bool:
+        """
+        Loads the access token from ``local_cache`` if it was refreshed by another process.
+
+        :return: True if a newer access token was loaded
+        """
+        if self.local_cache is None or not Path(self.local_cache).is_file():
+            return False
+        try:
+            with open(self.local_cache, "rb") as json_file:
+                stored = json_loads(json_file.read())
+        except (OSError, ValueError):
+            return False
+        if (
+            stored.get("refresh_token") != self.refresh_token
+            or stored.get("expires_at", 0) <= self.expires_at
+        ):
+            return False
+        self.access_token = stored["access_token"]
+        self.expires_at = stored["expires_at"]
+        return True
+
+    async def refresh_async(self) -> None:
+        """Refreshes the access token in a thread, once for all tasks calling at the same time"""
+        if self._refreshing is None:
+            refreshing = asyncio.ensure_future(asyncio.to_thread(self.refresh))
+            refreshing.add_done_callback(self._refreshed)
+            self._refreshing = refreshing
+        await asyncio.shield(self._refreshing)
+
+    def _refreshed(self, refreshing: "asyncio.Future[None]") -> None:
+        self._refreshing = None
+        if not refreshing.cancelled():
+            refreshing.exception()  # retrieved here in case all callers were cancelled
+
+    async def prepare_async(self) -> None:
+        """
+        Makes sure the access token doesn't expire within a minute, without blocking the event loop,
+        and starts renewing it in the background of the running event loop.
+        """
+        if self._renewal is None or self._renewal.done():
+            self._renewal = asyncio.ensure_future(self._renew())
+        if self.is_expiring:
+            await self.refresh_async()
+
+    async def _renew(self) -> None:
+        """Refreshes the token ahead of the expiry window, so that requests never wait for it"""
+        while True:
+            delay = self.expires_at - OAUTH_RENEWAL_MARGIN - time.time()
+            await asyncio.sleep(max(delay, OAUTH_RENEWAL_RETRY))
+            if self.expires_at - time.time() > OAUTH_RENEWAL_MARGIN:
+                continue  # refreshed meanwhile
+            with suppress(requests.RequestException, YTMusicError, BadOAuthClient, UnauthorizedOAuthClient):
+                # requests refresh the token themselves if this keeps failing
+                await self.refresh_async()
+
+    def stop_renewal(self) -> None:
+        """Cancels the background renewal started by :py:func:`prepare_async`"""
+        if self._renewal is not None:
+            self._renewal.cancel()
+            self._renewal = None
 
     @property
     def local_cache(self) -> Path | None:
@@ -143,5 +246,43 @@ class RefreshingToken(OAuthToken):
         file_path = path if path else self.local_cache
 
         if file_path:
-            with open(file_path, encoding="utf8", mode="w") as file:
-                json.dump(self.as_dict(), file, indent=True)
+            # written to a temporary file first, so that other processes never read a partial token
+            file_path = Path(file_path)
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf8", dir=file_path.parent, prefix=file_path.name, delete=False
+            ) as file:
+                try:
+                    json.dump(self.as_dict(), file, indent=True)
+                    file.flush()
+                    os.fsync(file.fileno())
+                except BaseException:
+                    file.close()
+                    Path(file.name).unlink(missing_ok=True)
+                    raise
+            Path(file.name).replace(file_path)
+
+
+@contextmanager
+def file_lock(path: Path | str | None) -> Iterator[None]:
+    """
+    Exclusive lock of a token file shared by all processes, using a ``.lock`` file next to it.
+    Does nothing without a path.
+    """
+    if path is None:
+        yield None
+        return
+    with open(f"{path}.lock", "a+b") as lock_file:
+        if sys.platform == "win32":
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield None
+            finally:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield None
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
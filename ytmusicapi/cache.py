@@ -0,0 +1,375 @@
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from hashlib import blake2b
+from pathlib import Path
+
+import orjson
+
+from ytmusicapi.constants import (
+    CACHE_COMPRESSION_LEVEL,
+    CACHE_LOCK_TIMEOUT,
+    CACHE_MAX_BYTES,
+    CACHE_MAX_ENTRIES,
+    CACHE_PURGE_INTERVAL,
+    CACHE_SQLITE_MAX_BYTES,
+    CACHE_TTLS,
+)
+from ytmusicapi.type_alias import JsonDict
+
+
+class ResponseCache(ABC):
+    """
+    Base class for caches of raw API responses, see the ``cache`` parameter of :py:class:`YTMusic`.
+
+    Only requests with a time to live are cached. It is looked up by the longest prefix of
+    ``ttls`` matching ``endpoint/browseId``, for example ``browse/MPRE`` for albums or ``player``
+    for songs. Player requests include the ``signatureTimestamp``, so they are cached per timestamp.
+    """
+
+    def __init__(self, ttls: dict[str, float] | None = None):
+        """
+        :param ttls: Optional. Time to live in seconds by ``endpoint/browseId`` prefix.
+          Merged with the defaults, a value of 0 disables caching for the prefix.
+        """
+        self.ttls = {**CACHE_TTLS, **(ttls or {})}
+        self.hits = 0
+        self.misses = 0
+
+    def get_ttl(self, endpoint: str, body: JsonDict) -> float | None:
+        """Returns the time to live of the response to a request, or None if it should not be cached"""
+        path = endpoint + "/" + body.get("browseId", "")
+        prefix = max((prefix for prefix in self.ttls if path.startswith(prefix)), key=len, default=None)
+        return (self.ttls[prefix] or None) if prefix is not None else None
+
+    @staticmethod
+    def make_key(url: str, body: JsonDict, context: bytes, identity: str) -> str:
+        """
+        Computes the cache key of a request.
+
+        :param url: endpoint including any additional parameters, such as a continuation
+        :param body: endpoint specific payload, normalized by sorting its keys
+        :param context: encoded client context of the request
+        :param identity: identifier of the authenticated account
+        """
+        key = blake2b(digest_size=20)
+        for part in (
+            identity.encode(),
+            url.encode(),
+            orjson.dumps(body, option=orjson.OPT_SORT_KEYS),
+            context,
+        ):
+            key.update(part)
+            key.update(b"\0")
+        return key.hexdigest()
+
+    def get(self, key: str) -> bytes | None:
+        """Returns the cached response for a key if it has not expired"""
+        entry = self._load(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Caches a response for ``ttl`` seconds"""
+        self._store(key, value, time.time() + ttl)
+
+    async def aget(self, key: str) -> bytes | None:
+        """Asynchronous version of :py:func:`get`, used by the asynchronous methods of :py:class:`YTMusic`"""
+        entry = await self._aload(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[1]
+
+    async def aset(self, key: str, value: bytes, ttl: float) -> None:
+        """Asynchronous version of :py:func:`set`"""
+        await self._astore(key, value, time.time() + ttl)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Cache hit and miss counters"""
+        return {"hits": self.hits, "misses": self.misses}
+
+    @abstractmethod
+    def _load(self, key: str) -> tuple[float, bytes] | None:
+        """Returns the expiry time and value stored for a key, or None if it is missing or expired"""
+
+    @abstractmethod
+    def _store(self, key: str, value: bytes, expires_at: float) -> None:
+        """Stores a value for a key until the epoch time ``expires_at``"""
+
+    async def _aload(self, key: str) -> tuple[float, bytes] | None:
+        """:py:func:`_load` for the event loop, overridden by caches that block on I/O"""
+        return self._load(key)
+
+    async def _astore(self, key: str, value: bytes, expires_at: float) -> None:
+        """:py:func:`_store` for the event loop, overridden by caches that block on I/O"""
+        self._store(key, value, expires_at)
+
+
+class MemoryCache(ResponseCache):
+    """
+    Thread-safe in-memory LRU cache, bounded by number of entries and total size of responses::
+
+        ytmusic = YTMusic(cache=MemoryCache(max_entries=5000, ttls={"browse/FEmusic_home": 0}))
+        ytmusic.get_album("MPREb_4pL8gzRtw1p")  # sent to the server
+        ytmusic.get_album("MPREb_4pL8gzRtw1p")  # returned from the cache
+    """
+
+    def __init__(
+        self,
+        max_entries: int = CACHE_MAX_ENTRIES,
+        max_bytes: int = CACHE_MAX_BYTES,
+        ttls: dict[str, float] | None = None,
+    ):
+        """
+        :param max_entries: Optional. Maximum number of cached responses. Default: 1024
+        :param max_bytes: Optional. Maximum total size of cached responses. Default: 64 MiB
+        :param ttls: Optional. See :py:class:`ResponseCache`
+        """
+        super().__init__(ttls)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {**super().stats, "entries": len(self), "bytes": self.size}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _load(self, key: str) -> tuple[float, bytes] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def _store(self, key: str, value: bytes, expires_at: float) -> None:
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (expires_at, value)
+            self.size += len(value)
+            while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: str) -> None:
+        _, value = self._entries.pop(key)
+        self.size -= len(value)
+
+
+class SQLiteCache(ResponseCache):
+    """
+    Persistent cache in a local SQLite database, which can be shared by several processes,
+    such as the workers of a web server, so that new processes start with a warm cache.
+    Responses are compressed with zlib::
+
+        ytmusic = YTMusic(cache=SQLiteCache("/var/cache/ytmusicapi.sqlite"))
+
+    Every ``purge_interval`` seconds, a process writing to the cache deletes expired responses
+    and, beyond ``max_entries`` or ``max_bytes``, the responses expiring first, in a background thread.
+    The asynchronous methods of :py:class:`YTMusic` access the database in a worker thread,
+    so that waiting for the lock of another process doesn't block the event loop.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        compression_level: int = CACHE_COMPRESSION_LEVEL,
+        ttls: dict[str, float] | None = None,
+        max_entries: int | None = None,
+        max_bytes: int | None = CACHE_SQLITE_MAX_BYTES,
+        purge_interval: float = CACHE_PURGE_INTERVAL,
+    ):
+        """
+        :param path: Path to the database file. It is created if it does not exist.
+        :param compression_level: Optional. zlib compression level from 0 to 9. Default: 6
+        :param ttls: Optional. See :py:class:`ResponseCache`
+        :param max_entries: Optional. Maximum number of cached responses. Default: unlimited
+        :param max_bytes: Optional. Maximum total size of compressed responses, or None for no limit.
+          Default: 256 MiB
+        :param purge_interval: Optional. Seconds between purges. Default: 300
+        """
+        super().__init__(ttls)
+        self.path = Path(path)
+        self.compression_level = compression_level
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.purge_interval = purge_interval
+        self._next_purge = 0.0
+        self._purge_thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        self._pid = 0
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, expires_at REAL, value BLOB)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at)")
+        self.purge()
+
+    def __len__(self) -> int:
+        with self._lock:
+            count: int = self._connect().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        return count
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {**super().stats, "entries": len(self)}
+
+    def purge(self) -> None:
+        """Deletes expired responses, then the responses expiring first beyond the size limits"""
+        self._next_purge = time.monotonic() + self.purge_interval
+        with self._lock:
+            connection = self._connect()
+            connection.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+            if self.max_entries is not None:
+                connection.execute(
+                    "DELETE FROM responses WHERE key NOT IN "
+                    "(SELECT key FROM responses ORDER BY expires_at DESC LIMIT ?)",
+                    (self.max_entries,),
+                )
+            if self.max_bytes is not None:
+                connection.execute(
+                    "DELETE FROM responses WHERE key IN (SELECT key FROM "
+                    "(SELECT key, SUM(LENGTH(value)) OVER (ORDER BY expires_at DESC, key) AS total "
+                    "FROM responses) WHERE total > ?)",
+                    (self.max_bytes,),
+                )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connect().execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """returns the connection of this process, a connection inherited through fork is not reused"""
+        if self._connection is None or self._pid != os.getpid():
+            # autocommit, so that every statement is a short transaction of its own
+            self._connection = sqlite3.connect(
+                self.path, timeout=CACHE_LOCK_TIMEOUT, isolation_level=None, check_same_thread=False
+            )
+            # concurrent readers don't block the writer and vice versa
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._pid = os.getpid()
+        return self._connection
+
+    def _load(self, key: str) -> tuple[float, bytes] | None:
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT expires_at, value FROM responses WHERE key = ? AND expires_at > ?",
+                    (key, time.time()),
+                )
+                .fetchone()
+            )
+        if row is None:
+            return None
+        return row[0], zlib.decompress(row[1])
+
+    def _store(self, key: str, value: bytes, expires_at: float) -> None:
+        compressed = zlib.compress(value, self.compression_level)
+        if self.max_bytes is not None and len(compressed) > self.max_bytes:
+            return
+        with self._lock:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO responses (key, expires_at, value) VALUES (?, ?, ?)",
+                (key, expires_at, compressed),
+            )
+        if time.monotonic() >= self._next_purge:
+            self._next_purge = time.monotonic() + self.purge_interval
+            self._purge_thread = threading.Thread(
+                target=self.purge, name="ytmusicapi-cache-purge", daemon=True
+            )
+            self._purge_thread.start()
+
+    async def _aload(self, key: str) -> tuple[float, bytes] | None:
+        return await asyncio.to_thread(self._load, key)
+
+    async def _astore(self, key: str, value: bytes, expires_at: float) -> None:
+        await asyncio.to_thread(self._store, key, value, expires_at)
+
+
+class TieredCache(ResponseCache):
+    """
+    Combines a fast cache with a slower, larger or shared one. Responses found only in the second
+    tier are copied to the first one for the remainder of their time to live::
+
+        cache = TieredCache(MemoryCache(), SQLiteCache("/var/cache/ytmusicapi.sqlite"))
+        ytmusic = YTMusic(cache=cache)
+
+    The time to live policies of the tiers are ignored in favour of ``ttls``.
+    """
+
+    def __init__(self, l1: ResponseCache, l2: ResponseCache, ttls: dict[str, float] | None = None):
+        """
+        :param l1: First tier, usually a :py:class:`MemoryCache`
+        :param l2: Second tier, usually a :py:class:`SQLiteCache`
+        :param ttls: Optional. See :py:class:`ResponseCache`
+        """
+        super().__init__(ttls)
+        self.l1 = l1
+        self.l2 = l2
+        self.l2_hits = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {**super().stats, "l2_hits": self.l2_hits}
+
+    def _load(self, key: str) -> tuple[float, bytes] | None:
+        entry = self.l1._load(key)
+        if entry is None:
+            entry = self.l2._load(key)
+            if entry is not None:
+                self.l2_hits += 1
+                self.l1._store(key, entry[1], entry[0])
+        return entry
+
+    def _store(self, key: str, value: bytes, expires_at: float) -> None:
+        self.l1._store(key, value, expires_at)
+        self.l2._store(key, value, expires_at)
+
+    async def _aload(self, key: str) -> tuple[float, bytes] | None:
+        entry = await self.l1._aload(key)
+        if entry is None:
+            entry = await self.l2._aload(key)
+            if entry is not None:
+                self.l2_hits += 1
+                await self.l1._astore(key, entry[1], entry[0])
+        return entry
+
+    async def _astore(self, key: str, value: bytes, expires_at: float) -> None:
+        await self.l1._astore(key, value, expires_at)
+        await self.l2._astore(key, value, expires_at)
@@ -0,0 +1,125 @@
+import asyncio
+import time
+from collections import deque
+
+from ytmusicapi.constants import (
+    CONCURRENCY_BACKOFF,
+    CONCURRENCY_INITIAL,
+    CONCURRENCY_MAX,
+    CONCURRENCY_MAX_LATENCY,
+    CONCURRENCY_WINDOW,
+)
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Limits the number of concurrent asynchronous requests and adapts the limit to the
+    throughput the server currently sustains, using additive increase, multiplicative decrease (AIMD)::
+
+        limiter = AdaptiveConcurrencyLimiter(max_limit=50)
+        ytmusic = YTMusic(concurrency_limiter=limiter)
+        songs = await asyncio.gather(*(ytmusic.get_song(videoId) for videoId in videoIds))
+        print(limiter.limit)
+
+    The limit grows by one per successful request until the first sign of overload (slow start),
+    afterwards by about one per round of ``limit`` successful requests. It is multiplied by ``backoff``
+    after a 429 or 5xx response, a connection error, or when the 95th percentile of the latency of
+    recent requests exceeds ``max_latency``. It is decreased at most once per 95th percentile latency,
+    so that the responses to requests sent before a decrease don't decrease it again.
+    Waiting requests are started in the order they arrived.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = CONCURRENCY_INITIAL,
+        min_limit: int = 1,
+        max_limit: int = CONCURRENCY_MAX,
+        max_latency: float = CONCURRENCY_MAX_LATENCY,
+        backoff: float = CONCURRENCY_BACKOFF,
+        window: int = CONCURRENCY_WINDOW,
+    ):
+        """
+        :param initial_limit: Optional. Number of concurrent requests to start with. Default: 10
+        :param min_limit: Optional. Lower bound of the limit. Default: 1
+        :param max_limit: Optional. Upper bound of the limit. Default: 100
+        :param max_latency: Optional. Highest healthy 95th percentile latency in seconds. Default: 2
+        :param backoff: Optional. Factor applied to the limit on overload. Default: 0.5
+        :param window: Optional. Number of recent requests used for the latency percentile. Default: 50
+        """
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.max_latency = max_latency
+        self.backoff = backoff
+        self.in_flight = 0
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._slow_start = True
+        self._last_decrease = float("-inf")
+
+    @property
+    def limit(self) -> int:
+        """Current maximum number of concurrent requests"""
+        return int(self._limit)
+
+    @property
+    def latency(self) -> float:
+        """95th percentile latency of recent requests in seconds"""
+        if not self._latencies:
+            return 0.0
+        latencies = sorted(self._latencies)
+        return latencies[int(0.95 * (len(latencies) - 1))]
+
+    @property
+    def stats(self) -> dict[str, float]:
+        return {
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "waiting": len(self._waiters),
+            "latency": self.latency,
+        }
+
+    async def acquire(self) -> None:
+        """Waits until a request may be started"""
+        if self.in_flight < self.limit and not self._waiters:
+            self.in_flight += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.in_flight -= 1  # the slot was handed over just before the cancellation
+                self._wake_waiters()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self, latency: float | None = None, overloaded: bool = False) -> None:
+        """
+        Ends a request and adapts the limit to its outcome.
+
+        :param latency: Optional. Duration of the request in seconds, None if it was aborted
+        :param overloaded: Optional. Whether the response indicated that the server is overloaded
+        """
+        self.in_flight -= 1
+        if latency is not None:
+            self._latencies.append(latency)
+        if overloaded or (latency is not None and self.latency > self.max_latency):
+            now = time.monotonic()
+            if now - self._last_decrease > self.latency:
+                self._last_decrease = now
+                self._slow_start = False
+                self._limit = max(self.min_limit, self._limit * self.backoff)
+        elif latency is not None:
+            increase = 1 if self._slow_start else 1 / self._limit
+            self._limit = min(self.max_limit, self._limit + increase)
+        self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self.in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
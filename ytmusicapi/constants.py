@@ -18,7 +18,70 @@ SUPPORTED_LOCATIONS = {
     "TN", "TR", "TW", "TZ", "UA", "UG", "US", "UY", "VE", "VN", "YE", "ZA", "ZW"
 }
 # fmt: on
+USER_CONTEXT_KEYS = {"onBehalfOfUser"}
 OAUTH_SCOPE = "https://www.googleapis.com/auth/youtube"
 OAUTH_CODE_URL = "https://www.youtube.com/o/oauth2/device/code"
 OAUTH_TOKEN_URL = "https://oauth2.googleapis.com/token"
 OAUTH_USER_AGENT = USER_AGENT + " Cobalt/Version"
+OAUTH_RENEWAL_MARGIN = 300  # seconds before expiry at which tokens are renewed in the background
+OAUTH_RENEWAL_RETRY = 30
+ASYNC_REQUEST_TIMEOUT = 30
+ASYNC_CONNECTOR_OPTIONS = {
+    "limit": 100,  # total simultaneous connections
+    "limit_per_host": 30,  # almost all traffic goes to music.youtube.com
+    "keepalive_timeout": 60,  # reuse TLS connections between bursts of requests
+    "ttl_dns_cache": 300,
+}
+# endpoints without side effects, concurrent identical requests to them are coalesced
+IDEMPOTENT_ENDPOINTS = {"browse", "next", "player", "search", "music/get_search_suggestions"}
+RETRY_MAX_ATTEMPTS = 3
+RETRY_BACKOFF = 0.5
+RETRY_MAX_BACKOFF = 8
+RETRY_BUDGET = 30
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+RATE_LIMIT_BURST = 5
+CONCURRENCY_INITIAL = 10
+CONCURRENCY_MAX = 100  # the connection limit of ASYNC_CONNECTOR_OPTIONS
+CONCURRENCY_MAX_LATENCY = 2
+CONCURRENCY_BACKOFF = 0.5
+CONCURRENCY_WINDOW = 50
+PROXY_FAILURE_THRESHOLD = 3
+PROXY_QUARANTINE = 30
+PROXY_MAX_QUARANTINE = 600
+PROXY_EWMA_WEIGHT = 0.2  # weight of the latest request in the moving averages of latency and errors
+PROXY_DEFAULT_LATENCY = 1.0  # assumed latency in seconds while no proxy has completed a request
+POOL_FAILURE_STATUSES = {401, 429}  # responses that take an account out of rotation
+POOL_QUARANTINE = 60
+POOL_MAX_QUARANTINE = 900
+HEDGE_PERCENTILE = 0.95
+HEDGE_DELAY = 1
+HEDGE_MIN_DELAY = 0.05
+HEDGE_WINDOW = 100
+BULK_CONCURRENCY = 20  # default number of simultaneous requests of bulk methods such as get_songs
+LYRICS_NEGATIVE_TTL = 24 * 3600  # lyrics are rarely added to a song after its release
+LYRICS_NEGATIVE_CACHE_SIZE = 100_000
+VISITOR_ID_TTL = 24 * 3600
+VISITOR_ID_CACHE_KEY = "visitor_id"
+BASEJS_URL_TTL = 3600  # the base.js URL is checked for updates hourly, in the background
+BASEJS_URL_CACHE_KEY = "basejs_url"
+SIGNATURE_TIMESTAMP_TTL = 30 * 24 * 3600  # by base.js URL, which changes with its content
+SIGNATURE_TIMESTAMP_RETRY = 60  # seconds until a failed refresh is retried
+SIGNATURE_TIMESTAMP_CACHE_KEY = "signatureTimestamp:{}"
+AUTHORIZATION_CACHE_SIZE = 256  # SAPISIDHASHes of the current second, one per account
+SCAN_CHUNK_SIZE = 16 * 1024  # pages are scanned in chunks and only downloaded up to the match
+SCAN_OVERLAP = 1024  # longer than any match, so that it can span two chunks
+CACHE_MAX_ENTRIES = 1024
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+CACHE_COMPRESSION_LEVEL = 6
+CACHE_LOCK_TIMEOUT = 10  # seconds to wait for another process writing to a SQLiteCache
+CACHE_SQLITE_MAX_BYTES = 256 * 1024 * 1024
+CACHE_PURGE_INTERVAL = 300  # seconds between purges of a SQLiteCache by a process writing to it
+# time to live of cached responses in seconds by endpoint/browseId prefix, see ResponseCache
+CACHE_TTLS = {
+    "browse/MPRE": 6 * 3600,  # albums
+    "browse/UC": 6 * 3600,  # artists
+    "browse/MPLYt": 24 * 3600,  # lyrics
+    "browse/FEmusic_charts": 15 * 60,
+    "browse/FEmusic_home": 5 * 60,
+    "player": 3600,  # keyed by signatureTimestamp, streaming URLs expire after 6 hours
+}
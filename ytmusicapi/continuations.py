@@ -1,8 +1,10 @@
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable, Iterator
 from typing import Any
 
 from ytmusicapi.navigation import nav
 from ytmusicapi.type_alias import (
+    AsyncRequestFuncBodyType,
+    AsyncRequestFuncType,
     JsonDict,
     JsonList,
     ParseFuncDictType,
@@ -19,6 +21,33 @@ def get_continuation_token(results: JsonList) -> str | None:
     return nav(results[-1], CONTINUATION_TOKEN, True)
 
 
+def iter_continuations_2025(
+    results: JsonDict,
+    limit: int | None,
+    request_func: RequestFuncBodyType,
+    parse_func: ParseFuncType,
+) -> Iterator[JsonList]:
+    """
+    Yields the parsed contents of each continuation page as soon as it is retrieved.
+    The next page is only requested when the consumer asks for it.
+    See :py:func:`get_continuations_2025` for the parameters.
+    """
+    count = 0
+    continuation_token = get_continuation_token(results["contents"])
+    while continuation_token and (limit is None or count < limit):
+        response = request_func({"continuation": continuation_token})
+        continuation_items = nav(response, CONTINUATION_ITEMS, True)
+        if not continuation_items:
+            break
+
+        contents = parse_func(continuation_items)
+        if len(contents) == 0:
+            break
+        count += len(contents)
+        continuation_token = get_continuation_token(continuation_items)
+        yield contents
+
+
 def get_continuations_2025(
     results: JsonDict,
     limit: int | None,
@@ -26,9 +55,23 @@ def get_continuations_2025(
     parse_func: ParseFuncType,
 ) -> JsonList:
     items: JsonList = []
+    for contents in iter_continuations_2025(results, limit, request_func, parse_func):
+        items.extend(contents)
+
+    return items
+
+
+async def aiter_continuations_2025(
+    results: JsonDict,
+    limit: int | None,
+    request_func: AsyncRequestFuncBodyType,
+    parse_func: ParseFuncType,
+) -> AsyncIterator[JsonList]:
+    """Same as :py:func:`iter_continuations_2025`, but awaits ``request_func``"""
+    count = 0
     continuation_token = get_continuation_token(results["contents"])
-    while continuation_token and (limit is None or len(items) < limit):
-        response = request_func({"continuation": continuation_token})
+    while continuation_token and (limit is None or count < limit):
+        response = await request_func({"continuation": continuation_token})
         continuation_items = nav(response, CONTINUATION_ITEMS, True)
         if not continuation_items:
             break
@@ -36,8 +79,21 @@ def get_continuations_2025(
         contents = parse_func(continuation_items)
         if len(contents) == 0:
             break
-        items.extend(contents)
+        count += len(contents)
         continuation_token = get_continuation_token(continuation_items)
+        yield contents
+
+
+async def get_continuations_2025_async(
+    results: JsonDict,
+    limit: int | None,
+    request_func: AsyncRequestFuncBodyType,
+    parse_func: ParseFuncType,
+) -> JsonList:
+    """Same as :py:func:`get_continuations_2025`, but awaits ``request_func``"""
+    items: JsonList = []
+    async for contents in aiter_continuations_2025(results, limit, request_func, parse_func):
+        items.extend(contents)
 
     return items
 
@@ -56,6 +112,20 @@ def get_reloadable_continuations(
     )
 
 
+async def get_reloadable_continuations_async(
+    results: JsonDict,
+    continuation_type: str,
+    limit: int | None,
+    request_func: AsyncRequestFuncType,
+    parse_func: ParseFuncType,
+) -> JsonList:
+    """Same as :py:func:`get_reloadable_continuations`, but awaits ``request_func``"""
+    additionalParams = get_reloadable_continuation_params(results)
+    return await get_continuations_async(
+        results, continuation_type, limit, request_func, parse_func, additionalParams=additionalParams
+    )
+
+
 def get_continuations(
     results: JsonDict,
     continuation_type: str,
@@ -80,7 +150,30 @@ def get_continuations(
     :return: list of parsed continuation results
     """
     items: JsonList = []
-    while "continuations" in results and (limit is None or len(items) < limit):
+    for contents in iter_continuations(
+        results, continuation_type, limit, request_func, parse_func, ctoken_path, additionalParams
+    ):
+        items.extend(contents)
+
+    return items
+
+
+def iter_continuations(
+    results: JsonDict,
+    continuation_type: str,
+    limit: int | None,
+    request_func: RequestFuncType,
+    parse_func: ParseFuncType,
+    ctoken_path: str = "",
+    additionalParams: str | None = None,
+) -> Iterator[JsonList]:
+    """
+    Yields the parsed contents of each continuation page as soon as it is retrieved.
+    The next page is only requested when the consumer asks for it.
+    See :py:func:`get_continuations` for the parameters.
+    """
+    count = 0
+    while "continuations" in results and (limit is None or count < limit):
         additional_params = additionalParams or get_continuation_params(results, ctoken_path)
         response = request_func(additional_params)
         if "continuationContents" in response:
@@ -90,11 +183,57 @@ def get_continuations(
         contents = get_continuation_contents(results, parse_func)
         if len(contents) == 0:
             break
+        count += len(contents)
+        yield contents
+
+
+async def get_continuations_async(
+    results: JsonDict,
+    continuation_type: str,
+    limit: int | None,
+    request_func: AsyncRequestFuncType,
+    parse_func: ParseFuncType,
+    ctoken_path: str = "",
+    additionalParams: str | None = None,
+) -> JsonList:
+    """
+    Same as :py:func:`get_continuations`, but awaits ``request_func``,
+    so that continuations can be retrieved without blocking the event loop.
+    """
+    items: JsonList = []
+    async for contents in aiter_continuations(
+        results, continuation_type, limit, request_func, parse_func, ctoken_path, additionalParams
+    ):
         items.extend(contents)
 
     return items
 
 
+async def aiter_continuations(
+    results: JsonDict,
+    continuation_type: str,
+    limit: int | None,
+    request_func: AsyncRequestFuncType,
+    parse_func: ParseFuncType,
+    ctoken_path: str = "",
+    additionalParams: str | None = None,
+) -> AsyncIterator[JsonList]:
+    """Same as :py:func:`iter_continuations`, but awaits ``request_func``"""
+    count = 0
+    while "continuations" in results and (limit is None or count < limit):
+        additional_params = additionalParams or get_continuation_params(results, ctoken_path)
+        response = await request_func(additional_params)
+        if "continuationContents" in response:
+            results = response["continuationContents"][continuation_type]
+        else:
+            break
+        contents = get_continuation_contents(results, parse_func)
+        if len(contents) == 0:
+            break
+        count += len(contents)
+        yield contents
+
+
 def get_validated_continuations(
     results: JsonDict,
     continuation_type: str,
@@ -121,6 +260,33 @@ def get_validated_continuations(
     return items
 
 
+async def get_validated_continuations_async(
+    results: JsonDict,
+    continuation_type: str,
+    limit: int,
+    per_page: int,
+    request_func: AsyncRequestFuncType,
+    parse_func: ParseFuncType,
+    ctoken_path: str = "",
+) -> JsonList:
+    """Same as :py:func:`get_validated_continuations`, but awaits ``request_func``"""
+    items: JsonList = []
+    while "continuations" in results and len(items) < limit:
+        additionalParams = get_continuation_params(results, ctoken_path)
+        wrapped_parse_func = lambda raw_response: get_parsed_continuation_items(
+            raw_response, parse_func, continuation_type
+        )
+        validate_func = lambda parsed: validate_response(parsed, per_page, limit, len(items))
+
+        response = await resend_request_until_parsed_response_is_valid_async(
+            request_func, additionalParams, wrapped_parse_func, validate_func, 3
+        )
+        results = response["results"]
+        items.extend(response["parsed"])
+
+    return items
+
+
 def get_parsed_continuation_items(
     response: JsonDict, parse_func: ParseFuncType, continuation_type: str
 ) -> JsonDict:
@@ -175,6 +341,26 @@ def resend_request_until_parsed_response_is_valid(
     return parsed_object
 
 
+async def resend_request_until_parsed_response_is_valid_async(
+    request_func: AsyncRequestFuncType,
+    request_additional_params: str,
+    parse_func: ParseFuncDictType,
+    validate_func: Callable[[dict[str, Any]], bool],
+    max_retries: int,
+) -> JsonDict:
+    response = await request_func(request_additional_params)
+    parsed_object = parse_func(response)
+    retry_counter = 0
+    while not validate_func(parsed_object) and retry_counter < max_retries:
+        response = await request_func(request_additional_params)
+        attempt = parse_func(response)
+        if len(attempt["parsed"]) > len(parsed_object["parsed"]):
+            parsed_object = attempt
+        retry_counter += 1
+
+    return parsed_object
+
+
 def validate_response(response: JsonDict, per_page: int, limit: int, current_count: int) -> bool:
     remaining_items_count = limit - current_count
     expected_items_count = min(per_page, remaining_items_count)
@@ -14,3 +14,14 @@ class YTMusicUserError(YTMusicError):
 
 class YTMusicServerError(YTMusicError):
     """error caused by the YouTube Music backend"""
+
+    def __init__(
+        self, *args: object, status: int | None = None, endpoint: str | None = None, attempts: int = 1
+    ):
+        super().__init__(*args)
+        #: HTTP status code returned by the server, if any
+        self.status = status
+        #: endpoint the failed request was sent to, if any
+        self.endpoint = endpoint
+        #: number of times the request was sent
+        self.attempts = attempts
@@ -0,0 +1,58 @@
+from collections import deque
+
+from ytmusicapi.constants import HEDGE_DELAY, HEDGE_MIN_DELAY, HEDGE_PERCENTILE, HEDGE_WINDOW
+
+
+class HedgingPolicy:
+    """
+    Policy for hedging asynchronous requests to idempotent endpoints, such as browse, player or search:
+    if a request has not been answered after a high percentile of recent latencies, a duplicate is
+    sent, through another proxy of the proxy pool if there is one and the request was not given an
+    explicit ``proxy``. The first response is used and the other request is cancelled::
+
+        ytmusic = YTMusic(hedging=HedgingPolicy(percentile=0.9))
+
+    By construction about ``1 - percentile`` of requests are duplicated.
+    """
+
+    def __init__(
+        self,
+        percentile: float = HEDGE_PERCENTILE,
+        delay: float = HEDGE_DELAY,
+        min_delay: float = HEDGE_MIN_DELAY,
+        window: int = HEDGE_WINDOW,
+    ):
+        """
+        :param percentile: Optional. Percentile of recent latencies after which a request is hedged.
+          Default: 0.95
+        :param delay: Optional. Delay in seconds used until ``window`` latencies have been recorded.
+          Default: 1
+        :param min_delay: Optional. Lower bound of the delay in seconds. Default: 0.05
+        :param window: Optional. Number of recent latencies the percentile is computed from. Default: 100
+        """
+        self.percentile = percentile
+        self.initial_delay = delay
+        self.min_delay = min_delay
+        self.hedged = 0
+        self.won = 0
+        self._latencies: deque[float] = deque(maxlen=window)
+
+    @property
+    def delay(self) -> float:
+        """Seconds after which an unanswered request is hedged"""
+        if len(self._latencies) < (self._latencies.maxlen or 0):
+            return self.initial_delay
+        latencies = sorted(self._latencies)
+        return max(self.min_delay, latencies[int(self.percentile * (len(latencies) - 1))])
+
+    @property
+    def stats(self) -> dict[str, float]:
+        """Current delay, number of hedged requests and number of them won by the duplicate"""
+        return {"delay": self.delay, "hedged": self.hedged, "won": self.won}
+
+    def record(self, latency: float) -> None:
+        """
+        Records the latency of a first attempt. If it was cancelled because the duplicate won,
+        the time until the cancellation is recorded as a lower bound.
+        """
+        self._latencies.append(latency)
@@ -1,16 +1,22 @@
+import gettext
 import json
 import locale
 import re
 import time
 import unicodedata
-from collections.abc import Callable
+from collections.abc import AsyncIterable, Iterable
+from functools import lru_cache
 from hashlib import sha1
 from http.cookies import SimpleCookie
+from pathlib import Path
+from typing import Any
 
+import orjson
 from requests import Response
 from requests.structures import CaseInsensitiveDict
 
 from ytmusicapi.constants import *
+from ytmusicapi.exceptions import YTMusicError, YTMusicServerError
 from ytmusicapi.type_alias import JsonDict
 
 
@@ -39,14 +45,156 @@ def initialize_context() -> JsonDict:
     }
 
 
-def get_visitor_id(request_func: Callable[[str], Response]) -> dict[str, str]:
-    response = request_func(YTM_DOMAIN)
-    matches = re.findall(r"ytcfg\.set\s*\(\s*({.+?})\s*\)\s*;", response.text)
-    visitor_id = ""
-    if len(matches) > 0:
-        ytcfg = json.loads(matches[0])
-        visitor_id = ytcfg.get("VISITOR_DATA")
-    return {"X-Goog-Visitor-Id": visitor_id}
+def build_context(base: JsonDict, overrides: JsonDict) -> JsonDict:
+    """
+    Returns a copy of a request context with client and user fields replaced.
+    The base context is not modified.
+
+    :param base: context as returned by :py:func:`initialize_context`
+    :param overrides: client fields (``clientName``, ``clientVersion``, ``hl``, ``gl``)
+        and user fields (``onBehalfOfUser``) to replace
+    """
+    client = dict(base["context"]["client"])
+    user = dict(base["context"]["user"])
+    for key, value in overrides.items():
+        if key in USER_CONTEXT_KEYS:
+            user[key] = value
+        else:
+            client[key] = value
+    return {**base, "context": {**base["context"], "client": client, "user": user}}
+
+
+def json_loads(data: bytes | bytearray | memoryview | str) -> Any:
+    """
+    Decodes a JSON document, preferably straight from the raw response bytes.
+    Uses orjson and falls back to the standard library decoder for documents
+    orjson rejects, such as those containing ``NaN``.
+
+    :param data: JSON document
+    :return: decoded document
+    """
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+
+def is_overloaded(status: int) -> bool:
+    """Whether an HTTP status code indicates that the server or a proxy is overloaded"""
+    return status == 429 or status >= 500
+
+
+def get_server_error(
+    endpoint: str, status: int, reason: str | None, content: bytes, attempts: int
+) -> YTMusicServerError:
+    """
+    Builds the error for a failed API request, including the message returned by the server.
+
+    :param endpoint: endpoint the request was sent to
+    :param status: HTTP status code of the response
+    :param reason: HTTP reason phrase of the response
+    :param content: body of the response
+    :param attempts: number of times the request was sent
+    """
+    message = f"Server returned HTTP {status}: {reason}.\n"
+    try:
+        error = json_loads(content).get("error", {}).get("message", "")
+    except (ValueError, AttributeError):  # not a JSON error response, e.g. from a proxy
+        error = ""
+    return YTMusicServerError(message + error, status=status, endpoint=endpoint, attempts=attempts)
+
+
+def encode_context(context: JsonDict) -> bytes:
+    """
+    Pre-encodes a request context as a JSON object member list, ready to be merged by :py:func:`encode_body`
+
+    :param context: context as returned by :py:func:`initialize_context` or :py:func:`build_context`
+    :return: the members of the encoded context without the enclosing braces
+    """
+    return orjson.dumps(context)[1:-1]
+
+
+def encode_body(body: JsonDict, encoded_context: bytes) -> bytes:
+    """
+    Encodes a request body merged with a pre-encoded context, without modifying the body.
+
+    :param body: endpoint specific payload
+    :param encoded_context: context as returned by :py:func:`encode_context`
+    :return: JSON request body
+    """
+    if "context" in body:
+        # the context takes precedence, like dict.update would
+        return orjson.dumps({**body, **json_loads(b"{" + encoded_context + b"}")})
+    encoded_body = orjson.dumps(body)
+    if encoded_body == b"{}":
+        return b"{" + encoded_context + b"}"
+    return encoded_body[:-1] + b"," + encoded_context + b"}"
+
+
+def load_translation(language: str) -> gettext.GNUTranslations:
+    locale_dir = Path(__file__).parent.resolve() / "locales"
+    return gettext.translation("base", localedir=locale_dir, languages=[language])
+
+
+# patterns scanned for in pages and scripts, each match ends with a delimiter so that a value
+# cut off at the end of a chunk is never matched, see scan_chunks
+VISITOR_ID_PATTERN = re.compile(rb'"VISITOR_DATA"\s*:\s*"([^"]*)"')
+BASEJS_PATH_PATTERN = re.compile(rb'jsUrl"\s*:\s*"([^"]+)"')
+SIGNATURE_TIMESTAMP_PATTERN = re.compile(rb"signatureTimestamp[:=](\d+)\D")
+# the initial data of the playlist page is embedded as an escaped string
+ALBUM_BROWSE_ID_PATTERN = re.compile(rb'(?:"|\\x22|\\u0022)(MPRE[\w-]+)(?:"|\\x22|\\u0022)')
+
+
+def scan_chunks(chunks: Iterable[bytes], pattern: re.Pattern[bytes]) -> re.Match[bytes] | None:
+    """
+    Searches a response body chunk by chunk and stops at the first match,
+    without keeping more than a chunk and the end of the previous one in memory.
+    """
+    buffer = b""
+    for chunk in chunks:
+        buffer = buffer[-SCAN_OVERLAP:] + chunk
+        if match := pattern.search(buffer):
+            return match
+    return None
+
+
+async def ascan_chunks(chunks: AsyncIterable[bytes], pattern: re.Pattern[bytes]) -> re.Match[bytes] | None:
+    """Asynchronous version of :py:func:`scan_chunks`"""
+    buffer = b""
+    async for chunk in chunks:
+        buffer = buffer[-SCAN_OVERLAP:] + chunk
+        if match := pattern.search(buffer):
+            return match
+    return None
+
+
+def scan_response(response: Response, pattern: re.Pattern[bytes]) -> re.Match[bytes] | None:
+    """Scans a streamed response with :py:func:`scan_chunks` and closes it, the rest is not downloaded"""
+    try:
+        return scan_chunks(response.iter_content(SCAN_CHUNK_SIZE), pattern)
+    finally:
+        response.close()
+
+
+def parse_visitor_id(match: re.Match[bytes] | None) -> str:
+    """Returns the visitor id matched by ``VISITOR_ID_PATTERN``, or an empty string"""
+    return match.group(1).decode() if match else ""
+
+
+def parse_basejs_path(match: re.Match[bytes] | None) -> str:
+    """Returns the path of the `base.js` player script matched by ``BASEJS_PATH_PATTERN``"""
+    if match is None:
+        raise YTMusicError("Could not identify the URL for base.js player.")
+    return match.group(1).decode()
+
+
+def parse_signature_timestamp(match: re.Match[bytes] | None) -> int:
+    """Returns the ``signatureTimestamp`` matched by ``SIGNATURE_TIMESTAMP_PATTERN``"""
+    if match is None:
+        raise YTMusicError("Unable to identify the signatureTimestamp.")
+    return int(match.group(1))
 
 
 def sapisid_from_cookie(raw_cookie: str) -> str:
@@ -62,10 +210,15 @@ def get_authorization(auth: str) -> str:
 
     :param auth: SAPISID and Origin value from headers concatenated with space
     """
+    return _get_authorization(auth, int(time.time()))
+
+
+@lru_cache(maxsize=AUTHORIZATION_CACHE_SIZE)
+def _get_authorization(auth: str, unix_timestamp: int) -> str:
+    """SAPISIDHASH of a second, computed once for all requests sent in it"""
     sha_1 = sha1()
-    unix_timestamp = str(int(time.time()))
-    sha_1.update((unix_timestamp + " " + auth).encode("utf-8"))
-    return "SAPISIDHASH " + unix_timestamp + "_" + sha_1.hexdigest()
+    sha_1.update((str(unix_timestamp) + " " + auth).encode("utf-8"))
+    return "SAPISIDHASH " + str(unix_timestamp) + "_" + sha_1.hexdigest()
 
 
 def to_int(string: str) -> int:
@@ -1,13 +1,13 @@
 """protocol that defines the functions available to mixins"""
 
-from collections.abc import Iterator
+from collections.abc import Iterator, Mapping
 from contextlib import contextmanager
 from typing import Protocol
 
 from requests import Response
-from requests.structures import CaseInsensitiveDict
 
 from ytmusicapi.auth.types import AuthType
+from ytmusicapi.cache import MemoryCache, ResponseCache
 from ytmusicapi.parsers.i18n import Parser
 from ytmusicapi.type_alias import JsonDict
 
@@ -17,23 +17,41 @@ class MixinProtocol(Protocol):
 
     auth_type: AuthType
 
-    parser: Parser
+    @property
+    def parser(self) -> Parser:
+        """parser for the language of the current request context"""
 
     proxies: dict[str, str] | None
 
+    #: browseIds known to have no lyrics, see :py:func:`get_lyrics_many`
+    _missing_lyrics: MemoryCache
+
+    #: signatureTimestamps by base.js URL, see :py:func:`get_signatureTimestamp`
+    _script_cache: ResponseCache
+
     def _check_auth(self) -> None:
         """checks if self has authentication"""
 
     def _send_request(self, endpoint: str, body: JsonDict, additionalParams: str = "") -> JsonDict:
         """for sending post requests to YouTube Music"""
 
-    def _send_get_request(self, url: str, params: JsonDict | None = None) -> Response:
+    async def _send_request_async(
+        self, endpoint: str, body: JsonDict, additionalParams: str = "", proxy: str | None = None
+    ) -> JsonDict:
+        """for sending post requests to YouTube Music from the event loop"""
+
+    def _send_get_request(
+        self, url: str, params: JsonDict | None = None, use_base_headers: bool = False, stream: bool = False
+    ) -> Response:
         """for sending get requests to YouTube Music"""
 
+    async def _get_signature_timestamp_async(self) -> int:
+        """signatureTimestamp of the current player script, refreshed in the background"""
+
     @contextmanager
     def as_mobile(self) -> Iterator[None]:
         """context-manager, that allows requests as the YouTube Music Mobile-App"""
 
     @property
-    def headers(self) -> CaseInsensitiveDict[str]:
+    def headers(self) -> Mapping[str, str]:
         """property for getting request headers"""
@@ -1,12 +1,63 @@
+import asyncio
 import re
+import unicodedata
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
 from datetime import date
-from typing import Literal
+from typing import Literal, TypeVar
 
 from ytmusicapi.exceptions import YTMusicUserError
 from ytmusicapi.models.content.enums import LikeStatus
+from ytmusicapi.parsers.playlists import validate_playlist_id
+from ytmusicapi.type_alias import JsonDict
 
 LibraryOrderType = Literal["a_to_z", "z_to_a", "recently_added"]
 
+T = TypeVar("T")
+
+
+async def aiter_as_completed(
+    keys: Iterable[str], request_func: Callable[[str], Awaitable[T]], concurrency: int
+) -> AsyncIterator[tuple[str, T | Exception]]:
+    """
+    Runs ``request_func`` once for every unique key with at most ``concurrency`` requests at a time.
+
+    :return: Async iterator over ``(key, result)`` in order of completion. If a request failed,
+        the result is the exception, so that one failure doesn't abort the others.
+    """
+    if concurrency < 1:
+        raise YTMusicUserError("concurrency must be at least 1.")
+    unique_keys = list(dict.fromkeys(keys))
+    pending = iter(unique_keys)
+    # bounded, so that workers pause while the consumer is busy
+    results: asyncio.Queue[tuple[str, T | Exception]] = asyncio.Queue(maxsize=concurrency)
+
+    async def worker() -> None:
+        for key in pending:
+            result: T | Exception
+            try:
+                result = await request_func(key)
+            except Exception as e:
+                result = e
+            await results.put((key, result))
+
+    workers = [asyncio.create_task(worker()) for _ in range(min(concurrency, len(unique_keys)))]
+    try:
+        for _ in unique_keys:
+            yield await results.get()
+    finally:
+        for task in workers:
+            task.cancel()
+
+
+def normalize_query(query: str) -> str:
+    """Normalizes unicode, case and whitespace of a search query"""
+    return " ".join(unicodedata.normalize("NFKC", query).casefold().split())
+
+
+def get_result_id(result: JsonDict) -> str | None:
+    """Returns the id identifying a search result across queries, if any"""
+    return result.get("videoId") or result.get("browseId") or result.get("playlistId")
+
 
 def prepare_like_endpoint(rating: str | LikeStatus) -> str:
     match rating:
@@ -60,3 +111,43 @@ def get_datestamp() -> int:
     """Returns the number of days since January 1, 1970.
     Currently only used for the signature timestamp in :py:func:`get_song`."""
     return (date.today() - date.fromtimestamp(0)).days
+
+
+def prepare_watch_playlist_body(
+    videoId: str | None, playlistId: str | None, radio: bool, shuffle: bool
+) -> JsonDict:
+    """Returns the request body for the ``next`` endpoint of a watch playlist"""
+    body: JsonDict = {
+        "enablePersistentPlaylistPanel": True,
+        "isAudioOnly": True,
+        "tunerSettingValue": "AUTOMIX_SETTING_NORMAL",
+    }
+    if not videoId and not playlistId:
+        raise YTMusicUserError("You must provide either a video id, a playlist id, or both")
+    if videoId:
+        body["videoId"] = videoId
+        if not playlistId:
+            playlistId = "RDAMVM" + videoId
+        if not (radio or shuffle):
+            body["watchEndpointMusicSupportedConfigs"] = {
+                "watchEndpointMusicConfig": {
+                    "hasPersistentPlaylistPanel": True,
+                    "musicVideoType": "MUSIC_VIDEO_TYPE_ATV",
+                }
+            }
+    if playlistId:
+        body["playlistId"] = validate_playlist_id(playlistId)
+
+    if shuffle and playlistId is not None:
+        body["params"] = "wAEB8gECKAE%3D"
+    if radio:
+        body["params"] = "wAEB"
+
+    return body
+
+
+def get_watch_playlist_ctoken_path(body: JsonDict) -> str:
+    """Regular playlists and albums use nextContinuationData, radios nextRadioContinuationData"""
+    playlist_id = body.get("playlistId", "")
+    is_playlist = playlist_id.startswith("PL") or playlist_id.startswith("OLA")
+    return "" if is_playlist else "Radio"
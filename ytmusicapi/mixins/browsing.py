@@ -1,13 +1,25 @@
-import re
-import warnings
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
 from typing import Literal, cast, overload
 
 from ytmusicapi.continuations import (
     get_continuations,
     get_reloadable_continuation_params,
+    iter_continuations,
+)
+from ytmusicapi.helpers import (
+    ALBUM_BROWSE_ID_PATTERN,
+    BASEJS_PATH_PATTERN,
+    BULK_CONCURRENCY,
+    LYRICS_NEGATIVE_TTL,
+    SIGNATURE_TIMESTAMP_CACHE_KEY,
+    SIGNATURE_TIMESTAMP_PATTERN,
+    SIGNATURE_TIMESTAMP_TTL,
+    YTM_DOMAIN,
+    parse_basejs_path,
+    parse_signature_timestamp,
+    scan_response,
+    sum_total_duration,
 )
-from ytmusicapi.helpers import YTM_DOMAIN, sum_total_duration
 from ytmusicapi.models.lyrics import LyricLine, Lyrics, TimedLyrics
 from ytmusicapi.parsers.albums import parse_album_header_2024
 from ytmusicapi.parsers.browsing import (
@@ -21,10 +33,10 @@ from ytmusicapi.parsers.library import parse_albums
 from ytmusicapi.parsers.playlists import parse_playlist_items
 from ytmusicapi.type_alias import JsonDict, JsonList, ParseFuncType, RequestFuncType
 
-from ..exceptions import YTMusicError, YTMusicUserError
+from ..exceptions import YTMusicUserError
 from ..navigation import *
 from ._protocol import MixinProtocol
-from ._utils import get_datestamp
+from ._utils import aiter_as_completed
 
 
 class BrowsingMixin(MixinProtocol):
@@ -295,6 +307,31 @@ class BrowsingMixin(MixinProtocol):
           except artists key is missing.
 
         """
+        albums: JsonList = []
+        for contents in self._iter_artist_albums_pages(channelId, params, limit, order):
+            albums.extend(contents)
+
+        return albums
+
+    def iter_artist_albums(
+        self, channelId: str, params: str, order: ArtistOrderType | None = None
+    ) -> Iterator[JsonDict]:
+        """
+        Lazily yields an artist's albums, singles or shows in the format of :py:func:`get_artist_albums`.
+        Each continuation page is only requested once the previous albums have been consumed.
+
+        :param channelId: browseId of the artist as returned by :py:func:`get_artist`
+        :param params: params obtained by :py:func:`get_artist`
+        :param order: Order of albums to return. Allowed values: ``Recency``, ``Popularity``, `Alphabetical order`. Default: Default order.
+        :return: Iterator over albums
+        """
+        for contents in self._iter_artist_albums_pages(channelId, params, None, order):
+            yield from contents
+
+    def _iter_artist_albums_pages(
+        self, channelId: str, params: str, limit: int | None, order: ArtistOrderType | None
+    ) -> Iterator[JsonList]:
+        """yields the parsed albums of the first page and each continuation page"""
         body = {"browseId": channelId, "params": params}
         endpoint = "browse"
         response = self._send_request(endpoint, body)
@@ -354,16 +391,15 @@ class BrowsingMixin(MixinProtocol):
 
         contents = nav(results, GRID_ITEMS, True) or nav(results, CAROUSEL_CONTENTS)
         albums = parse_albums(contents)
+        yield albums
 
         results = nav(results, GRID, True)
-        if "continuations" in results:
+        if results is not None:
             remaining_limit = None if limit is None else (limit - len(albums))
-            albums.extend(
-                get_continuations(results, "gridContinuation", remaining_limit, request_func, parse_func)
+            yield from iter_continuations(
+                results, "gridContinuation", remaining_limit, request_func, parse_func
             )
 
-        return albums
-
     def get_user(self, channelId: str) -> JsonDict:
         """
         Retrieve a user's page. A user may own videos or playlists.
@@ -479,18 +515,9 @@ class BrowsingMixin(MixinProtocol):
         :return: browseId (starting with ``MPREb_``)
         """
         params = {"list": audioPlaylistId}
-        response = self._send_get_request(YTM_DOMAIN + "/playlist", params)
-
-        with warnings.catch_warnings():
-            # merge this with statement with catch_warnings on Python>=3.11
-            warnings.simplefilter(action="ignore", category=DeprecationWarning)
-            decoded = response.text.encode("utf8").decode("unicode_escape")
-
-        matches = re.search(r"\"MPRE.+?\"", decoded)
-        browse_id = None
-        if matches:
-            browse_id = matches.group().strip('"')
-        return browse_id
+        response = self._send_get_request(YTM_DOMAIN + "/playlist", params, stream=True)
+        match = scan_response(response, ALBUM_BROWSE_ID_PATTERN)
+        return match.group(1).decode() if match else None
 
     def get_album(self, browseId: str) -> JsonDict:
         """
@@ -576,23 +603,72 @@ class BrowsingMixin(MixinProtocol):
 
         return album
 
-
-    async def get_song(self, session, videoId: str, signatureTimestamp: int | None = None, proxy = None) -> JsonDict:
+    async def get_song(
+        self, videoId: str, signatureTimestamp: int | None = None, proxy: str | None = None
+    ) -> JsonDict:
         endpoint = "player"
         if not signatureTimestamp:
-            signatureTimestamp = get_datestamp() - 1
+            signatureTimestamp = await self._get_signature_timestamp_async()
 
         params = {
             "playbackContext": {"contentPlaybackContext": {"signatureTimestamp": signatureTimestamp}},
             "video_id": videoId,
         }
-        response = await self._send_request_async(session, proxy, endpoint, params)
+        response = await self._send_request_async(endpoint, params, proxy=proxy)
         keys = ["videoDetails", "playabilityStatus", "streamingData", "microformat", "playbackTracking"]
         for k in list(response.keys()):
             if k not in keys:
                 del response[k]
         return response
 
+    async def aiter_songs(
+        self,
+        videoIds: Iterable[str],
+        signatureTimestamp: int | None = None,
+        concurrency: int = BULK_CONCURRENCY,
+        proxy: str | None = None,
+    ) -> AsyncIterator[tuple[str, JsonDict | Exception]]:
+        """
+        Fetches many songs with :py:func:`get_song` concurrently and yields them as they arrive.
+        Duplicate videoIds are fetched once. A failed request doesn't abort the others,
+        its exception is yielded instead of the song::
+
+            async for videoId, song in ytmusic.aiter_songs(videoIds, concurrency=50):
+                if isinstance(song, Exception):
+                    log.warning("%s failed: %s", videoId, song)
+                elif song["playabilityStatus"]["status"] == "OK":
+                    playable.add(videoId)
+
+        :param videoIds: Video ids
+        :param signatureTimestamp: Optional. Shared by all requests, see :py:func:`get_song`.
+            Default: the ``signatureTimestamp`` of the current player script
+        :param concurrency: Optional. Maximum number of simultaneous requests. Default: 20
+        :param proxy: Optional. Proxy URL for these requests
+        :return: Async iterator over ``(videoId, song)`` in order of completion
+        """
+        if not signatureTimestamp:
+            signatureTimestamp = await self._get_signature_timestamp_async()
+        request_func = lambda videoId: self.get_song(videoId, signatureTimestamp, proxy)
+        async for item in aiter_as_completed(videoIds, request_func, concurrency):
+            yield item
+
+    async def get_songs(
+        self,
+        videoIds: Iterable[str],
+        signatureTimestamp: int | None = None,
+        concurrency: int = BULK_CONCURRENCY,
+        proxy: str | None = None,
+    ) -> dict[str, JsonDict | Exception]:
+        """
+        Fetches many songs concurrently, see :py:func:`aiter_songs`.
+
+        :return: Dictionary of songs or exceptions by videoId, in order of completion
+        """
+        return {
+            videoId: song
+            async for videoId, song in self.aiter_songs(videoIds, signatureTimestamp, concurrency, proxy)
+        }
+
     def get_song_related(self, browseId: str) -> JsonList:
         if not browseId:
             raise YTMusicUserError("Invalid browseId provided.")
@@ -602,23 +678,29 @@ class BrowsingMixin(MixinProtocol):
         return parse_mixed_content(sections)
 
     @overload
-    async def get_lyrics(self, session, browseId: str, timestamps: Literal[False] = False, proxy = None) -> Lyrics | None:
+    async def get_lyrics(
+        self, browseId: str, timestamps: Literal[False] = False, proxy: str | None = None
+    ) -> Lyrics | None:
         """overload for mypy only"""
 
     @overload
-    async def get_lyrics(self, session, browseId: str, timestamps: Literal[True] = True, proxy = None) -> Lyrics | TimedLyrics | None:
+    async def get_lyrics(
+        self, browseId: str, timestamps: Literal[True] = True, proxy: str | None = None
+    ) -> Lyrics | TimedLyrics | None:
         """overload for mypy only"""
 
-    async def get_lyrics(self, session, browseId: str, timestamps: bool | None = False, proxy = None) -> Lyrics | TimedLyrics | None:
+    async def get_lyrics(
+        self, browseId: str, timestamps: bool | None = False, proxy: str | None = None
+    ) -> Lyrics | TimedLyrics | None:
         if not browseId:
             raise YTMusicUserError("Invalid browseId provided. This song might not have lyrics.")
 
         if timestamps:
             # changes and restores the client to get lyrics with timestamps (mobile only)
             with self.as_mobile():
-                response = await self._send_request_async(session, proxy, "browse", {"browseId": browseId})
+                response = await self._send_request_async("browse", {"browseId": browseId}, proxy=proxy)
         else:
-            response = await self._send_request_async(session, proxy,"browse", {"browseId": browseId})
+            response = await self._send_request_async("browse", {"browseId": browseId}, proxy=proxy)
 
         # unpack the response
         lyrics: Lyrics | TimedLyrics
@@ -650,23 +732,62 @@ class BrowsingMixin(MixinProtocol):
 
         return cast(Lyrics | TimedLyrics, lyrics)
 
+    async def get_lyrics_many(
+        self,
+        browseIds: Iterable[str],
+        timestamps: bool = False,
+        concurrency: int = BULK_CONCURRENCY,
+        negative_ttl: float = LYRICS_NEGATIVE_TTL,
+        proxy: str | None = None,
+    ) -> dict[str, Lyrics | TimedLyrics | Exception | None]:
+        """
+        Fetches the lyrics of many songs with :py:func:`get_lyrics` concurrently.
+        Duplicate browseIds are fetched once. A failed request doesn't abort the others,
+        its exception is returned instead of the lyrics.
+
+        Songs without lyrics are remembered by this instance for ``negative_ttl`` seconds,
+        later calls return None for them without sending a request.
+
+        :param browseIds: Lyrics browseIds, as returned by :py:func:`get_watch_playlist`
+        :param timestamps: Optional. Whether to return lyrics with timestamps, if available. Default: False
+        :param concurrency: Optional. Maximum number of simultaneous requests. Default: 20
+        :param negative_ttl: Optional. Seconds for which missing lyrics are remembered. Default: 1 day
+        :param proxy: Optional. Proxy URL for these requests
+        :return: Dictionary of lyrics, None or exceptions by browseId, in order of completion
+        """
+
+        async def request_func(browseId: str) -> Lyrics | TimedLyrics | None:
+            key = f"{browseId}:{timestamps}"
+            if self._missing_lyrics.get(key) is not None:
+                return None
+            lyrics: Lyrics | TimedLyrics | None
+            if timestamps:
+                lyrics = await self.get_lyrics(browseId, True, proxy)
+            else:
+                lyrics = await self.get_lyrics(browseId, False, proxy)
+            if lyrics is None:
+                self._missing_lyrics.set(key, b"", negative_ttl)
+            return lyrics
+
+        return {
+            browseId: lyrics
+            async for browseId, lyrics in aiter_as_completed(browseIds, request_func, concurrency)
+        }
+
     def get_basejs_url(self) -> str:
         """
         Extract the URL for the `base.js` script from YouTube Music.
 
         :return: URL to `base.js`
         """
-        response = self._send_get_request(url=YTM_DOMAIN)
-        match = re.search(r'jsUrl"\s*:\s*"([^"]+)"', response.text)
-        if match is None:
-            raise YTMusicError("Could not identify the URL for base.js player.")
-
-        return YTM_DOMAIN + match.group(1)
+        response = self._send_get_request(url=YTM_DOMAIN, stream=True)
+        return YTM_DOMAIN + parse_basejs_path(scan_response(response, BASEJS_PATH_PATTERN))
 
     def get_signatureTimestamp(self, url: str | None = None) -> int:
         """
         Fetch the `base.js` script from YouTube Music and parse out the
         ``signatureTimestamp`` for use with :py:func:`get_song`.
+        The result is cached by URL, so `base.js` is only downloaded when it changes.
 
         :param url: Optional. Provide the URL of the `base.js` script. If this
             isn't specified a call will be made to :py:func:`get_basejs_url`.
@@ -674,12 +795,13 @@ class BrowsingMixin(MixinProtocol):
         """
         if url is None:
             url = self.get_basejs_url()
-        response = self._send_get_request(url=url)
-        match = re.search(r"signatureTimestamp[:=](\d+)", response.text)
-        if match is None:
-            raise YTMusicError("Unable to identify the signatureTimestamp.")
-
-        return int(match.group(1))
+        key = SIGNATURE_TIMESTAMP_CACHE_KEY.format(url)
+        if (cached := self._script_cache.get(key)) is not None:
+            return int(cached)
+        response = self._send_get_request(url=url, stream=True)
+        timestamp = parse_signature_timestamp(scan_response(response, SIGNATURE_TIMESTAMP_PATTERN))
+        self._script_cache.set(key, str(timestamp).encode(), SIGNATURE_TIMESTAMP_TTL)
+        return timestamp
 
     def get_tasteprofile(self) -> JsonDict:
         """
@@ -1,4 +1,4 @@
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from random import randint
 
 from requests import Response
@@ -68,6 +68,27 @@ class LibraryMixin(MixinProtocol):
         :param order: Order of songs to return. Allowed values: ``a_to_z``, ``z_to_a``, ``recently_added``. Default: Default order.
         :return: List of songs. Same format as :py:func:`get_playlist`
         """
+        songs: JsonList = []
+        for contents in self._iter_library_songs_pages(limit, validate_responses, order):
+            songs.extend(contents)
+
+        return songs
+
+    def iter_library_songs(self, order: LibraryOrderType | None = None) -> Iterator[JsonDict]:
+        """
+        Lazily yields the songs in the user's library in the format of :py:func:`get_library_songs`.
+        Each continuation page is only requested once the previous songs have been consumed.
+
+        :param order: Order of songs to return. Allowed values: ``a_to_z``, ``z_to_a``, ``recently_added``. Default: Default order.
+        :return: Iterator over songs.
+        """
+        for contents in self._iter_library_songs_pages(None, False, order):
+            yield from contents
+
+    def _iter_library_songs_pages(
+        self, limit: int | None, validate_responses: bool, order: LibraryOrderType | None
+    ) -> Iterator[JsonList]:
+        """yields the parsed songs of the first page and each continuation page"""
         self._check_auth()
         body = {"browseId": "FEmusic_liked_videos"}
         validate_order_parameter(order)
@@ -82,7 +103,7 @@ class LibraryMixin(MixinProtocol):
         if validate_responses and limit is None:
             raise YTMusicUserError("Validation is not supported without a limit parameter.")
 
-        if validate_responses:
+        if validate_responses and limit is not None:
             validate_func: Callable[[JsonDict], bool] = lambda parsed: validate_response(
                 parsed, per_page, limit, 0
             )
@@ -95,38 +116,33 @@ class LibraryMixin(MixinProtocol):
         results = response["results"]
         songs: JsonList | None = response["parsed"]
         if songs is None:
-            return []
+            return
+        yield songs
 
-        if "continuations" in results:
-            request_continuations_func = lambda additionalParams: self._send_request(
-                endpoint, body, additionalParams
+        request_continuations_func: RequestFuncType = lambda additionalParams: self._send_request(
+            endpoint, body, additionalParams
+        )
+        parse_continuations_func: ParseFuncType = lambda contents: parse_playlist_items(contents)
+
+        if validate_responses and limit is not None:
+            # pages are resent until they are complete, so they are retrieved at once
+            yield get_validated_continuations(
+                results,
+                "musicShelfContinuation",
+                limit - len(songs),
+                per_page,
+                request_continuations_func,
+                parse_continuations_func,
+            )
+        else:
+            remaining_limit = None if limit is None else (limit - len(songs))
+            yield from iter_continuations(
+                results,
+                "musicShelfContinuation",
+                remaining_limit,
+                request_continuations_func,
+                parse_continuations_func,
             )
-            parse_continuations_func = lambda contents: parse_playlist_items(contents)
-
-            if validate_responses:
-                songs.extend(
-                    get_validated_continuations(
-                        results,
-                        "musicShelfContinuation",
-                        limit - len(songs),
-                        per_page,
-                        request_continuations_func,
-                        parse_continuations_func,
-                    )
-                )
-            else:
-                remaining_limit = None if limit is None else (limit - len(songs))
-                songs.extend(
-                    get_continuations(
-                        results,
-                        "musicShelfContinuation",
-                        remaining_limit,
-                        request_continuations_func,
-                        parse_continuations_func,
-                    )
-                )
-
-        return songs
 
     def get_library_albums(self, limit: int = 25, order: LibraryOrderType | None = None) -> JsonList:
         """
@@ -1,3 +1,5 @@
+from collections.abc import Iterator
+
 from ytmusicapi.continuations import *
 from ytmusicapi.exceptions import YTMusicUserError
 from ytmusicapi.helpers import sum_total_duration
@@ -170,8 +172,8 @@ class PlaylistsMixin(MixinProtocol):
                 )
 
             if related:
-                response = request_func(additionalParams)
-                continuation = nav(response, SECTION_LIST_CONTINUATION, True)
+                related_response = request_func(additionalParams)
+                continuation = nav(related_response, SECTION_LIST_CONTINUATION, True)
                 if continuation:
                     parse_func = lambda results: parse_content_list(results, parse_playlist)
                     playlist["related"] = get_continuation_contents(
@@ -179,18 +181,41 @@ class PlaylistsMixin(MixinProtocol):
                     )
 
         playlist["tracks"] = []
-        content_data = nav(section_list, [*CONTENT, "musicPlaylistShelfRenderer"])
-        if "contents" in content_data:
-            playlist["tracks"] = parse_playlist_items(content_data["contents"])
-
-            parse_func = lambda contents: parse_playlist_items(contents)
-            playlist["tracks"].extend(
-                get_continuations_2025(content_data, limit, request_func_continuations, parse_func)
-            )
+        for tracks in self._iter_playlist_tracks_pages(response, limit):
+            playlist["tracks"].extend(tracks)
 
         playlist["duration_seconds"] = sum_total_duration(playlist)
         return playlist
 
+    def iter_playlist_tracks(self, playlistId: str) -> Iterator[JsonDict]:
+        """
+        Lazily yields the tracks of a playlist, in the format of the ``tracks`` of :py:func:`get_playlist`.
+        Each continuation page is only requested once the previous tracks have been consumed,
+        so that long playlists can be processed with bounded memory or stopped early::
+
+            for track in ytmusic.iter_playlist_tracks(playlistId):
+                process(track)
+
+        :param playlistId: Playlist id
+        :return: Iterator over playlistItem dictionaries
+        """
+        browseId = "VL" + playlistId if not playlistId.startswith("VL") else playlistId
+        response = self._send_request("browse", {"browseId": browseId})
+        for tracks in self._iter_playlist_tracks_pages(response, None):
+            yield from tracks
+
+    def _iter_playlist_tracks_pages(self, response: JsonDict, limit: int | None) -> Iterator[JsonList]:
+        """yields the parsed tracks of the first page of a playlist response and each continuation page"""
+        section_list = nav(response, [*TWO_COLUMN_RENDERER, "secondaryContents", *SECTION])
+        content_data = nav(section_list, [*CONTENT, "musicPlaylistShelfRenderer"])
+        if "contents" not in content_data:
+            return
+        yield parse_playlist_items(content_data["contents"])
+
+        request_func: RequestFuncBodyType = lambda body: self._send_request("browse", body)
+        parse_func: ParseFuncType = lambda contents: parse_playlist_items(contents)
+        yield from iter_continuations_2025(content_data, limit, request_func, parse_func)
+
     def get_liked_songs(self, limit: int = 100) -> JsonDict:
         """
         Gets playlist items for the 'Liked Songs' playlist
@@ -1,3 +1,5 @@
+from collections.abc import Iterator
+
 from ytmusicapi.continuations import *
 from ytmusicapi.mixins._protocol import MixinProtocol
 from ytmusicapi.navigation import *
@@ -141,24 +143,41 @@ class PodcastsMixin(MixinProtocol):
         header = nav(two_columns, [*TAB_CONTENT, *SECTION_LIST_ITEM, *RESPONSIVE_HEADER])
         podcast: JsonDict = parse_podcast_header(header)
 
-        results = nav(two_columns, ["secondaryContents", *SECTION_LIST_ITEM, *MUSIC_SHELF])
-        parse_func: ParseFuncType = lambda contents: parse_content_list(contents, parse_episode, MMRIR)
-        episodes = parse_func(results["contents"])
+        podcast["episodes"] = []
+        for episodes in self._iter_podcast_episodes_pages(body, response, limit):
+            podcast["episodes"].extend(episodes)
 
-        if "continuations" in results:
-            request_func: RequestFuncType = lambda additionalParams: self._send_request(
-                endpoint, body, additionalParams
-            )
-            remaining_limit = None if limit is None else (limit - len(episodes))
-            episodes.extend(
-                get_continuations(
-                    results, "musicShelfContinuation", remaining_limit, request_func, parse_func
-                )
-            )
+        return podcast
 
-        podcast["episodes"] = episodes
+    def iter_podcast_episodes(self, playlistId: str) -> Iterator[JsonDict]:
+        """
+        Lazily yields the episodes of a podcast in the format of the ``episodes`` of :py:func:`get_podcast`.
+        Each continuation page is only requested once the previous episodes have been consumed.
 
-        return podcast
+        :param playlistId: Playlist id
+        :return: Iterator over episodes
+        """
+        browseId = "MPSP" + playlistId if not playlistId.startswith("MPSP") else playlistId
+        body = {"browseId": browseId}
+        for episodes in self._iter_podcast_episodes_pages(body, self._send_request("browse", body), None):
+            yield from episodes
+
+    def _iter_podcast_episodes_pages(
+        self, body: JsonDict, response: JsonDict, limit: int | None
+    ) -> Iterator[JsonList]:
+        """yields the parsed episodes of the first page of a podcast response and each continuation page"""
+        results = nav(response, [*TWO_COLUMN_RENDERER, "secondaryContents", *SECTION_LIST_ITEM, *MUSIC_SHELF])
+        parse_func: ParseFuncType = lambda contents: parse_content_list(contents, parse_episode, MMRIR)
+        episodes = parse_func(results["contents"])
+        yield episodes
+
+        request_func: RequestFuncType = lambda additionalParams: self._send_request(
+            "browse", body, additionalParams
+        )
+        remaining_limit = None if limit is None else (limit - len(episodes))
+        yield from iter_continuations(
+            results, "musicShelfContinuation", remaining_limit, request_func, parse_func
+        )
 
     def get_episode(self, videoId: str) -> JsonDict:
         """
@@ -1,23 +1,123 @@
-from ytmusicapi.continuations import get_continuations
+from collections.abc import AsyncIterator, Iterable
+
+from ytmusicapi.continuations import aiter_continuations
 from ytmusicapi.exceptions import YTMusicUserError
+from ytmusicapi.helpers import BULK_CONCURRENCY
 from ytmusicapi.mixins._protocol import MixinProtocol
+from ytmusicapi.mixins._utils import aiter_as_completed, get_result_id, normalize_query
 from ytmusicapi.parsers.search import *
-from ytmusicapi.type_alias import JsonList, ParseFuncType, RequestFuncType
+from ytmusicapi.type_alias import AsyncRequestFuncType, JsonDict, JsonList, ParseFuncType
+
 
 class SearchMixin(MixinProtocol):
     async def search(
         self,
-        session,
         query: str,
-        proxy=None,
         filter: str | None = None,
         scope: str | None = None,
         limit: int = 20,
         ignore_spelling: bool = False,
+        proxy: str | None = None,
     ) -> JsonList:
+        search_results: JsonList = []
+        async for results in self._aiter_search_pages(query, filter, scope, limit, ignore_spelling, proxy):
+            search_results.extend(results)
+
+        return search_results
+
+    async def search_many(
+        self,
+        queries: Iterable[str],
+        filter: str | None = None,
+        scope: str | None = None,
+        limit: int = 20,
+        ignore_spelling: bool = False,
+        concurrency: int = BULK_CONCURRENCY,
+        merge: bool = False,
+        proxy: str | None = None,
+    ) -> dict[str, JsonList | Exception]:
+        """
+        Runs many searches with :py:func:`search` concurrently.
+
+        Queries are normalized (unicode, case and whitespace) and every distinct normalized query
+        is searched once, so ``"Oasis  Wonderwall"`` and ``"oasis wonderwall"`` share a request.
+        A failed search doesn't abort the others, its exception is returned instead of the results::
+
+            results = await ytmusic.search_many(tracks, filter="songs", limit=5, concurrency=50)
+
+        :param queries: Search queries
+        :param filter: Optional. See :py:func:`search`
+        :param scope: Optional. See :py:func:`search`
+        :param limit: Optional. Number of results per query, see :py:func:`search`. Default: 20
+        :param ignore_spelling: Optional. See :py:func:`search`
+        :param concurrency: Optional. Maximum number of simultaneous requests. Default: 20
+        :param merge: Optional. Whether results with the same ``videoId``, ``browseId`` or
+            ``playlistId`` returned for different queries are merged into a single dictionary,
+            which lists all queries it was found for under ``queries``. Default: False
+        :param proxy: Optional. Proxy URL for these requests
+        :return: Dictionary of search results or exceptions by query, in the order of the queries
+        """
+        normalized = {query: normalize_query(query) for query in queries}
+        request_func = lambda query: self.search(query, filter, scope, limit, ignore_spelling, proxy)
+        results = {
+            query: result
+            async for query, result in aiter_as_completed(normalized.values(), request_func, concurrency)
+        }
+        search_results = {query: results[normalized[query]] for query in normalized}
+        if merge:
+            merged: dict[str, JsonDict] = {}
+            for query, query_results in search_results.items():
+                if isinstance(query_results, Exception):
+                    continue
+                for i, result in enumerate(query_results):
+                    if (result_id := get_result_id(result)) is None:
+                        continue
+                    result = merged.setdefault(result_id, {**result, "queries": []})
+                    if query not in result["queries"]:
+                        result["queries"].append(query)
+                    query_results[i] = result
+        return search_results
+
+    async def aiter_search(
+        self,
+        query: str,
+        filter: str | None = None,
+        scope: str | None = None,
+        ignore_spelling: bool = False,
+        proxy: str | None = None,
+    ) -> AsyncIterator[JsonDict]:
+        """
+        Yields search results one by one, in the format of :py:func:`search`.
+        When a ``filter`` is set, continuation pages are only requested once the previous
+        results have been consumed, so iteration can be stopped at any time::
+
+            async for song in ytmusic.aiter_search("Oasis", filter="songs"):
+                if song["videoId"] == wanted:
+                    break
+
+        :param query: Query string
+        :param filter: Filter for item types, see :py:func:`search`
+        :param scope: Search scope, see :py:func:`search`
+        :param ignore_spelling: Whether to ignore YTM spelling suggestions
+        :param proxy: Optional. Proxy URL for these requests
+        """
+        async for results in self._aiter_search_pages(query, filter, scope, None, ignore_spelling, proxy):
+            for result in results:
+                yield result
+
+    async def _aiter_search_pages(
+        self,
+        query: str,
+        filter: str | None,
+        scope: str | None,
+        limit: int | None,
+        ignore_spelling: bool,
+        proxy: str | None,
+    ) -> AsyncIterator[JsonList]:
+        """yields the parsed results of each shelf and continuation page of a search"""
         body = {"query": query}
         endpoint = "search"
-        search_results: JsonList = []
+        count = 0
         filters = [
             "albums",
             "artists",
@@ -59,10 +159,10 @@ class SearchMixin(MixinProtocol):
         params = get_search_params(filter, scope, ignore_spelling)
         if params:
             body["params"] = params
-        response = await self._send_request_async(session, proxy, endpoint, body)
+        response = await self._send_request_async(endpoint, body, proxy=proxy)
         # no results
         if "contents" not in response:
-            return search_results
+            return
 
         if "tabbedSearchResultsRenderer" in response["contents"]:
             tab_index = 0 if not scope or filter else scopes.index(scope) + 1
@@ -76,7 +176,7 @@ class SearchMixin(MixinProtocol):
 
         # no results
         if len(section_list) == 1 and "itemSectionRenderer" in section_list:
-            return search_results
+            return
 
         # set filter for parser
         result_type = None
@@ -93,7 +193,8 @@ class SearchMixin(MixinProtocol):
                 top_result = parse_top_result(
                     res["musicCardShelfRenderer"], self.parser.get_search_result_types()
                 )
-                search_results.append(top_result)
+                count += 1
+                yield [top_result]
                 if not (shelf_contents := nav(res, ["musicCardShelfRenderer", "contents"], True)):
                     continue
                 # if "more from youtube" is present, remove it - it's not parseable
@@ -115,28 +216,29 @@ class SearchMixin(MixinProtocol):
 
             api_search_result_types = self.parser.get_api_result_types()
 
-            search_results.extend(
-                parse_search_results(shelf_contents, api_search_result_types, result_type, category)
+            shelf_results = parse_search_results(
+                shelf_contents, api_search_result_types, result_type, category
             )
+            count += len(shelf_results)
+            yield shelf_results
 
             if filter:  # if filter is set, there are continuations
-                request_func: RequestFuncType = lambda additionalParams: self._send_request(
-                    endpoint, body, additionalParams
+                request_func: AsyncRequestFuncType = lambda additionalParams: self._send_request_async(
+                    endpoint, body, additionalParams, proxy=proxy
                 )
                 parse_func: ParseFuncType = lambda contents: parse_search_results(
                     contents, api_search_result_types, result_type, category
                 )
 
-                search_results.extend(
-                    get_continuations(
-                        res["musicShelfRenderer"],
-                        "musicShelfContinuation",
-                        limit - len(search_results),
-                        request_func,
-                        parse_func,
-                    )
-                )
-        return search_results
+                async for contents in aiter_continuations(
+                    res["musicShelfRenderer"],
+                    "musicShelfContinuation",
+                    None if limit is None else limit - count,
+                    request_func,
+                    parse_func,
+                ):
+                    count += len(contents)
+                    yield contents
 
     def get_search_suggestions(self, query: str, detailed_runs: bool = False) -> list[str] | JsonList:
         body = {"input": query}
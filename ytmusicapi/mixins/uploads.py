@@ -1,9 +1,10 @@
 import typing
+from collections.abc import Iterator
 from pathlib import Path
 
 import requests
 
-from ytmusicapi.continuations import get_continuations
+from ytmusicapi.continuations import get_continuations, iter_continuations
 from ytmusicapi.helpers import *
 from ytmusicapi.navigation import *
 from ytmusicapi.parsers.albums import parse_album_header
@@ -49,6 +50,27 @@ class UploadsMixin(MixinProtocol):
               "thumbnails": [...]
             }
         """
+        songs: JsonList = []
+        for contents in self._iter_library_upload_songs_pages(limit, order):
+            songs.extend(contents)
+
+        return songs
+
+    def iter_library_upload_songs(self, order: LibraryOrderType | None = None) -> Iterator[JsonDict]:
+        """
+        Lazily yields uploaded songs in the format of :py:func:`get_library_upload_songs`.
+        Each continuation page is only requested once the previous songs have been consumed.
+
+        :param order: Order of songs to return. Allowed values: ``a_to_z``, ``z_to_a``, ``recently_added``. Default: Default order.
+        :return: Iterator over uploaded songs.
+        """
+        for contents in self._iter_library_upload_songs_pages(None, order):
+            yield from contents
+
+    def _iter_library_upload_songs_pages(
+        self, limit: int | None, order: LibraryOrderType | None
+    ) -> Iterator[JsonList]:
+        """yields the parsed songs of the first page and each continuation page"""
         self._check_auth()
         endpoint = "browse"
         body = {"browseId": "FEmusic_library_privately_owned_tracks"}
@@ -58,22 +80,18 @@ class UploadsMixin(MixinProtocol):
         response = self._send_request(endpoint, body)
         results = get_library_contents(response, MUSIC_SHELF)
         if results is None:
-            return []
+            return
         pop_songs_random_mix(results)
         songs: JsonList = parse_uploaded_items(results["contents"])
+        yield songs
 
-        if "continuations" in results:
-            request_func: RequestFuncType = lambda additionalParams: self._send_request(
-                endpoint, body, additionalParams
-            )
-            remaining_limit = None if limit is None else (limit - len(songs))
-            songs.extend(
-                get_continuations(
-                    results, "musicShelfContinuation", remaining_limit, request_func, parse_uploaded_items
-                )
-            )
-
-        return songs
+        request_func: RequestFuncType = lambda additionalParams: self._send_request(
+            endpoint, body, additionalParams
+        )
+        remaining_limit = None if limit is None else (limit - len(songs))
+        yield from iter_continuations(
+            results, "musicShelfContinuation", remaining_limit, request_func, parse_uploaded_items
+        )
 
     def get_library_upload_albums(
         self, limit: int | None = 25, order: LibraryOrderType | None = None
@@ -231,7 +249,7 @@ class UploadsMixin(MixinProtocol):
                 + ", ".join(supported_filetypes)
             )
 
-        headers = self.headers.copy()
+        headers = dict(self.headers)
         upload_url = f"https://upload.youtube.com/upload/usermusic/http?authuser={headers['x-goog-authuser']}"
         filesize = fp.stat().st_size
         if filesize >= 314572800:  # 300MB in bytes
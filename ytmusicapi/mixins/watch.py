@@ -1,74 +1,36 @@
-from ytmusicapi.continuations import get_continuations
-from ytmusicapi.exceptions import YTMusicServerError, YTMusicUserError
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator
+
+from ytmusicapi.continuations import (
+    get_continuation_contents,
+    get_continuation_params,
+    get_continuations_async,
+)
+from ytmusicapi.exceptions import YTMusicServerError
 from ytmusicapi.mixins._protocol import MixinProtocol
-from ytmusicapi.parsers.playlists import validate_playlist_id
+from ytmusicapi.mixins._utils import get_watch_playlist_ctoken_path, prepare_watch_playlist_body
 from ytmusicapi.parsers.watch import *
-from ytmusicapi.type_alias import JsonList, ParseFuncType, RequestFuncType
+from ytmusicapi.type_alias import AsyncRequestFuncType, JsonDict, JsonList, ParseFuncType
 
 
 class WatchMixin(MixinProtocol):
     async def get_watch_playlist(
         self,
-        session,
-        proxy = None,
         videoId: str | None = None,
         playlistId: str | None = None,
         limit: int = 25,
         radio: bool = False,
         shuffle: bool = False,
+        proxy: str | None = None,
     ) -> dict[str, JsonList | str | None]:
-        body = {
-            "enablePersistentPlaylistPanel": True,
-            "isAudioOnly": True,
-            "tunerSettingValue": "AUTOMIX_SETTING_NORMAL",
-        }
-        if not videoId and not playlistId:
-            raise YTMusicUserError("You must provide either a video id, a playlist id, or both")
-        if videoId:
-            body["videoId"] = videoId
-            if not playlistId:
-                playlistId = "RDAMVM" + videoId
-            if not (radio or shuffle):
-                body["watchEndpointMusicSupportedConfigs"] = {
-                    "watchEndpointMusicConfig": {
-                        "hasPersistentPlaylistPanel": True,
-                        "musicVideoType": "MUSIC_VIDEO_TYPE_ATV",
-                    }
-                }
-        is_playlist = False
-        if playlistId:
-            playlist_id = validate_playlist_id(playlistId)
-            is_playlist = playlist_id.startswith("PL") or playlist_id.startswith("OLA")
-            body["playlistId"] = playlist_id
-
-        if shuffle and playlistId is not None:
-            body["params"] = "wAEB8gECKAE%3D"
-        if radio:
-            body["params"] = "wAEB"
+        body = prepare_watch_playlist_body(videoId, playlistId, radio, shuffle)
         endpoint = "next"
-        response = await self._send_request_async(session, proxy, endpoint, body)
-        watchNextRenderer = nav(
-            response,
-            [
-                "contents",
-                "singleColumnMusicWatchNextResultsRenderer",
-                "tabbedRenderer",
-                "watchNextTabbedResultsRenderer",
-            ],
-        )
+        watchNextRenderer, results = await self._get_watch_playlist_panel(body, proxy)
 
         lyrics_browse_id = get_tab_browse_id(watchNextRenderer, 1)
         related_browse_id = get_tab_browse_id(watchNextRenderer, 2)
 
-        results = nav(
-            watchNextRenderer, [*TAB_CONTENT, "musicQueueRenderer", "content", "playlistPanelRenderer"], True
-        )
-        if not results:
-            msg = "No content returned by the server."
-            if playlistId:
-                msg += f"\nEnsure you have access to {playlistId} - a private playlist may cause this."
-            raise YTMusicServerError(msg)
-
         playlist = next(
             filter(
                 bool,
@@ -81,21 +43,116 @@ class WatchMixin(MixinProtocol):
         )
         tracks = parse_watch_playlist(results["contents"])
 
-        # if "continuations" in results:
-        #     print("has continuations")
-            # request_func: RequestFuncType = lambda additionalParams: self._send_request(
-            #     endpoint, body, additionalParams
-            # )
-            # parse_func: ParseFuncType = lambda contents: parse_watch_playlist(contents)
-            # tracks.extend(
-            #     get_continuations(
-            #         results,
-            #         "playlistPanelContinuation",
-            #         limit - len(tracks),
-            #         request_func,
-            #         parse_func,
-            #         "" if is_playlist else "Radio",
-            #     )
-            # )
+        if "continuations" in results:
+            request_func: AsyncRequestFuncType = lambda additionalParams: self._send_request_async(
+                endpoint, body, additionalParams, proxy=proxy
+            )
+            parse_func: ParseFuncType = lambda contents: parse_watch_playlist(contents)
+            tracks.extend(
+                await get_continuations_async(
+                    results,
+                    "playlistPanelContinuation",
+                    limit - len(tracks),
+                    request_func,
+                    parse_func,
+                    get_watch_playlist_ctoken_path(body),
+                )
+            )
 
         return dict(tracks=tracks, playlistId=playlist, lyrics=lyrics_browse_id, related=related_browse_id)
+
+    async def aiter_watch_playlist(
+        self,
+        videoId: str | None = None,
+        playlistId: str | None = None,
+        radio: bool = False,
+        shuffle: bool = False,
+        low_water_mark: int = 10,
+        proxy: str | None = None,
+    ) -> AsyncIterator[JsonDict]:
+        """
+        Streams the tracks of a watch playlist (radio) in the format of the ``tracks`` of
+        :py:func:`get_watch_playlist`, for as long as the server returns continuations.
+
+        The next continuation is requested in the background as soon as the number of buffered
+        tracks drops to ``low_water_mark``, so that it has usually arrived by the time the
+        buffer runs out::
+
+            async for track in ytmusic.aiter_watch_playlist(videoId, radio=True):
+                await play(track)
+
+        :param videoId: videoId of the played video
+        :param playlistId: playlistId of the played playlist or album
+        :param radio: get a radio playlist (changes each time)
+        :param shuffle: shuffle the input playlist. only works when the playlistId parameter
+            is set at the same time. does not work if radio=True
+        :param low_water_mark: number of remaining buffered tracks at which the next
+            continuation is prefetched. Default: 10
+        :param proxy: Optional. Proxy URL for these requests
+        :return: Async iterator over tracks
+        """
+        body = prepare_watch_playlist_body(videoId, playlistId, radio, shuffle)
+        endpoint = "next"
+        _, results = await self._get_watch_playlist_panel(body, proxy)
+        ctoken_path = get_watch_playlist_ctoken_path(body)
+
+        tracks = deque(parse_watch_playlist(results["contents"]))
+        next_page: asyncio.Task[JsonDict] | None = None
+
+        def prefetch() -> None:
+            nonlocal next_page
+            if next_page is None and len(tracks) <= low_water_mark and "continuations" in results:
+                additionalParams = get_continuation_params(results, ctoken_path)
+                next_page = asyncio.create_task(
+                    self._send_request_async(endpoint, body, additionalParams, proxy=proxy)
+                )
+
+        try:
+            prefetch()
+            while tracks or next_page is not None:
+                if tracks:
+                    track = tracks.popleft()
+                    prefetch()
+                    yield track
+                    continue
+
+                assert next_page is not None
+                response = await next_page
+                next_page = None
+                if "continuationContents" not in response:
+                    break
+                results = response["continuationContents"]["playlistPanelContinuation"]
+                contents = get_continuation_contents(results, parse_watch_playlist)
+                if len(contents) == 0:
+                    break
+                tracks.extend(contents)
+                prefetch()
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+                if next_page.done() and not next_page.cancelled():
+                    next_page.exception()  # the prefetch failed before the consumer stopped
+
+    async def _get_watch_playlist_panel(self, body: JsonDict, proxy: str | None) -> tuple[JsonDict, JsonDict]:
+        """requests the first page of a watch playlist and returns the watchNextRenderer and playlist panel"""
+        response = await self._send_request_async("next", body, proxy=proxy)
+        watchNextRenderer = nav(
+            response,
+            [
+                "contents",
+                "singleColumnMusicWatchNextResultsRenderer",
+                "tabbedRenderer",
+                "watchNextTabbedResultsRenderer",
+            ],
+        )
+
+        results = nav(
+            watchNextRenderer, [*TAB_CONTENT, "musicQueueRenderer", "content", "playlistPanelRenderer"], True
+        )
+        if not results:
+            msg = "No content returned by the server."
+            if playlistId := body.get("playlistId"):
+                msg += f"\nEnsure you have access to {playlistId} - a private playlist may cause this."
+            raise YTMusicServerError(msg)
+
+        return watchNextRenderer, results
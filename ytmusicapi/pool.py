@@ -0,0 +1,166 @@
+import random
+import threading
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from typing import Concatenate, ParamSpec, TypeVar
+
+from ytmusicapi.constants import POOL_FAILURE_STATUSES, POOL_MAX_QUARANTINE, POOL_QUARANTINE
+from ytmusicapi.exceptions import YTMusicServerError, YTMusicUserError
+from ytmusicapi.ytmusic import YTMusic
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+@dataclass
+class IdentityStats:
+    """Load and health of an account in a :py:class:`ClientPool`"""
+
+    #: name of the account, see :py:class:`ClientPool`
+    name: str
+    client: YTMusic = field(repr=False)
+    #: number of requests currently sent by the account
+    in_flight: int = 0
+    #: number of completed requests
+    requests: int = 0
+    #: number of requests rejected with 401 or 429
+    rejected: int = 0
+    #: number of rejections since the last success
+    failures: int = 0
+    #: ``time.monotonic()`` until which the account is not used
+    quarantined_until: float = 0.0
+
+    @property
+    def quarantined(self) -> bool:
+        return self.quarantined_until > time.monotonic()
+
+    @property
+    def budget(self) -> float:
+        """requests the account can send without waiting for its rate limiter"""
+        if self.client.rate_limiter is None:
+            return float("inf")
+        return self.client.rate_limiter.get_budget(self.client._identity)
+
+
+class ClientPool:
+    """
+    Spreads requests over several authenticated accounts, such as browser headers,
+    OAuth tokens or brand accounts, to multiply the throughput of a single account::
+
+        limiter = RateLimiter(identity_rate=5)
+        pool = ClientPool(
+            [
+                YTMusic("browser.json", rate_limiter=limiter),
+                YTMusic("browser.json", user="110240316781216547512", rate_limiter=limiter),
+                YTMusic("oauth.json", oauth_credentials=credentials, rate_limiter=limiter),
+            ]
+        )
+        songs = pool.call(YTMusic.get_library_songs, limit=100)
+        results = await pool.acall(YTMusic.search, "oasis", filter="songs")
+
+    Each request is sent by the account with the fewest requests in flight, preferring accounts
+    with remaining budget in their rate limiter. An account whose request is rejected with
+    401 or 429 is quarantined; the quarantine doubles with every further rejection up to
+    ``max_quarantine`` and ends with the first success. If all accounts are quarantined,
+    the one released first is used.
+    """
+
+    def __init__(
+        self,
+        clients: list[YTMusic],
+        quarantine: float = POOL_QUARANTINE,
+        max_quarantine: float = POOL_MAX_QUARANTINE,
+    ):
+        """
+        :param clients: Instances of the accounts. They are named by their index in the pool
+        :param quarantine: Optional. Initial quarantine in seconds. Default: 60
+        :param max_quarantine: Optional. Maximum quarantine in seconds. Default: 900
+        """
+        if not clients:
+            raise YTMusicUserError("ClientPool requires at least one client.")
+        self.identities = [IdentityStats(str(i), client) for i, client in enumerate(clients)]
+        self.quarantine = quarantine
+        self.max_quarantine = max_quarantine
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> list[IdentityStats]:
+        return list(self.identities)
+
+    def select(self) -> IdentityStats:
+        """Returns the account for the next request and counts it as in flight until :py:func:`report`"""
+        with self._lock:
+            available = [identity for identity in self.identities if not identity.quarantined]
+            if available:
+                random.shuffle(available)  # spread requests over accounts with equal load
+                identity = min(available, key=lambda identity: (identity.budget < 1, identity.in_flight))
+            else:
+                identity = min(self.identities, key=lambda identity: identity.quarantined_until)
+            identity.in_flight += 1
+            return identity
+
+    def report(self, identity: IdentityStats, error: BaseException | None = None) -> None:
+        """
+        Records the outcome of a request sent by an account returned by :py:func:`select`.
+
+        :param identity: account
+        :param error: Optional. Exception raised by the request
+        """
+        with self._lock:
+            identity.in_flight = max(0, identity.in_flight - 1)
+            identity.requests += 1
+            if not isinstance(error, YTMusicServerError) or error.status not in POOL_FAILURE_STATUSES:
+                if error is None:
+                    identity.failures = 0
+                    identity.quarantined_until = 0.0
+                return
+            identity.rejected += 1
+            identity.failures += 1
+            duration = self.quarantine * 2 ** (identity.failures - 1)
+            identity.quarantined_until = time.monotonic() + min(self.max_quarantine, duration)
+
+    @contextmanager
+    def client(self) -> Iterator[YTMusic]:
+        """Selects an account for the requests sent inside the ``with``-statement"""
+        identity = self.select()
+        try:
+            yield identity.client
+        except BaseException as e:
+            self.report(identity, e)
+            raise
+        self.report(identity)
+
+    @asynccontextmanager
+    async def aclient(self) -> AsyncIterator[YTMusic]:
+        """Selects an account for the requests sent inside the ``async with``-statement"""
+        identity = self.select()
+        try:
+            yield identity.client
+        except BaseException as e:
+            self.report(identity, e)
+            raise
+        self.report(identity)
+
+    def call(self, method: Callable[Concatenate[YTMusic, P], T], *args: P.args, **kwargs: P.kwargs) -> T:
+        """
+        Calls a method of :py:class:`YTMusic` with the selected account.
+
+        :param method: Method, such as ``YTMusic.get_library_songs``
+        :return: Result of the method
+        """
+        with self.client() as client:
+            return method(client, *args, **kwargs)
+
+    async def acall(
+        self, method: Callable[Concatenate[YTMusic, P], Awaitable[T]], *args: P.args, **kwargs: P.kwargs
+    ) -> T:
+        """Asynchronous version of :py:func:`call`, for methods such as ``YTMusic.search``"""
+        async with self.aclient() as client:
+            return await method(client, *args, **kwargs)
+
+    async def aclose(self) -> None:
+        """Closes the sessions of all accounts"""
+        for identity in self.identities:
+            await identity.client.aclose()
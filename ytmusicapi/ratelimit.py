@@ -0,0 +1,121 @@
+import asyncio
+import threading
+import time
+
+from ytmusicapi.constants import RATE_LIMIT_BURST
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket, refilled continuously at ``rate`` tokens per second up to ``burst``.
+
+    Tokens are reserved rather than polled: a reservation may take the bucket below zero and
+    returns how long the caller has to wait for its token. Callers are therefore served
+    in the order of their reservations, without busy waiting.
+    """
+
+    def __init__(self, rate: float, burst: float = RATE_LIMIT_BURST):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Takes a token and returns the number of seconds until it is available"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self.tokens -= 1
+            return max(0.0, -self.tokens / self.rate)
+
+    def refund(self) -> None:
+        """Returns a reserved token that was not used"""
+        with self._lock:
+            self.tokens = min(self.burst, self.tokens + 1)
+
+    @property
+    def available(self) -> float:
+        """Tokens available now, negative while reservations are waiting"""
+        with self._lock:
+            return min(self.burst, self.tokens + (time.monotonic() - self._updated) * self.rate)
+
+
+class RateLimiter:
+    """
+    Limits the rate of requests globally, per authenticated account and per proxy.
+    A single instance can be shared by several :py:class:`YTMusic` instances to coordinate them::
+
+        limiter = RateLimiter(rate=20, identity_rate=5, proxy_rate=10)
+        ytmusic = YTMusic(rate_limiter=limiter)
+        ytmusic_brand = YTMusic("browser.json", user="110240316781216547512", rate_limiter=limiter)
+
+    Requests wait for all applicable buckets. Asynchronous requests wait without blocking the
+    event loop and are served in the order they arrived, synchronous requests block the calling thread.
+    """
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        identity_rate: float | None = None,
+        proxy_rate: float | None = None,
+        burst: float = RATE_LIMIT_BURST,
+    ):
+        """
+        :param rate: Optional. Maximum requests per second in total. Default: unlimited
+        :param identity_rate: Optional. Maximum requests per second per account.
+          All unauthenticated instances share one bucket. Default: unlimited
+        :param proxy_rate: Optional. Maximum requests per second per proxy URL.
+          Requests without a proxy share one bucket. Default: unlimited
+        :param burst: Optional. Number of requests that can be sent at once after a pause. Default: 5
+        """
+        self.rate = rate
+        self.identity_rate = identity_rate
+        self.proxy_rate = proxy_rate
+        self.burst = burst
+        self._global = TokenBucket(rate, burst) if rate else None
+        self._identities: dict[str, TokenBucket] = {}
+        self._proxies: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def _get_buckets(self, identity: str, proxy: str | None) -> list[TokenBucket]:
+        buckets = [self._global] if self._global else []
+        with self._lock:
+            if self.identity_rate:
+                if identity not in self._identities:
+                    self._identities[identity] = TokenBucket(self.identity_rate, self.burst)
+                buckets.append(self._identities[identity])
+            if self.proxy_rate:
+                proxy = proxy or ""
+                if proxy not in self._proxies:
+                    self._proxies[proxy] = TokenBucket(self.proxy_rate, self.burst)
+                buckets.append(self._proxies[proxy])
+        return buckets
+
+    def get_budget(self, identity: str = "") -> float:
+        """Requests an account can send right now without waiting, ``inf`` without a limit per account"""
+        if not self.identity_rate:
+            return float("inf")
+        with self._lock:
+            bucket = self._identities.get(identity)
+        return self.burst if bucket is None else bucket.available
+
+    def acquire(self, identity: str = "", proxy: str | None = None) -> None:
+        """Blocks until a request may be sent"""
+        delay = max((bucket.reserve() for bucket in self._get_buckets(identity, proxy)), default=0.0)
+        if delay:
+            time.sleep(delay)
+
+    async def acquire_async(self, identity: str = "", proxy: str | None = None) -> None:
+        """Waits until a request may be sent"""
+        buckets = self._get_buckets(identity, proxy)
+        delay = max((bucket.reserve() for bucket in buckets), default=0.0)
+        if not delay:
+            return
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            for bucket in buckets:
+                bucket.refund()
+            raise
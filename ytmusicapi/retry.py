@@ -0,0 +1,71 @@
+import random
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+
+from ytmusicapi.constants import (
+    RETRY_BACKOFF,
+    RETRY_BUDGET,
+    RETRY_MAX_ATTEMPTS,
+    RETRY_MAX_BACKOFF,
+    RETRY_STATUSES,
+)
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Policy for retrying requests to idempotent endpoints, such as browse, player or search,
+    after connection errors or transient server errors. Requests with side effects are never retried.
+
+    Attempts are spaced by exponential backoff with full jitter, or by the ``Retry-After``
+    header returned by the server, if it is longer::
+
+        ytmusic = YTMusic(retry=RetryPolicy(max_attempts=5, budget=60))
+        ytmusic = YTMusic(retry=RetryPolicy(max_attempts=1))  # disable retries
+    """
+
+    #: maximum number of times a request is sent
+    max_attempts: int = RETRY_MAX_ATTEMPTS
+    #: upper bound of the delay before the first retry in seconds, doubled after each attempt
+    backoff: float = RETRY_BACKOFF
+    #: maximum delay between two attempts in seconds
+    max_backoff: float = RETRY_MAX_BACKOFF
+    #: maximum time in seconds from the first attempt until the last retry is started
+    budget: float = RETRY_BUDGET
+    #: HTTP status codes that are retried
+    statuses: frozenset[int] = RETRY_STATUSES
+
+    def get_delay(self, attempt: int, started: float, retry_after: str | None = None) -> float | None:
+        """
+        Returns the delay before the next attempt, or None if the request should not be retried.
+
+        :param attempt: number of attempts made so far
+        :param started: ``time.monotonic()`` of the first attempt
+        :param retry_after: value of the ``Retry-After`` header of the last response, if any
+        :return: delay in seconds
+        """
+        if attempt >= self.max_attempts:
+            return None
+        delay = random.uniform(0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1)))
+        if retry_after:
+            delay = max(delay, parse_retry_after(retry_after))
+        if time.monotonic() - started + delay > self.budget:
+            return None
+        return delay
+
+
+def parse_retry_after(value: str) -> float:
+    """
+    Parses a ``Retry-After`` header, which is either a number of seconds or an HTTP date.
+
+    :return: delay in seconds, 0 if the value is invalid or in the past
+    """
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return 0.0
@@ -1,4 +1,4 @@
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 JsonDict = dict[str, Any]
@@ -6,5 +6,7 @@ JsonList = list[JsonDict]
 
 RequestFuncType = Callable[[str], JsonDict]
 RequestFuncBodyType = Callable[[JsonDict], JsonDict]
+AsyncRequestFuncType = Callable[[str], Awaitable[JsonDict]]
+AsyncRequestFuncBodyType = Callable[[JsonDict], Awaitable[JsonDict]]
 ParseFuncType = Callable[[JsonList], JsonList]
 ParseFuncDictType = Callable[[JsonDict], JsonDict]
@@ -1,33 +1,63 @@
 from __future__ import annotations
 
-import gettext
-import json
+import asyncio
 import locale
+import re
+import threading
 import time
-from collections.abc import Iterator
+from collections.abc import Iterator, Mapping
 from contextlib import contextmanager, suppress
+from contextvars import ContextVar
 from functools import cached_property, partial
-from pathlib import Path
+from hashlib import sha1
+from types import MappingProxyType
 from typing import Any
 
-import orjson
+import aiohttp
 import requests
 from requests import Response
 from requests.structures import CaseInsensitiveDict
-import asyncio
 
 from ytmusicapi.helpers import (
+    ASYNC_CONNECTOR_OPTIONS,
+    ASYNC_REQUEST_TIMEOUT,
+    BASEJS_PATH_PATTERN,
+    BASEJS_URL_CACHE_KEY,
+    BASEJS_URL_TTL,
+    IDEMPOTENT_ENDPOINTS,
+    LYRICS_NEGATIVE_CACHE_SIZE,
+    SCAN_CHUNK_SIZE,
+    SIGNATURE_TIMESTAMP_CACHE_KEY,
+    SIGNATURE_TIMESTAMP_PATTERN,
+    SIGNATURE_TIMESTAMP_RETRY,
+    SIGNATURE_TIMESTAMP_TTL,
     SUPPORTED_LANGUAGES,
     SUPPORTED_LOCATIONS,
+    VISITOR_ID_CACHE_KEY,
+    VISITOR_ID_PATTERN,
+    VISITOR_ID_TTL,
     YTM_BASE_API,
+    YTM_DOMAIN,
     YTM_PARAMS,
     YTM_PARAMS_KEY,
+    ascan_chunks,
+    build_context,
+    encode_body,
+    encode_context,
     get_authorization,
-    get_visitor_id,
+    get_server_error,
     initialize_context,
     initialize_headers,
+    is_overloaded,
+    json_loads,
+    load_translation,
+    parse_basejs_path,
+    parse_signature_timestamp,
+    parse_visitor_id,
     sapisid_from_cookie,
+    scan_response,
 )
+from ytmusicapi.mixins._utils import get_datestamp
 from ytmusicapi.mixins.browsing import BrowsingMixin
 from ytmusicapi.mixins.explore import ExploreMixin
 from ytmusicapi.mixins.library import LibraryMixin
@@ -40,11 +70,23 @@ from ytmusicapi.parsers.i18n import Parser
 
 from .auth.auth_parse import determine_auth_type, parse_auth_str
 from .auth.oauth import OAuthCredentials, RefreshingToken
-from .auth.oauth.token import Token
 from .auth.types import AuthType
-from .exceptions import YTMusicServerError, YTMusicUserError
+from .cache import MemoryCache, ResponseCache
+from .concurrency import AdaptiveConcurrencyLimiter
+from .exceptions import YTMusicError, YTMusicUserError
+from .hedging import HedgingPolicy
+from .proxies import ProxyPool
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
 from .type_alias import JsonDict
 
+#: visitor ids and signature timestamps shared by the instances without a cache of their own
+_shared_state = MemoryCache(max_entries=64, ttls={})
+#: per-task/thread overrides of the request context of each instance, see :py:func:`YTMusicBase.client_context`
+_context_overrides: ContextVar[Mapping[YTMusicBase, JsonDict]] = ContextVar(
+    "ytmusic_context_overrides", default=MappingProxyType({})
+)
+
 
 class YTMusicBase:
     def __init__(
@@ -56,6 +98,16 @@ class YTMusicBase:
         language: str = "en",
         location: str = "",
         oauth_credentials: OAuthCredentials | None = None,
+        async_session: aiohttp.ClientSession | None = None,
+        connector_options: JsonDict | None = None,
+        cache: ResponseCache | None = None,
+        retry: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        proxy_pool: ProxyPool | None = None,
+        hedging: HedgingPolicy | None = None,
+        visitor_id: str | None = None,
+        visitor_cache: ResponseCache | None = None,
     ):
         """
         Create a new instance to interact with YouTube Music.
@@ -90,10 +142,69 @@ class YTMusicBase:
             Available languages can be checked in the FAQ.
         :param oauth_credentials: Optional. Used to specify a different oauth client to be
             used for authentication flow.
+        :param async_session: Optional. An aiohttp session used by the asynchronous methods.
+          It is not closed by this instance. Default: a pooled session is created on the
+          first asynchronous request in each event loop and closed by :py:func:`aclose` or ``async with``::
+
+            async with YTMusic() as ytmusic:
+                results = await ytmusic.search("Oasis Wonderwall")
+
+        :param connector_options: Optional. Keyword arguments for the ``aiohttp.TCPConnector``
+          of the default asynchronous session, such as ``limit``, ``limit_per_host``,
+          ``keepalive_timeout`` or ``ttl_dns_cache``. Ignored if ``async_session`` is provided.
+        :param cache: Optional. A response cache such as :py:class:`ytmusicapi.cache.MemoryCache`.
+          Responses to requests matching its time to live policies, like albums, artists and lyrics,
+          are returned from the cache until they expire. It also stores the ``signatureTimestamp``
+          of the player script, see :py:func:`get_song`. Default: no caching.
+        :param retry: Optional. A :py:class:`ytmusicapi.retry.RetryPolicy` for requests without
+          side effects that fail due to connection errors or transient server errors (429, 5xx).
+          Default: up to 3 attempts within 30 seconds.
+        :param rate_limiter: Optional. A :py:class:`ytmusicapi.ratelimit.RateLimiter` that limits
+          the rate of requests per account, per proxy and in total. It can be shared by several
+          instances. Default: no rate limit.
+        :param concurrency_limiter: Optional. A
+          :py:class:`ytmusicapi.concurrency.AdaptiveConcurrencyLimiter` that limits the number of
+          concurrent asynchronous requests to what the server currently sustains.
+          Default: limited only by ``connector_options``.
+        :param proxy_pool: Optional. A :py:class:`ytmusicapi.proxies.ProxyPool` to spread requests
+          over several proxies. Takes precedence over ``proxies``, but not over the ``proxy``
+          argument of asynchronous methods.
+        :param hedging: Optional. A :py:class:`ytmusicapi.hedging.HedgingPolicy` to send a duplicate
+          of asynchronous requests without side effects that take unusually long. Default: no hedging.
+        :param visitor_id: Optional. Visitor id sent by unauthenticated and OAuth clients.
+          Default: the visitor id of ``visitor_cache``, fetched from YouTube Music if there is none.
+        :param visitor_cache: Optional. Cache of the visitor id, such as a
+          :py:class:`ytmusicapi.cache.SQLiteCache` (which can also be ``cache``) to share it between
+          processes. It is fetched again after a day. Default: shared by the instances of this process.
         """
         #: request session for connection pooling
+        self._owns_session = not isinstance(requests_session, requests.Session)
         self._session = self._prepare_session(requests_session)
+        #: aiohttp session for the asynchronous methods provided by the user
+        self._async_session = async_session
+        #: default aiohttp sessions, created lazily inside each running event loop
+        self._async_sessions: dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+        self._async_sessions_lock = threading.Lock()
+        self._closing_async_sessions: set[asyncio.Future[Any]] = set()
+        self._connector_options = {**ASYNC_CONNECTOR_OPTIONS, **(connector_options or {})}
         self.proxies: dict[str, str] | None = proxies  #: params for session modification
+        self.cache = cache  #: response cache, see :py:class:`ytmusicapi.cache.ResponseCache`
+        self.retry = retry or RetryPolicy()  #: retry policy for idempotent requests
+        self.rate_limiter = rate_limiter  #: rate limits shared with other instances
+        self.concurrency_limiter = concurrency_limiter  #: adaptive limit of concurrent async requests
+        self.proxy_pool = proxy_pool  #: proxies to spread requests over
+        self.hedging = hedging  #: hedging policy for slow idempotent async requests
+        self._visitor_id = visitor_id
+        self.visitor_cache = _shared_state if visitor_cache is None else visitor_cache
+        self._visitor_id_request: asyncio.Future[str] | None = None
+        #: signatureTimestamps by base.js URL, shared between processes through ``cache``
+        self._script_cache = _shared_state if cache is None else cache
+        self._signature_timestamp: int | None = None
+        self._signature_timestamp_expires = 0.0
+        self._signature_timestamp_refresh: asyncio.Future[None] | None = None
+        self._missing_lyrics = MemoryCache(max_entries=LYRICS_NEGATIVE_CACHE_SIZE, ttls={})
+        #: identical idempotent requests in flight, shared by all callers, see :py:func:`_send_request_async`
+        self._in_flight: dict[str, asyncio.Future[bytes]] = {}
         # see google cookie docs: https://policies.google.com/technologies/cookies
         # value from https://github.com/yt-dlp/yt-dlp/blob/master/yt_dlp/extractor/youtube.py#L502
         self.cookies = {"SOCS": "CAI"}
@@ -104,7 +215,7 @@ class YTMusicBase:
             self._auth_headers, auth_path = parse_auth_str(auth)
             self.auth_type = determine_auth_type(self._auth_headers)
 
-            self._token: Token
+            self._token: RefreshingToken
             if self.auth_type == AuthType.OAUTH_CUSTOM_CLIENT:
                 if oauth_credentials is None:
                     raise YTMusicUserError(
@@ -136,9 +247,10 @@ class YTMusicBase:
             with suppress(locale.Error):
                 locale.setlocale(locale.LC_ALL, "en_US.UTF-8")
 
-        locale_dir = Path(__file__).parent.resolve() / "locales"
-        self.lang = gettext.translation("base", localedir=locale_dir, languages=[language])
-        self.parser = Parser(self.lang)
+        self.lang = load_translation(language)
+        self._parsers = {language: Parser(self.lang)}
+        #: request contexts encoded once per set of overrides, see :py:func:`_encode_body`
+        self._encoded_contexts: dict[frozenset[tuple[str, str]], bytes] = {}
 
         if user:
             self.context["context"]["user"]["onBehalfOfUser"] = user
@@ -163,39 +275,213 @@ class YTMusicBase:
         )
 
         if "X-Goog-Visitor-Id" not in headers:
-            headers.update(get_visitor_id(partial(self._send_get_request, use_base_headers=True)))
+            headers["X-Goog-Visitor-Id"] = self._get_visitor_id()
+        # request bodies are sent pre-encoded, see _encode_body
+        headers.setdefault("content-type", "application/json")
 
         return headers
 
     @property
-    def headers(self) -> CaseInsensitiveDict[str]:
-        headers = self.base_headers
+    def _needs_visitor_id(self) -> bool:
+        """Whether the visitor id is missing from the headers provided by the user"""
+        if self.auth_type == AuthType.BROWSER or self.auth_type == AuthType.OAUTH_CUSTOM_FULL:
+            return "X-Goog-Visitor-Id" not in self._auth_headers
+        return True
+
+    def _get_cached_visitor_id(self) -> str | None:
+        if self._visitor_id is None and (cached := self.visitor_cache.get(VISITOR_ID_CACHE_KEY)) is not None:
+            self._visitor_id = cached.decode()
+        return self._visitor_id
+
+    def _set_visitor_id(self, visitor_id: str) -> None:
+        self._visitor_id = visitor_id
+        if visitor_id:
+            self.visitor_cache.set(VISITOR_ID_CACHE_KEY, visitor_id.encode(), VISITOR_ID_TTL)
+
+    def _get_visitor_id(self) -> str:
+        """Returns the cached visitor id or fetches it from the YouTube Music page"""
+        visitor_id = self._get_cached_visitor_id()
+        if visitor_id is None:
+            response = self._send_get_request(YTM_DOMAIN, use_base_headers=True, stream=True)
+            visitor_id = parse_visitor_id(scan_response(response, VISITOR_ID_PATTERN))
+            self._set_visitor_id(visitor_id)
+        return visitor_id
+
+    async def _prepare_headers_async(self) -> None:
+        """
+        Fetches a missing visitor id and refreshes an expiring OAuth token asynchronously,
+        so that building the headers doesn't block the event loop.
+        Concurrent requests wait for the same fetch or refresh.
+        """
+        if self.auth_type == AuthType.OAUTH_CUSTOM_CLIENT:
+            await self._token.prepare_async()
+        if "base_headers" in self.__dict__ or not self._needs_visitor_id:
+            return
+        if (
+            self._visitor_id is None
+            and (cached := await self.visitor_cache.aget(VISITOR_ID_CACHE_KEY)) is not None
+        ):
+            self._visitor_id = cached.decode()
+        if self._visitor_id is None:
+            if self._visitor_id_request is None:
+                self._visitor_id_request = asyncio.ensure_future(self._fetch_visitor_id_async())
+            request = self._visitor_id_request
+            try:
+                visitor_id = await asyncio.shield(request)
+            finally:
+                if request.done():
+                    self._visitor_id_request = None
+            self._visitor_id = visitor_id
+            if visitor_id:
+                await self.visitor_cache.aset(VISITOR_ID_CACHE_KEY, visitor_id.encode(), VISITOR_ID_TTL)
+
+    async def _fetch_visitor_id_async(self) -> str:
+        match = await self._scan_get_request_async(YTM_DOMAIN, VISITOR_ID_PATTERN, use_base_headers=True)
+        return parse_visitor_id(match)
+
+    async def _get_signature_timestamp_async(self) -> int:
+        """
+        Returns the ``signatureTimestamp`` of the current `base.js`. It is fetched by the first
+        request and refreshed in the background every hour, later requests don't wait for it.
+        """
+        if self._signature_timestamp is None or time.monotonic() >= self._signature_timestamp_expires:
+            if self._signature_timestamp_refresh is None:
+                refresh = asyncio.ensure_future(self._refresh_signature_timestamp())
+                refresh.add_done_callback(self._signature_timestamp_refreshed)
+                self._signature_timestamp_refresh = refresh
+            if self._signature_timestamp is None:
+                await asyncio.shield(self._signature_timestamp_refresh)
+        return self._signature_timestamp or get_datestamp() - 1
+
+    def _signature_timestamp_refreshed(self, refresh: asyncio.Future[None]) -> None:
+        self._signature_timestamp_refresh = None
+
+    async def _refresh_signature_timestamp(self) -> None:
+        ttl = BASEJS_URL_TTL
+        try:
+            timestamp = await self._fetch_signature_timestamp_async()
+        except (aiohttp.ClientError, asyncio.TimeoutError, YTMusicError):
+            # keep the previous timestamp, the server accepts it for a while after an update
+            timestamp = self._signature_timestamp or get_datestamp() - 1
+            ttl = SIGNATURE_TIMESTAMP_RETRY
+        self._signature_timestamp = timestamp
+        self._signature_timestamp_expires = time.monotonic() + ttl
+
+    async def _fetch_signature_timestamp_async(self) -> int:
+        if (cached_url := await self._script_cache.aget(BASEJS_URL_CACHE_KEY)) is not None:
+            url = cached_url.decode()
+        else:
+            match = await self._scan_get_request_async(YTM_DOMAIN, BASEJS_PATH_PATTERN, use_base_headers=True)
+            url = YTM_DOMAIN + parse_basejs_path(match)
+            await self._script_cache.aset(BASEJS_URL_CACHE_KEY, url.encode(), BASEJS_URL_TTL)
+        key = SIGNATURE_TIMESTAMP_CACHE_KEY.format(url)
+        if (cached := await self._script_cache.aget(key)) is not None:
+            return int(cached)
+        match = await self._scan_get_request_async(url, SIGNATURE_TIMESTAMP_PATTERN, use_base_headers=True)
+        timestamp = parse_signature_timestamp(match)
+        await self._script_cache.aset(key, str(timestamp).encode(), SIGNATURE_TIMESTAMP_TTL)
+        return timestamp
+
+    @cached_property
+    def _frozen_headers(self) -> Mapping[str, str]:
+        """Read-only ``base_headers`` with lower-case names, shared by all requests"""
+        return MappingProxyType({key.lower(): value for key, value in self.base_headers.items()})
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        """
+        Read-only headers of a single request. Per-request values are layered over a copy
+        of ``base_headers``, which is never modified, so concurrent requests can't interfere.
+        """
+        headers = self._frozen_headers
 
         # keys updated each use, custom oauth implementations left untouched
         if self.auth_type == AuthType.BROWSER:
-            headers["authorization"] = get_authorization(self.sapisid + " " + self.origin)
+            authorization = get_authorization(self.sapisid + " " + self.origin)
+            return MappingProxyType({**headers, "authorization": authorization})
 
         # Do not set custom headers when using OAUTH_CUSTOM_FULL
         # Full headers are provided by the downstream client in this scenario.
         elif self.auth_type == AuthType.OAUTH_CUSTOM_CLIENT:
-            headers["authorization"] = self._token.as_auth()
-            headers["X-Goog-Request-Time"] = str(int(time.time()))
+            return MappingProxyType(
+                {
+                    **headers,
+                    "authorization": self._token.as_auth(),
+                    "x-goog-request-time": str(int(time.time())),
+                }
+            )
 
         return headers
 
+    @property
+    def parser(self) -> Parser:
+        """Parser for the language of the current request context"""
+        language = self._overrides.get("hl", self.language)
+        if language not in self._parsers:
+            self._parsers[language] = Parser(load_translation(language))
+        return self._parsers[language]
+
     @contextmanager
-    def as_mobile(self) -> Iterator[None]:
+    def client_context(
+        self,
+        clientName: str | None = None,
+        clientVersion: str | None = None,
+        hl: str | None = None,
+        gl: str | None = None,
+        onBehalfOfUser: str | None = None,
+    ) -> Iterator[None]:
         """
-        Not thread-safe!
-        ----------------
+        Temporarily overrides the client context of all requests sent inside the `with`-statement.
+        The overrides only apply to the current thread or asyncio task, so a single instance
+        can serve concurrent requests with different clients, languages, locations and users.
+        ``self.context`` itself is never modified.
 
-        Temporarily changes the `context` to enable different results
-        from the API, meant for the Android mobile-app.
-        All calls inside the `with`-statement with emulate mobile behavior.
+        Example::
+
+            async def search_in(language: str) -> JsonList:
+                with yt.client_context(hl=language, gl="DE"):
+                    return await yt.search("Oasis")
 
-        This context-manager has no `enter_result`, as it operates in-place
-        and only temporarily alters the underlying `YTMusic`-object.
+            results = await asyncio.gather(search_in("de"), search_in("en"))
 
+        :param clientName: Client name, for example ``ANDROID_MUSIC``
+        :param clientVersion: Client version matching ``clientName``
+        :param hl: Language of the returned data. Parsing uses the same language.
+        :param gl: Location of the user
+        :param onBehalfOfUser: Brand account user ID
+        """
+        if hl is not None and hl not in SUPPORTED_LANGUAGES:
+            raise YTMusicUserError(
+                "Language not supported. Supported languages are " + (", ".join(SUPPORTED_LANGUAGES)) + "."
+            )
+        if gl is not None and gl not in SUPPORTED_LOCATIONS:
+            raise YTMusicUserError("Location not supported. Check the FAQ for supported locations.")
+
+        overrides = {
+            key: value
+            for key, value in {
+                "clientName": clientName,
+                "clientVersion": clientVersion,
+                "hl": hl,
+                "gl": gl,
+                "onBehalfOfUser": onBehalfOfUser,
+            }.items()
+            if value is not None
+        }
+        instances = _context_overrides.get()
+        token = _context_overrides.set({**instances, self: {**instances.get(self, {}), **overrides}})
+        try:
+            yield None
+        finally:
+            _context_overrides.reset(token)
+
+    @contextmanager
+    def as_mobile(self) -> Iterator[None]:
+        """
+        Temporarily changes the client context to enable different results
+        from the API, meant for the Android mobile-app.
+        All calls inside the `with`-statement with emulate mobile behavior.
+        Like :py:func:`client_context`, this only affects the current thread or asyncio task.
 
         Example::
 
@@ -205,17 +491,90 @@ class YTMusicBase:
             yt._send_request(...)  # back to normal, like web-app
 
         """
+        with self.client_context(clientName="ANDROID_MUSIC", clientVersion="7.21.50"):
+            yield None
 
-        # change the context to emulate a mobile-app (Android)
-        copied_context_client = self.context["context"]["client"].copy()
-        self.context["context"]["client"].update({"clientName": "ANDROID_MUSIC", "clientVersion": "7.21.50"})
+    @property
+    def _overrides(self) -> JsonDict:
+        """The overrides of the request context in the current thread or task"""
+        return _context_overrides.get().get(self, {})
+
+    def _request_context(self) -> JsonDict:
+        """Returns the context for a request, with the overrides of the current thread or task applied"""
+        overrides = self._overrides
+        if not overrides:
+            return self.context
+        return build_context(self.context, overrides)
+
+    def _encoded_context(self) -> bytes:
+        """
+        Returns the encoded context of the current thread or task.
+        It is cached, so ``self.context`` must not be modified after initialization,
+        use :py:func:`client_context` instead.
+        """
+        key = frozenset(self._overrides.items())
+        if key not in self._encoded_contexts:
+            self._encoded_contexts[key] = encode_context(self._request_context())
+        return self._encoded_contexts[key]
 
-        # this will not catch errors
-        try:
-            yield None
-        finally:
-            # safely restore the old context
-            self.context["context"]["client"] = copied_context_client
+    def _encode_body(self, body: JsonDict) -> bytes:
+        """Encodes the body of a request together with the context of the current thread or task"""
+        return encode_body(body, self._encoded_context())
+
+    @property
+    def _proxy(self) -> str | None:
+        """The proxy of ``self.proxies`` used for requests to YouTube Music"""
+        if not self.proxies:
+            return None
+        return self.proxies.get("https", self.proxies.get("http"))
+
+    def _select_proxy(self, exclude: str | None = None) -> str | None:
+        """
+        Returns the proxy for the next request, from the proxy pool if there is one,
+        avoiding the pooled proxy ``exclude`` if possible
+        """
+        if self.proxy_pool is None:
+            return self._proxy
+        # unauthenticated instances have a session of their own
+        return self.proxy_pool.select(self._identity or f"instance-{id(self)}", exclude)
+
+    def _get_proxies(self, proxy: str | None) -> dict[str, str] | None:
+        """requests proxy configuration for a proxy returned by :py:func:`_select_proxy`"""
+        if self.proxy_pool is None or proxy is None:
+            return self.proxies
+        return {"http": proxy, "https": proxy}
+
+    def _report_proxy(self, proxy: str | None, success: bool | None, latency: float | None = None) -> None:
+        if self.proxy_pool is not None and proxy is not None:
+            self.proxy_pool.report(proxy, success, latency)
+
+    @cached_property
+    def _identity(self) -> str:
+        """Stable identifier of the authenticated account, used to partition shared state such as caches"""
+        if self.auth_type == AuthType.BROWSER:
+            secret = self._auth_headers.get("cookie", "")
+        elif self.auth_type == AuthType.OAUTH_CUSTOM_CLIENT:
+            secret = self._token.refresh_token
+        else:
+            secret = self._auth_headers.get("authorization", "")
+        return sha1(secret.encode()).hexdigest() if secret else ""
+
+    def _get_request_key(self, endpoint: str, body: JsonDict, additionalParams: str) -> str:
+        """Returns a key identifying the response to a request for the current context and account"""
+        return ResponseCache.make_key(
+            endpoint + additionalParams, body, self._encoded_context(), self._identity
+        )
+
+    def _get_cache_key(
+        self, endpoint: str, body: JsonDict, additionalParams: str
+    ) -> tuple[str, float] | None:
+        """Returns the cache key and time to live of a request, or None if it is not cached"""
+        if self.cache is None:
+            return None
+        ttl = self.cache.get_ttl(endpoint, body)
+        if ttl is None:
+            return None
+        return self._get_request_key(endpoint, body, additionalParams), ttl
 
     def _prepare_session(self, requests_session: requests.Session | None) -> requests.Session:
         """Prepare requests session or use user-provided requests_session"""
@@ -225,56 +584,290 @@ class YTMusicBase:
         self._session.request = partial(self._session.request, timeout=30)  # type: ignore[method-assign]
         return self._session
 
-    def _send_request(self, endpoint: str, body: JsonDict, additionalParams: str = "") -> JsonDict:
-        body.update(self.context)
-
-        response = self._session.post(
-            YTM_BASE_API + endpoint + self.params + additionalParams,
-            json=body,
-            headers=self.headers,
-            proxies=self.proxies,
-            cookies=self.cookies,
-        )
-        response_text: JsonDict = json.loads(response.text)
-        if response.status_code >= 400:
-            message = "Server returned HTTP " + str(response.status_code) + ": " + response.reason + ".\n"
-            error = response_text.get("error", {}).get("message")
-            raise YTMusicServerError(message + error)
-        return response_text
+    def _prepare_async_session(self) -> aiohttp.ClientSession:
+        """
+        Return the aiohttp session, creating the pooled default session if needed.
+        The default session is bound to the event loop it was created in, so every loop,
+        e.g. of consecutive ``asyncio.run`` calls or of several threads, has its own session.
+        """
+        if self._async_session is not None:
+            return self._async_session
+        loop = asyncio.get_running_loop()
+        with self._async_sessions_lock:
+            session = self._async_sessions.get(loop)
+            if session is not None and not session.closed:
+                return session
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(**self._connector_options),
+                timeout=aiohttp.ClientTimeout(total=ASYNC_REQUEST_TIMEOUT),
+            )
+            self._async_sessions[loop] = session
+            ended = [other for other in self._async_sessions if other.is_closed()]
+            ended_sessions = [self._async_sessions.pop(other) for other in ended]
+        if ended_sessions:
+            # sessions of loops that ended without aclose() can't be closed by their own loop anymore
+            closing = asyncio.ensure_future(asyncio.gather(*(stale.close() for stale in ended_sessions)))
+            self._closing_async_sessions.add(closing)
+            closing.add_done_callback(self._closing_async_sessions.discard)
+        return session
 
+    def _send_request(self, endpoint: str, body: JsonDict, additionalParams: str = "") -> JsonDict:
+        cache_key = self._get_cache_key(endpoint, body, additionalParams)
+        if cache_key and self.cache is not None and (cached := self.cache.get(cache_key[0])) is not None:
+            cached_response: JsonDict = json_loads(cached)
+            return cached_response
+
+        retry = self.retry if endpoint in IDEMPOTENT_ENDPOINTS else None
+        url = YTM_BASE_API + endpoint + self.params + additionalParams
+        data = self._encode_body(body)
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = self._post(url, data)
+            except (requests.ConnectionError, requests.Timeout):
+                delay = retry.get_delay(attempt, started) if retry else None
+                if delay is None:
+                    raise
+            else:
+                if response.status_code < 400:
+                    break
+                delay = None
+                if retry and response.status_code in retry.statuses:
+                    delay = retry.get_delay(attempt, started, response.headers.get("Retry-After"))
+                if delay is None:
+                    raise get_server_error(
+                        endpoint, response.status_code, response.reason, response.content, attempt
+                    )
+            time.sleep(delay)
 
-    def decode_and_parse(self, response):
-        return json.loads(response.decode())
-
-    async def _send_request_async(self, session, proxy, endpoint: str, body: JsonDict, additionalParams: str = "") -> JsonDict:
-        body.update(self.context)
-        async with session.post(
-            YTM_BASE_API + endpoint + self.params + additionalParams,
-            proxy=proxy,
-            json=body,
-            headers=self.headers,
-            cookies=self.cookies,
-        ) as response:
-            response.raise_for_status()
-            resp = await response.read()
-            # response_text: JsonDict = await asyncio.get_event_loop().run_in_executor(None, orjson.loads, resp)
-            response_text: JsonDict = orjson.loads(resp)
+        response_text: JsonDict = json_loads(response.content)
+        if cache_key and self.cache is not None:
+            self.cache.set(cache_key[0], response.content, cache_key[1])
         return response_text
 
+    def _post(self, url: str, data: bytes) -> Response:
+        """sends a single request through the next proxy, within the rate limits"""
+        proxy = self._select_proxy()
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(self._identity, proxy)
+        success = None
+        latency = None
+        started = time.monotonic()
+        try:
+            response = self._session.post(
+                url, data=data, headers=self.headers, proxies=self._get_proxies(proxy), cookies=self.cookies
+            )
+            latency = time.monotonic() - started
+            success = not is_overloaded(response.status_code)
+            return response
+        except (requests.ConnectionError, requests.Timeout):
+            success = False
+            raise
+        finally:
+            self._report_proxy(proxy, success, latency)
+
+    def decode_and_parse(self, response: bytes) -> JsonDict:
+        decoded: JsonDict = json_loads(response)
+        return decoded
+
+    async def _send_request_async(
+        self, endpoint: str, body: JsonDict, additionalParams: str = "", proxy: str | None = None
+    ) -> JsonDict:
+        cache_key = self._get_cache_key(endpoint, body, additionalParams)
+        if (
+            cache_key
+            and self.cache is not None
+            and (cached := await self.cache.aget(cache_key[0])) is not None
+        ):
+            cached_response: JsonDict = json_loads(cached)
+            return cached_response
+
+        await self._prepare_headers_async()
+        if proxy is None and self.proxy_pool is None:
+            proxy = self._proxy
+        if endpoint in IDEMPOTENT_ENDPOINTS:
+            # concurrent identical requests share a single one, each caller decodes its own copy
+            key = cache_key[0] if cache_key else self._get_request_key(endpoint, body, additionalParams)
+            key += proxy or ""
+            if key not in self._in_flight:
+                request = asyncio.ensure_future(self._fetch_async(endpoint, body, additionalParams, proxy))
+                self._in_flight[key] = request
+                request.add_done_callback(partial(self._request_done, key))
+            # a cancelled caller must not cancel the request for the others
+            resp = await asyncio.shield(self._in_flight[key])
+        else:
+            resp = await self._fetch_async(endpoint, body, additionalParams, proxy)
+
+        response_text: JsonDict = json_loads(resp)
+        if cache_key and self.cache is not None:
+            await self.cache.aset(cache_key[0], resp, cache_key[1])
+        return response_text
 
+    def _request_done(self, key: str, request: asyncio.Future[bytes]) -> None:
+        if self._in_flight.get(key) is request:
+            del self._in_flight[key]
+        if not request.cancelled():
+            request.exception()  # retrieved here in case all callers were cancelled
+
+    async def _fetch_async(
+        self, endpoint: str, body: JsonDict, additionalParams: str, proxy: str | None
+    ) -> bytes:
+        retry = self.retry if endpoint in IDEMPOTENT_ENDPOINTS else None
+        url = YTM_BASE_API + endpoint + self.params + additionalParams
+        data = self._encode_body(body)
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                if self.hedging is not None and retry is not None:
+                    response, content = await self._post_hedged(url, data, proxy)
+                else:
+                    response, content = await self._post_async(url, data, proxy)
+            except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError):
+                delay = retry.get_delay(attempt, started) if retry else None
+                if delay is None:
+                    raise
+            else:
+                if response.status < 400:
+                    return content
+                delay = None
+                if retry and response.status in retry.statuses:
+                    delay = retry.get_delay(attempt, started, response.headers.get("Retry-After"))
+                if delay is None:
+                    raise get_server_error(endpoint, response.status, response.reason, content, attempt)
+            await asyncio.sleep(delay)
+
+    async def _post_hedged(
+        self, url: str, data: bytes, proxy: str | None
+    ) -> tuple[aiohttp.ClientResponse, bytes]:
+        """sends a request and a duplicate if it is not answered in time, see :py:class:`HedgingPolicy`"""
+        hedging = self.hedging
+        assert hedging is not None
+        started = time.monotonic()
+        # without an explicit proxy, the duplicate is sent through another proxy of the pool
+        first_proxy = proxy or self._select_proxy()
+        first = asyncio.ensure_future(self._post_async(url, data, first_proxy))
+        pending: set[asyncio.Future[tuple[aiohttp.ClientResponse, bytes]]] = {first}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=hedging.delay)
+            if not done:
+                hedging.hedged += 1
+                duplicate_proxy = proxy or self._select_proxy(exclude=first_proxy)
+                pending.add(asyncio.ensure_future(self._post_async(url, data, duplicate_proxy)))
+            while True:
+                if not done:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # prefer a successful request if both finished at once
+                for request in sorted(done, key=lambda request: request.exception() is not None):
+                    if request is first:
+                        hedging.record(time.monotonic() - started)
+                    if request.exception() is None or not pending:
+                        if request is not first:
+                            hedging.won += 1
+                        return request.result()
+                done = set()
+        finally:
+            if first in pending:
+                hedging.record(time.monotonic() - started)
+            for request in pending:
+                request.cancel()
+
+    async def _post_async(
+        self, url: str, data: bytes, proxy: str | None
+    ) -> tuple[aiohttp.ClientResponse, bytes]:
+        """
+        sends a single request through the given or the next proxy,
+        within the rate limits and the limit of the concurrency limiter
+        """
+        if proxy is None:
+            proxy = self._select_proxy()
+        limiter = self.concurrency_limiter
+        try:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(self._identity, proxy)
+            if limiter is not None:
+                await limiter.acquire()
+        except asyncio.CancelledError:
+            self._report_proxy(proxy, None)
+            raise
+        success: bool | None = False
+        latency = None
+        started = time.monotonic()
+        try:
+            session = self._prepare_async_session()
+            async with session.post(
+                url, proxy=proxy, data=data, headers=self.headers, cookies=self.cookies
+            ) as response:
+                content = await response.read()
+            latency = time.monotonic() - started
+            success = not is_overloaded(response.status)
+            return response, content
+        except asyncio.CancelledError:
+            success = None
+            raise
+        finally:
+            self._report_proxy(proxy, success, latency)
+            if limiter is not None:
+                limiter.release(latency, success is False)
 
     def _send_get_request(
-        self, url: str, params: JsonDict | None = None, use_base_headers: bool = False
+        self, url: str, params: JsonDict | None = None, use_base_headers: bool = False, stream: bool = False
     ) -> Response:
-        response = self._session.get(
-            url,
-            params=params,
-            headers=initialize_headers() if use_base_headers else self.headers,
-            proxies=self.proxies,
-            cookies=self.cookies,
-        )
+        proxy = self._select_proxy()
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(self._identity, proxy)
+        success = None
+        try:
+            response = self._session.get(
+                url,
+                params=params,
+                headers=initialize_headers() if use_base_headers else self.headers,
+                proxies=self._get_proxies(proxy),
+                cookies=self.cookies,
+                stream=stream,
+            )
+            success = not is_overloaded(response.status_code)
+        except (requests.ConnectionError, requests.Timeout):
+            success = False
+            raise
+        finally:
+            self._report_proxy(proxy, success)
         return response
 
+    async def _scan_get_request_async(
+        self, url: str, pattern: re.Pattern[bytes], use_base_headers: bool = False
+    ) -> re.Match[bytes] | None:
+        """
+        Sends a get request from the event loop and scans the response for a pattern,
+        see :py:func:`ytmusicapi.helpers.scan_chunks`. The rest of the response is not downloaded.
+        """
+        if not use_base_headers:
+            await self._prepare_headers_async()
+        proxy = self._select_proxy()
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(self._identity, proxy)
+        success = None
+        try:
+            async with self._prepare_async_session().get(
+                url,
+                proxy=proxy,
+                headers=initialize_headers() if use_base_headers else self.headers,
+                cookies=self.cookies,
+            ) as response:
+                success = not is_overloaded(response.status)
+                match = await ascan_chunks(response.content.iter_chunked(SCAN_CHUNK_SIZE), pattern)
+                if match is not None:
+                    response.close()  # drops the connection instead of downloading the rest
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            success = False
+            raise
+        finally:
+            self._report_proxy(proxy, success)
+        return match
+
     def _check_auth(self) -> None:
         """
         Checks if the user has provided authorization credentials
@@ -285,6 +878,28 @@ class YTMusicBase:
         if self.auth_type == AuthType.UNAUTHORIZED:
             raise YTMusicUserError("Please provide authentication before using this function")
 
+    def close(self) -> None:
+        """
+        Close the requests session, unless it was provided by the user.
+        The asynchronous sessions are closed by :py:func:`aclose` or ``async with``.
+        """
+        if self._owns_session:
+            self._session.close()
+
+    async def aclose(self) -> None:
+        """Close the sessions of this instance, unless they were provided by the user"""
+        if self.auth_type == AuthType.OAUTH_CUSTOM_CLIENT:
+            self._token.stop_renewal()
+        with self._async_sessions_lock:
+            sessions, self._async_sessions = self._async_sessions, {}
+        for loop, session in sessions.items():
+            if loop.is_running() and loop is not asyncio.get_running_loop():
+                # still used by another thread, which closes its connections
+                await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(session.close(), loop))
+            else:
+                await session.close()
+        self.close()
+
     def __enter__(self) -> YTMusicBase:
         return self
 
@@ -294,7 +909,20 @@ class YTMusicBase:
         exc_value: BaseException | None,
         traceback: Any | None,
     ) -> bool | None:
-        pass
+        self.close()
+        return None
+
+    async def __aenter__(self) -> YTMusicBase:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: Any | None,
+    ) -> bool | None:
+        await self.aclose()
+        return None
 
 
 class YTMusic(